@@ -19,11 +19,17 @@ logger = logging.getLogger(__name__)
 
 try:
     import pystemd.systemd1  # noqa: F401  # pyright: ignore[reportMissingImports]
+    from pystemd.dbusexc import (  # pyright: ignore[reportMissingImports]
+        DBusBaseError as DBusError,
+    )
 
     PYSTEMD_AVAILABLE = True
 except ImportError:
     PYSTEMD_AVAILABLE = False
 
+    class DBusError(Exception):  # type: ignore[no-redef]
+        """Stand-in for pystemd's D-Bus error base when pystemd is absent."""
+
 
 class UnitInfo(NamedTuple):
     """Decoded unit information from ListUnitsByPatterns."""
@@ -83,13 +89,13 @@ def available() -> bool:
 # ---------------------------------------------------------------------------
 
 
-def list_units_by_pattern(pattern: str) -> list[UnitInfo]:
-    """List units matching a glob pattern via ListUnitsByPatterns (systemd 230+).
+def list_units_by_pattern(*patterns: str) -> list[UnitInfo]:
+    """List units matching any of the glob patterns via ListUnitsByPatterns (systemd 230+).
 
     Returns a list of :class:`UnitInfo` tuples with decoded string fields.
     """
     with _manager() as m:
-        raw = m.Manager.ListUnitsByPatterns([], [pattern.encode()])
+        raw = m.Manager.ListUnitsByPatterns([], [p.encode() for p in patterns])
     return [
         UnitInfo(
             name=_decode(u[0]),
@@ -128,6 +134,13 @@ def restart_unit(name: str) -> None:
         m.Manager.RestartUnit(fq.encode(), b"replace")
 
 
+def reload_unit(name: str) -> None:
+    """Reload a unit's configuration (``systemctl reload``)."""
+    fq = _normalize(name)
+    with _manager() as m:
+        m.Manager.ReloadUnit(fq.encode(), b"replace")
+
+
 def enable_unit_files(names: list[str]) -> None:
     """Enable unit files (``systemctl enable``)."""
     with _manager() as m:
@@ -164,6 +177,25 @@ def get_load_state(name: str) -> str:
         return _decode(u.Unit.LoadState)
 
 
+def get_unit_properties(name: str, properties: list[str]) -> dict[str, str]:
+    """Return the requested Unit/Service properties as strings.
+
+    Properties are looked up on the ``Unit`` interface first, then on
+    ``Service`` (e.g. ``MainPID``).  Missing properties map to ``""``.
+    """
+    values: dict[str, str] = {}
+    with _unit(name) as u:
+        for prop in properties:
+            raw = getattr(u.Unit, prop, None)
+            if raw is None and hasattr(u, "Service"):
+                raw = getattr(u.Service, prop, None)
+            if raw is None:
+                values[prop] = ""
+            else:
+                values[prop] = _decode(raw) if isinstance(raw, bytes) else str(raw)
+    return values
+
+
 def unit_file_exists(name: str) -> bool:
     """Check whether a unit file exists by querying LoadState != 'not-found'.
 
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 
 from ots_shared.ssh import is_remote as _is_remote
 
-from .config import Config
+from .config import ALIAS_NAMES, Config
 from .podman import Podman
 from .systemd import require_podman
 
@@ -19,6 +19,16 @@ logger = logging.getLogger(__name__)
 
 TEMP_CONTAINER_NAME = "ots-asset-sync-tmp"
 
+# Marker written under cfg.var_dir after a successful sync.  Holds the image
+# ID the assets were extracted from, so a re-sync from the same image can be
+# skipped.  It lives outside the volume: static_assets is served by Caddy and
+# overwritten wholesale by ``podman cp``.  Because it can outlive the volume,
+# a match only counts when the volume still holds the copied manifest.
+SYNC_MARKER_NAME = "assets-image-id"
+
+# Written by the frontend build; its presence shows the volume holds a copy.
+MANIFEST_RELPATH = "web/dist/.vite/manifest.json"
+
 
 def _get_error_stderr(e: Exception) -> str:
     """Extract stderr from either CalledProcessError (local) or CommandError (remote)."""
@@ -32,13 +42,70 @@ def _get_error_stderr(e: Exception) -> str:
     return stderr or str(e)
 
 
-def update(cfg: Config, create_volume: bool = True, *, executor: Executor | None = None) -> None:
+def _read_marker(marker: Path, executor: Executor | None) -> str:
+    """Return the image ID recorded by the last sync, or "" if none."""
+    if _is_remote(executor):
+        result = executor.run(["cat", str(marker)], timeout=10)  # type: ignore[union-attr]
+        return result.stdout.strip() if result.ok else ""
+    try:
+        return marker.read_text().strip()
+    except OSError:
+        return ""
+
+
+def _write_marker(marker: Path, image_id: str, executor: Executor | None) -> None:
+    """Record *image_id* as the source of the synced assets. Best-effort."""
+    if _is_remote(executor):
+        executor.run(["tee", str(marker)], input=f"{image_id}\n", timeout=10)  # type: ignore[union-attr]
+        return
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text(f"{image_id}\n")
+    except OSError as e:
+        logger.debug(f"Could not write asset sync marker {marker}: {e}")
+
+
+def clear_sync_marker(cfg: Config, *, executor: Executor | None = None) -> None:
+    """Forget the last sync, e.g. after the static_assets volume is removed."""
+    marker = cfg.var_dir / SYNC_MARKER_NAME
+    if _is_remote(executor):
+        executor.run(["rm", "-f", str(marker)], timeout=10)  # type: ignore[union-attr]
+        return
+    try:
+        marker.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not remove asset sync marker {marker}: {e}")
+
+
+def _file_exists(path: Path, executor: Executor | None) -> bool:
+    """Check for a regular file locally or on the remote host."""
+    if _is_remote(executor):
+        return executor.run(["test", "-f", str(path)]).ok  # type: ignore[union-attr]
+    return path.exists()
+
+
+def update(
+    cfg: Config,
+    create_volume: bool = True,
+    *,
+    force: bool = False,
+    executor: Executor | None = None,
+) -> None:
+    """Copy ``/app/public`` from the configured image into the assets volume.
+
+    The copy is skipped when the volume was last synced from the same image
+    ID (see ``SYNC_MARKER_NAME``) and still holds the copied manifest, unless
+    *force* is set or the volume was only just created.
+    """
     require_podman(executor=executor)
 
     p = Podman(executor=executor)
 
+    volume_created = False
     if create_volume:
-        p.volume.create("static_assets", capture_output=True, check=False)
+        # Fails (non-zero) when the volume already exists.
+        created = p.volume.create("static_assets", capture_output=True, check=False)
+        volume_created = getattr(created, "returncode", None) == 0
 
     try:
         result = p.volume.mount("static_assets", capture_output=True, text=True, check=True)
@@ -50,12 +117,12 @@ def update(cfg: Config, create_volume: bool = True, *, executor: Executor | None
     # and only str() or executor.run() should operate on them.
     assets_dir = Path(result.stdout.strip())
 
-    # Verify the image exists locally before proceeding
+    # Verify the image exists locally (and get its ID) before proceeding
     image_ref = cfg.resolved_image_with_tag(executor=executor)
-    result = p.image.exists(image_ref, capture_output=True)
+    result = p.image.inspect(image_ref, format="{{.Id}}", capture_output=True, text=True)
     if result.returncode != 0:
         # Distinguish unresolved alias from missing image
-        if cfg.tag.lower() in ("current", "rollback"):
+        if cfg.tag.lower() in ALIAS_NAMES:
             raise SystemExit(
                 f"No '{cfg.tag}' image alias found. "
                 f"Run 'rots image set-current <tag>' after pulling an image."
@@ -63,6 +130,19 @@ def update(cfg: Config, create_volume: bool = True, *, executor: Executor | None
         raise SystemExit(
             f"Image '{image_ref}' not found locally. Pull it first with 'rots image pull'."
         )
+    image_id = (result.stdout or "").strip()
+
+    marker = cfg.var_dir / SYNC_MARKER_NAME
+    manifest = assets_dir / MANIFEST_RELPATH
+    if (
+        image_id
+        and not force
+        and not volume_created
+        and _read_marker(marker, executor) == image_id
+        and _file_exists(manifest, executor)
+    ):
+        logger.info(f"[skip] assets up to date ({image_ref})")
+        return
 
     # Remove any leftover temp container from a previous interrupted run
     p.rm(TEMP_CONTAINER_NAME, capture_output=True, check=False)
@@ -83,17 +163,12 @@ def update(cfg: Config, create_volume: bool = True, *, executor: Executor | None
 
     try:
         p.cp(f"{container_id}:/app/public/.", str(assets_dir), check=True)
-        manifest = assets_dir / "web/dist/.vite/manifest.json"
-        if _is_remote(executor):
-            check_result = executor.run(["test", "-f", str(manifest)])  # type: ignore[union-attr]
-            if check_result.ok:
-                logger.info(f"Manifest found: {manifest}")
-            else:
-                logger.warning(f"manifest not found at {manifest}")
+        if _file_exists(manifest, executor):
+            logger.info(f"Manifest found: {manifest}")
         else:
-            if manifest.exists():
-                logger.info(f"Manifest found: {manifest}")
-            else:
-                logger.warning(f"manifest not found at {manifest}")
+            logger.warning(f"manifest not found at {manifest}")
     finally:
         p.rm(container_id, check=True)
+
+    if image_id:
+        _write_marker(marker, image_id, executor)
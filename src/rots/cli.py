@@ -35,7 +35,6 @@ from .commands import (
     init,
     instance,
     proxy,
-    service,
     sidecar,
 )
 from .commands import db as db_cmd
@@ -56,7 +55,13 @@ app.command(image.app)
 app.command(assets_cmd.app)
 app.command(proxy.app)
 app.command(host.app)
-app.command(service.app)
+# Registered by import path so the service module only loads when selected.
+# The help text is duplicated here so `rots --help` does not resolve it.
+app.command(
+    "rots.commands.service.app:app",
+    name=["service", "services"],
+    help="Manage systemd template services (valkey, redis)",
+)
 app.command(dns.app)
 app.command(cloudinit.app)
 app.command(env.app)
@@ -11,4 +11,3 @@ from . import image as image
 from . import init as init
 from . import instance as instance
 from . import proxy as proxy
-from . import service as service
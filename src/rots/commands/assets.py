@@ -19,13 +19,18 @@ def sync(
         bool,
         cyclopts.Parameter(help="Create volume if it doesn't exist (use on first deploy)"),
     ] = False,
+    force: Annotated[
+        bool,
+        cyclopts.Parameter(help="Copy even if the volume was already synced from this image"),
+    ] = False,
 ):
     """Copy /app/public from container image to static_assets podman volume.
 
     Extracts web assets (JS, CSS, images) from the OTS container image
     to a shared volume that Caddy serves directly. Use --create-volume
-    on initial setup.
+    on initial setup. Skipped when the volume already holds assets from
+    the same image ID; use --force to copy anyway.
     """
     cfg = Config()
     ex = cfg.get_executor(host=context.host_var.get(None))
-    assets_module.update(cfg, create_volume=create_volume, executor=ex)
+    assets_module.update(cfg, create_volume=create_volume, force=force, executor=ex)
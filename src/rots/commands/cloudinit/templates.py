@@ -2,7 +2,13 @@
 
 """Cloud-init configuration templates with Debian 13 DEB822 apt sources."""
 
-import yaml
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import yaml
 
 DEFAULT_CADDY_VERSION = "v2.10.2"
 
@@ -98,15 +104,20 @@ class _LiteralStr(str):
     """Marker subclass so the YAML dumper renders as a literal block scalar (``|``)."""
 
 
-def _literal_representer(dumper: yaml.Dumper, data: "_LiteralStr") -> yaml.ScalarNode:
+def _literal_representer(dumper: yaml.Dumper, data: _LiteralStr) -> yaml.ScalarNode:
     return dumper.represent_scalar("tag:yaml.org,2002:str", data, style="|")
 
 
-class _OTSDumper(yaml.Dumper):
-    """yaml.Dumper subclass that writes _LiteralStr values as literal block scalars."""
+@cache
+def _ots_dumper() -> type[yaml.Dumper]:
+    """Build the YAML dumper on first use so importing this module skips PyYAML."""
+    import yaml
 
+    class _OTSDumper(yaml.Dumper):
+        """yaml.Dumper subclass that writes _LiteralStr values as literal block scalars."""
 
-_OTSDumper.add_representer(_LiteralStr, _literal_representer)
+    _OTSDumper.add_representer(_LiteralStr, _literal_representer)
+    return _OTSDumper
 
 
 def get_debian13_sources_list() -> str:
@@ -364,9 +375,11 @@ def generate_cloudinit_config(
     if ssh_authorized_keys:
         doc["ssh_authorized_keys"] = ssh_authorized_keys
 
+    import yaml
+
     yaml_body = yaml.dump(
         doc,
-        Dumper=_OTSDumper,
+        Dumper=_ots_dumper(),
         default_flow_style=False,
         allow_unicode=True,
         sort_keys=False,
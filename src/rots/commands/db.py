@@ -1,5 +1,5 @@
 # src/rots/commands/db.py
-"""Deployment database backup and restore commands."""
+"""Deployment database backup, restore, and maintenance commands."""
 
 import logging
 import sqlite3
@@ -468,3 +468,39 @@ def info(
         print("  If the database is lost, re-set aliases with:")
         print("    ots image set-current --tag <your-tag>")
         print("  This re-creates CURRENT and ROLLBACK from scratch.")
+
+
+@app.command
+def maintenance(
+    json_output: JsonOutput = False,
+):
+    """Checkpoint the write-ahead log and refresh query statistics.
+
+    Folds the database's -wal file back into the main file and truncates
+    it, then lets SQLite re-analyze tables whose statistics are stale.
+    Safe to run at any time, e.g. from a periodic timer.
+
+    Examples:
+        ots db maintenance
+        ots db maintenance --json
+    """
+    import json as json_mod
+
+    from rots import db as db_module
+
+    ex, db_path = _get_executor_and_db()
+
+    if not _db_exists(db_path, ex):
+        msg = f"Database not found: {db_path}"
+        if json_output:
+            print(json_mod.dumps({"success": False, "error": msg}))
+        else:
+            logger.error(f"{msg}")
+        raise SystemExit(1)
+
+    db_module.maintenance(db_path, executor=ex)
+
+    if json_output:
+        print(json_mod.dumps({"success": True, "db_path": str(db_path)}, indent=2))
+    else:
+        logger.info(f"Checkpointed and optimized: {db_path}")
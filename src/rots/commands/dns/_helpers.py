@@ -6,8 +6,6 @@ from __future__ import annotations
 
 import logging
 import os
-import urllib.error
-import urllib.request
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +74,11 @@ def get_public_ip() -> str | None:
     Uses api.ipify.org which returns the IP as plain text.
     Returns None if detection fails.
     """
+    # Deferred: urllib.request pulls in http.client and ssl, which only
+    # this lookup needs.
+    import urllib.error
+    import urllib.request
+
     try:
         with urllib.request.urlopen("https://api.ipify.org", timeout=5) as resp:
             ip = resp.read().decode("ascii").strip()
@@ -24,7 +24,7 @@ from typing import Annotated
 import cyclopts
 
 from rots import context, db
-from rots.config import Config, join_image_tag, parse_image_reference
+from rots.config import ALIAS_NAMES, Config, join_image_tag, parse_image_reference
 from rots.podman import Podman
 
 from ..common import JsonOutput, Lines, Quiet, Yes
@@ -115,7 +115,7 @@ def pull(
     # None of these are valid OCI registry tags to pull — they are resolved locally
     # by the DB alias system.  An explicit concrete tag (e.g. 'v0.23.0') is required.
     tag_key = resolved_tag.lstrip("@")
-    if tag_key.lower() in ("current", "rollback"):
+    if tag_key.lower() in ALIAS_NAMES:
         alias = db.get_alias(cfg.db_path, tag_key, executor=ex)
         if alias:
             logger.error(
@@ -651,15 +651,17 @@ def aliases(json_output: JsonOutput = False):
         print(f"    Set:   {alias.set_at}")
     print("-" * 60)
 
-    # Show what commands would resolve to
+    # Show what commands would resolve to.  Both aliases are already in
+    # aliases_list, so no further query (an SSH round trip when remote).
     print("\nResolution:")
-    current = db.get_current_image(cfg.db_path, executor=ex)
+    by_name = {a.alias: a for a in aliases_list}
+    current = by_name.get("CURRENT")
     if current:
-        print(f"  TAG=current  -> {join_image_tag(current[0], current[1])}")
+        print(f"  TAG=current  -> {join_image_tag(current.image, current.tag)}")
 
-    rollback_img = db.get_rollback_image(cfg.db_path, executor=ex)
+    rollback_img = by_name.get("ROLLBACK")
     if rollback_img:
-        print(f"  TAG=rollback -> {join_image_tag(rollback_img[0], rollback_img[1])}")
+        print(f"  TAG=rollback -> {join_image_tag(rollback_img.image, rollback_img.tag)}")
 
 
 # --- Private Registry Commands ---
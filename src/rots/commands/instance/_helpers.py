@@ -265,6 +265,29 @@ def format_journalctl_hint(instances: dict[InstanceType, list[str]]) -> str:
     return f"journalctl {tag_args} -f"
 
 
+def instance_units(
+    instances: dict[InstanceType, list[str]],
+) -> list[tuple[InstanceType, str, str]]:
+    """Flatten resolved instances into ``(type, identifier, unit)`` triples.
+
+    Builds each systemd unit name once per command so callers iterating
+    over instances (or handing the unit list to a single batched call)
+    don't re-format it on every pass.
+
+    Args:
+        instances: Dict mapping InstanceType to list of identifiers
+
+    Returns:
+        List of (instance_type, identifier, unit_name) tuples in
+        discovery order.
+    """
+    return [
+        (itype, id_, systemd.unit_name(itype.value, id_))
+        for itype, ids in instances.items()
+        for id_ in ids
+    ]
+
+
 def build_secret_args(env_file: Path, *, executor: Executor | None = None) -> list[str]:
     """Build podman --secret arguments from environment file.
 
@@ -336,43 +359,15 @@ def resolve_identifiers(
                     raise SystemExit(f"Invalid port for web instance: {id_!r} (must be numeric)")
         return {instance_type: list(identifiers)}
 
-    # No identifiers: discover based on type filter
-    result: dict[InstanceType, list[str]] = {}
-
-    # If type specified, only discover that type
-    if instance_type is not None:
-        if instance_type == InstanceType.WEB:
-            ports = systemd.discover_web_instances(running_only=running_only, executor=executor)
-            if ports:
-                result[InstanceType.WEB] = [str(p) for p in ports]
-        elif instance_type == InstanceType.WORKER:
-            workers = systemd.discover_worker_instances(
-                running_only=running_only, executor=executor
-            )
-            if workers:
-                result[InstanceType.WORKER] = workers
-        elif instance_type == InstanceType.SCHEDULER:
-            schedulers = systemd.discover_scheduler_instances(
-                running_only=running_only, executor=executor
-            )
-            if schedulers:
-                result[InstanceType.SCHEDULER] = schedulers
-        return result
-
-    # No type: discover ALL types
-    ports = systemd.discover_web_instances(running_only=running_only, executor=executor)
-    if ports:
-        result[InstanceType.WEB] = [str(p) for p in ports]
-
-    workers = systemd.discover_worker_instances(running_only=running_only, executor=executor)
-    if workers:
-        result[InstanceType.WORKER] = workers
-
-    schedulers = systemd.discover_scheduler_instances(running_only=running_only, executor=executor)
-    if schedulers:
-        result[InstanceType.SCHEDULER] = schedulers
-
-    return result
+    # No identifiers: discover based on type filter.  One unit listing
+    # covers all three types, so a type filter just selects from it.
+    found = systemd.discover_all_instances(running_only=running_only, executor=executor)
+    types = (InstanceType.WEB, InstanceType.WORKER, InstanceType.SCHEDULER)
+    return {
+        itype: found[itype]
+        for itype in types
+        if (instance_type is None or itype == instance_type) and found.get(itype)
+    }
 
 
 def for_each_instance(
@@ -395,19 +390,14 @@ def for_each_instance(
     Returns:
         Total number of instances processed.
     """
-    # Flatten to list of (type, id) tuples
-    items: list[tuple[InstanceType, str]] = []
-    for itype, ids in instances.items():
-        for id_ in ids:
-            items.append((itype, id_))
+    items = instance_units(instances)
 
     total = len(items)
     if total == 0:
         logger.info("No instances found to operate on.")
         return 0
 
-    for i, (itype, id_) in enumerate(items, 1):
-        unit = systemd.unit_name(itype.value, id_)
+    for i, (itype, id_, unit) in enumerate(items, 1):
         logger.info(f"[{i}/{total}] {verb} {unit}...")
         try:
             action(itype, id_)
@@ -34,6 +34,7 @@ from ._helpers import (
     for_each_instance,
     format_command,
     format_journalctl_hint,
+    instance_units,
     resolve_identifiers,
     run_hook,
 )
@@ -602,16 +603,17 @@ def deploy(
     with deploy_lock(executor=ex):
         # Write appropriate quadlet template.
         # Raises SystemExit(1) if env file or secrets are missing (unless force=True).
-        if itype == InstanceType.WEB:
-            assets.update(cfg, create_volume=True, executor=ex)
-            logger.info(f"Writing quadlet files to {cfg.web_template_path.parent}")
-            quadlet.write_web_template(cfg, force=force, executor=ex)
-        elif itype == InstanceType.WORKER:
-            logger.info(f"Writing quadlet files to {cfg.worker_template_path.parent}")
-            quadlet.write_worker_template(cfg, force=force, executor=ex)
-        elif itype == InstanceType.SCHEDULER:
-            logger.info(f"Writing quadlet files to {cfg.scheduler_template_path.parent}")
-            quadlet.write_scheduler_template(cfg, force=force, executor=ex)
+        with systemd.deferred_reload():
+            if itype == InstanceType.WEB:
+                assets.update(cfg, create_volume=True, executor=ex)
+                logger.info(f"Writing quadlet files to {cfg.web_template_path.parent}")
+                quadlet.write_web_template(cfg, force=force, executor=ex)
+            elif itype == InstanceType.WORKER:
+                logger.info(f"Writing quadlet files to {cfg.worker_template_path.parent}")
+                quadlet.write_worker_template(cfg, force=force, executor=ex)
+            elif itype == InstanceType.SCHEDULER:
+                logger.info(f"Writing quadlet files to {cfg.scheduler_template_path.parent}")
+                quadlet.write_scheduler_template(cfg, force=force, executor=ex)
 
         def do_deploy(inst_type: InstanceType, id_: str) -> None:
             unit = systemd.unit_name(inst_type.value, id_)
@@ -956,14 +958,14 @@ def redeploy(
         # Redeploy always enforces secrets check (no --force override for secrets here).
         if InstanceType.WEB in instances:
             assets.update(cfg, create_volume=force, executor=ex)
-            logger.info(f"Writing quadlet files to {cfg.web_template_path.parent}")
-            quadlet.write_web_template(cfg, executor=ex)
-        if InstanceType.WORKER in instances:
-            logger.info(f"Writing quadlet files to {cfg.worker_template_path.parent}")
-            quadlet.write_worker_template(cfg, executor=ex)
-        if InstanceType.SCHEDULER in instances:
-            logger.info(f"Writing quadlet files to {cfg.scheduler_template_path.parent}")
-            quadlet.write_scheduler_template(cfg, executor=ex)
+        template_paths = {
+            InstanceType.WEB: cfg.web_template_path,
+            InstanceType.WORKER: cfg.worker_template_path,
+            InstanceType.SCHEDULER: cfg.scheduler_template_path,
+        }
+        template_dirs = sorted({str(template_paths[t].parent) for t in instances})
+        logger.info(f"Writing quadlet files to {', '.join(template_dirs)}")
+        quadlet.write_all_templates(cfg, unit_types=[t.value for t in instances], executor=ex)
 
         def do_redeploy(inst_type: InstanceType, id_: str) -> None:
             unit = systemd.unit_name(inst_type.value, id_)
@@ -1289,11 +1291,9 @@ def start(
         logger.info("Deploy one first: ots instances deploy --help")
         return
 
-    for inst_type, ids in instances.items():
-        for id_ in ids:
-            unit = systemd.unit_name(inst_type.value, id_)
-            systemd.start(unit, executor=ex)
-            logger.info(f"Started {unit}")
+    for _, _, unit in instance_units(instances):
+        systemd.start(unit, executor=ex)
+        logger.info(f"Started {unit}")
 
     hint = format_journalctl_hint(instances)
     if hint:
@@ -1328,11 +1328,9 @@ def stop(
         logger.info("List all configured instances with: ots instances list")
         return
 
-    for inst_type, ids in instances.items():
-        for id_ in ids:
-            unit = systemd.unit_name(inst_type.value, id_)
-            systemd.stop(unit, executor=ex)
-            logger.info(f"Stopped {unit}")
+    for _, _, unit in instance_units(instances):
+        systemd.stop(unit, executor=ex)
+        logger.info(f"Stopped {unit}")
 
 
 @app.command
@@ -1400,14 +1398,12 @@ def enable(
         logger.info("Deploy one first: ots instances deploy --help")
         return
 
-    for inst_type, ids in instances.items():
-        for id_ in ids:
-            unit = systemd.unit_name(inst_type.value, id_)
-            try:
-                systemd.enable(unit, executor=ex)
-                logger.info(f"Enabled {unit}")
-            except systemd.SystemctlError as e:
-                logger.error(f"Failed to enable {unit}: {e.journal}")
+    for _, _, unit in instance_units(instances):
+        try:
+            systemd.enable(unit, executor=ex)
+            logger.info(f"Enabled {unit}")
+        except systemd.SystemctlError as e:
+            logger.error(f"Failed to enable {unit}: {e.journal}")
 
 
 @app.command
@@ -1448,14 +1444,17 @@ def disable(
             print("Aborted")
             return
 
-    for inst_type, ids in instances.items():
-        for id_ in ids:
-            unit = systemd.unit_name(inst_type.value, id_)
-            try:
-                systemd.disable(unit, executor=ex)
-                logger.info(f"Disabled {unit}")
-            except systemd.SystemctlError as e:
-                logger.error(f"Failed to disable {unit}: {e.journal}")
+    for _, _, unit in instance_units(instances):
+        try:
+            systemd.disable(unit, executor=ex)
+            logger.info(f"Disabled {unit}")
+        except systemd.SystemctlError as e:
+            logger.error(f"Failed to disable {unit}: {e.journal}")
+
+
+#: systemd properties reported by ``status --json``.  Limited to properties
+#: that D-Bus and ``systemctl show`` format identically.
+_STATUS_PROPERTIES = ["ActiveState", "SubState", "LoadState", "MainPID"]
 
 
 @app.command
@@ -1490,28 +1489,35 @@ def status(
             logger.info("Deploy one first: ots instances deploy --help")
         return
 
+    units = instance_units(instances)
+
     if json_output:
+        # One ``systemctl show`` for every unit instead of N heavyweight
+        # ``systemctl status`` / ``is-active`` spawns.
+        props = systemd.show_properties(
+            [unit for _, _, unit in units], _STATUS_PROPERTIES, executor=ex
+        )
         results = []
-        for inst_type, ids in instances.items():
-            for id_ in ids:
-                unit = systemd.unit_name(inst_type.value, id_)
-                active_state = systemd.is_active(unit, executor=ex)
-                results.append(
-                    {
-                        "unit": unit,
-                        "instance_type": inst_type.value,
-                        "identifier": id_,
-                        "active_state": active_state,
-                        "active": active_state == "active",
-                    }
-                )
+        for inst_type, id_, unit in units:
+            unit_props = props.get(unit, {})
+            active_state = unit_props.get("ActiveState", "")
+            results.append(
+                {
+                    "unit": unit,
+                    "instance_type": inst_type.value,
+                    "identifier": id_,
+                    "active_state": active_state,
+                    "active": active_state == "active",
+                    "sub_state": unit_props.get("SubState", ""),
+                    "load_state": unit_props.get("LoadState", ""),
+                    "main_pid": unit_props.get("MainPID", ""),
+                }
+            )
         print(json_mod.dumps({"instances": results}, indent=2))
     else:
-        for inst_type, ids in instances.items():
-            for id_ in ids:
-                unit = systemd.unit_name(inst_type.value, id_)
-                systemd.status(unit, executor=ex)
-                print()
+        for _, _, unit in units:
+            systemd.status(unit, executor=ex)
+            print()
 
 
 @app.command
@@ -1541,16 +1547,10 @@ def logs(
         logger.info("No instances found")
         return
 
-    # Build list of units
-    units = []
-    for inst_type, ids in instances.items():
-        for id_ in ids:
-            units.append(systemd.unit_name(inst_type.value, id_))
-
     cmd = ["journalctl", "--no-pager", f"-n{lines}"]
     if follow:
         cmd.append("-f")
-    for unit in units:
+    for _, _, unit in instance_units(instances):
         cmd.extend(["-u", unit])
 
     # Route through executor for remote support.
@@ -1576,7 +1576,7 @@ def show_env():
     """Show infrastructure environment variables.
 
     Displays the contents of /etc/default/onetimesecret (shared by all instances).
-    Only shows valid KEY=VALUE pairs, sorted alphabetically.
+    Only shows valid KEY=VALUE pairs, sorted case-insensitively.
 
     When ``--host`` is set, reads the file from the remote host via the executor.
 
@@ -1627,9 +1627,10 @@ def show_env():
             if key and (key[0].isalpha() or key.startswith("_")):
                 if all(c.isalnum() or c == "_" for c in key):
                     env_vars[key] = value
-    for key in sorted(env_vars.keys()):
-        print(f"{key}={env_vars[key]}")
-    print()
+    # Case-insensitive order (so ``a_bar`` sits next to ``A_BAR``), emitted
+    # with a single write rather than one print() per variable.
+    body = "".join(f"{key}={env_vars[key]}\n" for key in sorted(env_vars, key=str.casefold))
+    sys.stdout.write(body + "\n")
 
 
 @app.command(name="exec")
@@ -1667,15 +1668,15 @@ def exec_shell(
 
     shell = command or os.environ.get("SHELL", "/bin/sh")
 
-    for inst_type, ids in instances.items():
-        for id_ in ids:
-            # Use Quadlet container naming convention
-            unit = systemd.unit_name(inst_type.value, id_)
-            container = systemd.unit_to_container_name(unit)
-            logger.info(f"=== Entering {unit} ===")
-            flush_output()
-            ex.run_interactive(["podman", "exec", "-it", container, shell])
-            print()
+    # Use Quadlet container naming convention
+    targets = [
+        (unit, systemd.unit_to_container_name(unit)) for _, _, unit in instance_units(instances)
+    ]
+    for unit, container in targets:
+        logger.info(f"=== Entering {unit} ===")
+        flush_output()
+        ex.run_interactive(["podman", "exec", "-it", container, shell])
+        print()
 
 
 @app.command
@@ -2126,6 +2127,9 @@ def cleanup(
 
     try:
         result = p.volume.rm(volume_name)
+        if result.returncode == 0 or "no such volume" in result.stderr.lower():
+            # The sync marker would otherwise claim a recreated volume is current.
+            assets.clear_sync_marker(cfg, executor=ex)
         if result.returncode == 0:
             outcome = {"success": True, "volume": volume_name, "removed": True}
             if json_output:
@@ -2412,11 +2416,7 @@ def rollback(
         # Write quadlet templates for each instance type being redeployed
         if InstanceType.WEB in instances:
             assets.update(cfg, create_volume=False, executor=ex)
-            quadlet.write_web_template(cfg, executor=ex)
-        if InstanceType.WORKER in instances:
-            quadlet.write_worker_template(cfg, executor=ex)
-        if InstanceType.SCHEDULER in instances:
-            quadlet.write_scheduler_template(cfg, executor=ex)
+        quadlet.write_all_templates(cfg, unit_types=[t.value for t in instances], executor=ex)
 
         def do_rollback_redeploy(inst_type: InstanceType, id_: str) -> None:
             unit = systemd.unit_name(inst_type.value, id_)
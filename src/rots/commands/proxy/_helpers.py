@@ -340,7 +340,7 @@ def adapt_to_json(config_path: Path, *, executor: Executor | None = None) -> str
 
 
 def reload_caddy(*, executor: Executor | None = None) -> None:
-    """Reload Caddy service via systemctl.
+    """Reload Caddy service via D-Bus when available, else systemctl.
 
     Args:
         executor: Executor for command dispatch.
@@ -356,6 +356,17 @@ def reload_caddy(*, executor: Executor | None = None) -> None:
         except CommandError as e:
             raise ProxyError(f"Failed to reload caddy: {e}") from e
     else:
+        from rots import systemd
+
+        # Talk to PID 1 directly when we already have the privilege;
+        # avoids the sudo + systemctl fork/exec chain entirely.  Any D-Bus
+        # failure falls back to sudo systemctl, which has its own auth path.
+        if systemd.uses_dbus():
+            try:
+                systemd.reload("caddy", executor=None)
+                return
+            except systemd.SystemctlError as e:
+                logger.debug("D-Bus reload of caddy failed, falling back to systemctl: %s", e)
         try:
             subprocess.run(
                 ["sudo", "systemctl", "reload", "caddy"],
@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -41,6 +43,25 @@ def _file_exists(path: Path, executor: Executor | None) -> bool:
     return path.exists()
 
 
+def _files_exist(paths: list[Path], executor: Executor | None) -> list[bool]:
+    """Check several files at once (local or remote), preserving order.
+
+    Remotely this is one round trip instead of one ``test -f`` per path.
+    """
+    if not paths:
+        return []
+    if _is_remote(executor):
+        script = 'for f do if [ -f "$f" ]; then echo 1; else echo 0; fi; done'
+        result = executor.run(  # type: ignore[union-attr]
+            ["sh", "-c", script, "sh", *(str(p) for p in paths)], timeout=10
+        )
+        flags = result.stdout.split()
+        if len(flags) != len(paths):
+            return [False] * len(paths)
+        return [flag == "1" for flag in flags]
+    return [path.exists() for path in paths]
+
+
 def _dir_exists(path: Path, executor: Executor | None) -> bool:
     """Check if a directory exists (local or remote)."""
     if _is_remote(executor):
@@ -49,6 +70,19 @@ def _dir_exists(path: Path, executor: Executor | None) -> bool:
     return path.is_dir()
 
 
+def _list_dir(path: Path, executor: Executor | None) -> list[str]:
+    """List entry names in a directory (local or remote). Missing -> []."""
+    if _is_remote(executor):
+        result = executor.run(["ls", str(path)], timeout=10)  # type: ignore[union-attr]
+        return result.stdout.strip().splitlines() if result.ok else []
+    # scandir yields names without building a Path per entry
+    try:
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries]
+    except FileNotFoundError:
+        return []
+
+
 def _read_text(path: Path, executor: Executor | None) -> str:
     """Read text content from a file (local or remote)."""
     if _is_remote(executor):
@@ -191,50 +225,75 @@ def copy_default_config(
     return dest
 
 
-def update_config_value(
+def update_config_values(
     config_path: Path,
-    key: str,
-    value: str,
+    updates: dict[str, str],
     pkg: ServicePackage,
     *,
     executor: Executor | None = None,
 ) -> None:
-    """Update or add a config value in a service config file.
+    """Update or add several config values with one read, scan and write.
+
+    The first non-comment line setting each key is rewritten in place;
+    keys not present in the file are appended in *updates* order.
 
     Args:
         config_path: Path to config file
-        key: Config key to set
-        value: Value to set
+        updates: Mapping of config key -> value to set
         pkg: Service package (for format info)
         executor: Executor for command dispatch. None uses local filesystem.
     """
+    if not updates:
+        return
+
     content = _read_text(config_path, executor)
     lines = content.splitlines()
 
     # Determine separator based on config format
     sep = " " if pkg.config_format == "space" else "="
-    new_line = f"{key}{sep}{value}"
+    remaining = dict(updates)
 
-    # Find and replace existing key, or add to end
-    found = False
     for i, line in enumerate(lines):
         stripped = line.strip()
         # Skip comments and empty lines
         if not stripped or stripped.startswith(pkg.comment_prefix):
             continue
-        # Check if this line sets our key
+        # Check if this line sets one of our keys
         parts = stripped.replace("=", " ").split()
-        if parts and parts[0] == key:
-            lines[i] = new_line
-            found = True
-            break
+        if parts and parts[0] in remaining:
+            key = parts[0]
+            lines[i] = f"{key}{sep}{remaining.pop(key)}"
+            if not remaining:
+                break
 
-    if not found:
-        lines.append(new_line)
+    lines.extend(f"{key}{sep}{value}" for key, value in remaining.items())
 
     _write_text(config_path, "\n".join(lines) + "\n", executor)
 
 
+def update_config_value(
+    config_path: Path,
+    key: str,
+    value: str,
+    pkg: ServicePackage,
+    *,
+    executor: Executor | None = None,
+) -> None:
+    """Update or add a single config value in a service config file.
+
+    Deprecated: prefer :func:`update_config_values`, which rewrites the
+    file once for any number of keys.
+
+    Args:
+        config_path: Path to config file
+        key: Config key to set
+        value: Value to set
+        pkg: Service package (for format info)
+        executor: Executor for command dispatch. None uses local filesystem.
+    """
+    update_config_values(config_path, {key: value}, pkg, executor=executor)
+
+
 def create_secrets_file(
     pkg: ServicePackage,
     instance: str,
@@ -350,8 +409,6 @@ def systemctl_json(
     Returns:
         Parsed JSON output, or None if command failed
     """
-    import json
-
     from ots_shared.ssh.executor import CommandError
 
     ex = _get_executor(executor)
@@ -368,12 +425,93 @@ def systemctl_json(
         return None
 
 
-def systemctl(
+def _dbus_unit_action(args: tuple[str, ...], executor: Executor | None) -> bool:
+    """Try a single-unit lifecycle action over D-Bus.
+
+    Only ``start``/``stop``/``restart``/``reload`` of one unit are handled,
+    and only when the local D-Bus backend is usable (see
+    ``rots.systemd.uses_dbus``).  A D-Bus error (permissions, unknown
+    unit, ...) is logged and returns False so the caller falls back to the
+    CLI, which then reports the error in its usual form.  Other exceptions
+    propagate.
+
+    Returns:
+        True if the action was performed via D-Bus.
+    """
+    if len(args) != 2 or args[0] not in ("start", "stop", "restart", "reload"):
+        return False
+    from rots import systemd
+
+    if not systemd.uses_dbus(executor):
+        return False
+    from rots import _dbus
+
+    action = {
+        "start": _dbus.start_unit,
+        "stop": _dbus.stop_unit,
+        "restart": _dbus.restart_unit,
+        "reload": _dbus.reload_unit,
+    }[args[0]]
+    try:
+        action(args[1])
+    except _dbus.DBusError as exc:
+        logger.warning("D-Bus %s %s failed (%s), falling back to systemctl", *args, exc)
+        logger.debug("D-Bus failure details", exc_info=True)
+        return False
+    return True
+
+
+def systemctl_run(
+    *args: str,
+    check: bool = True,
+    executor: Executor | None = None,
+) -> Result:
+    """Run a fire-and-forget systemctl command (start, stop, enable, ...).
+
+    Output is not captured: stdout/stderr flow straight to the caller's
+    terminal, which avoids allocating two pipes per invocation.  The
+    returned Result therefore carries only the exit code.  Single-unit
+    start/stop/restart/reload go over D-Bus when available locally.
+
+    Args:
+        *args: Arguments to pass to systemctl
+        check: Whether to raise on non-zero exit
+        executor: Executor for command dispatch. None uses LocalExecutor.
+
+    Returns:
+        Result with the exit code and empty stdout/stderr.
+
+    Raises:
+        CommandError: If check is True and systemctl exits non-zero.
+    """
+    import shlex
+
+    from ots_shared.ssh.executor import Result
+
+    cmd = ["systemctl", *args]
+    if _dbus_unit_action(args, executor):
+        return Result(
+            command=" ".join(shlex.quote(c) for c in cmd), returncode=0, stdout="", stderr=""
+        )
+    ex = _get_executor(executor)
+    returncode = ex.run_stream(cmd, timeout=30)
+    result = Result(
+        command=" ".join(shlex.quote(c) for c in cmd),
+        returncode=returncode,
+        stdout="",
+        stderr="",
+    )
+    if check:
+        result.check()
+    return result
+
+
+def systemctl_capture(
     *args: str,
     check: bool = True,
     executor: Executor | None = None,
 ) -> Result:
-    """Run a systemctl command.
+    """Run a systemctl query and capture its output (is-active, show, ...).
 
     Args:
         *args: Arguments to pass to systemctl
@@ -392,15 +530,76 @@ def systemctl(
     )
 
 
+#: UnitFileState values for which ``systemctl is-enabled`` exits 0.
+ENABLED_UNIT_FILE_STATES = frozenset(
+    {
+        "enabled",
+        "enabled-runtime",
+        "static",
+        "alias",
+        "indirect",
+        "generated",
+        "transient",
+    }
+)
+
+
+def unit_states(
+    units: list[str],
+    *,
+    executor: Executor | None = None,
+) -> dict[str, tuple[bool, bool]]:
+    """Fetch active/enabled state for many units with one ``systemctl show``.
+
+    Replaces a pair of ``is-active``/``is-enabled`` spawns per unit.
+    ``show`` is used rather than ``list-unit-files`` because template
+    instances have no unit file of their own; ``show`` still reports the
+    instance's UnitFileState alongside its ActiveState in the same call.
+
+    Args:
+        units: Fully-qualified unit names (e.g. ``valkey-server@6379.service``).
+        executor: Executor for command dispatch. None uses LocalExecutor.
+
+    Returns:
+        Dict mapping unit name -> ``(active, enabled)``.  Units systemd
+        did not report on are omitted.
+    """
+    if not units:
+        return {}
+
+    result = systemctl_capture(
+        "show",
+        "--property=Id,ActiveState,UnitFileState",
+        "--",
+        *units,
+        check=False,
+        executor=executor,
+    )
+    states: dict[str, tuple[bool, bool]] = {}
+    for record in result.stdout.split("\n\n"):
+        props: dict[str, str] = {}
+        for line in record.splitlines():
+            key, sep, value = line.partition("=")
+            if sep:
+                props[key] = value
+        unit_id = props.get("Id")
+        if unit_id:
+            states[unit_id] = (
+                props.get("ActiveState") == "active",
+                props.get("UnitFileState") in ENABLED_UNIT_FILE_STATES,
+            )
+    return states
+
+
 def is_service_active(unit: str, *, executor: Executor | None = None) -> bool:
     """Check if a systemd unit is active."""
-    result = systemctl("is-active", unit, check=False, executor=executor)
+    result = systemctl_capture("is-active", unit, check=False, executor=executor)
     return result.returncode == 0
 
 
 def is_service_enabled(unit: str, *, executor: Executor | None = None) -> bool:
     """Check if a systemd unit is enabled."""
-    result = systemctl("is-enabled", unit, check=False, executor=executor)
+    result = systemctl_capture("is-enabled", unit, check=False, executor=executor)
     return result.returncode == 0
 
 
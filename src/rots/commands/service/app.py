@@ -9,39 +9,36 @@ unit files.
 
 from __future__ import annotations
 
+import json
 import logging
+import sys
 from typing import TYPE_CHECKING, Annotated
 
 import cyclopts
 from ots_shared.ssh.executor import CommandError
 
 from ..common import DryRun, Follow, JsonOutput, Lines, Yes
-from ._helpers import (
-    _file_exists,
-    _unlink,
-    add_secrets_include,
-    check_default_service_conflict,
-    copy_default_config,
-    create_secrets_file,
-    ensure_data_dir,
-    is_service_active,
-    is_service_enabled,
-    systemctl,
-    update_config_value,
-)
-from .packages import get_package, list_packages
 
-# systemctl() always returns Result and raises CommandError on failure
-# (it wraps all calls through an Executor, even locally).
+# _helpers and packages are imported inside each command body so that
+# `ots --help` and commands outside this group never load them.
+
+# systemctl_run()/systemctl_capture() always return Result and raise
+# CommandError on failure (they wrap all calls through an Executor, even locally).
 _SystemctlError = CommandError
 
 
 def _error_stderr(e: CommandError) -> str:
-    """Extract stderr from a CommandError."""
-    return e.result.stderr
+    """Extract stderr from a CommandError.
+
+    systemctl_run() streams stderr to the terminal instead of capturing it,
+    so fall back to the exit-code summary when there is nothing captured.
+    """
+    return e.result.stderr or str(e)
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from ots_shared.ssh.executor import Executor
 
 logger = logging.getLogger(__name__)
@@ -69,24 +66,53 @@ def _get_executor() -> Executor | None:
     return cfg.get_executor(host=host)
 
 
-def _list_units_for_template(
-    template: str,
-    *,
+_SERVICE_SUFFIX = ".service"
+
+
+def _list_units_for_templates(
+    *templates: str,
     executor: Executor | None = None,
-) -> str:
-    """Run systemctl list-units for a template pattern and return stdout."""
-    pattern = f"{template}*"
-    result = systemctl(
+) -> list[str]:
+    """Return unit names matching any of the template patterns.
+
+    All patterns go to one ``systemctl list-units`` call, which accepts
+    several globs. Uses ``--output=json`` so unit descriptions containing
+    whitespace cannot confuse parsing.
+    """
+    from ._helpers import systemctl_capture
+
+    if not templates:
+        return []
+
+    result = systemctl_capture(
         "list-units",
         "--type=service",
         "--all",
-        pattern,
         "--no-pager",
-        "--plain",
+        "--output=json",
+        "--",
+        *(f"{template}*" for template in templates),
         check=False,
         executor=executor,
     )
-    return result.stdout
+    try:
+        units = json.loads(result.stdout or "[]")
+    except ValueError:
+        return []
+    return [
+        name
+        for u in units
+        if (name := u.get("unit", "")).startswith(templates) and name.endswith(_SERVICE_SUFFIX)
+    ]
+
+
+def _instance_from_unit(unit_name: str, template: str) -> str:
+    """Extract the instance from a unit name (valkey-server@6379.service -> 6379).
+
+    Callers guarantee ``unit_name`` starts with ``template`` and ends with
+    ``.service`` (see _list_units_for_templates), so a slice suffices.
+    """
+    return unit_name[len(template) : -len(_SERVICE_SUFFIX)]
 
 
 @app.default
@@ -99,64 +125,74 @@ def list_all(json_output: JsonOutput = False):
         ots service list
         ots service list --json
     """
+    from ._helpers import _files_exist, unit_states
+    from .packages import get_package, list_packages
+
     ex = _get_executor()
     all_instances = []
+    config_paths: list[Path] = []
 
-    for pkg_name in list_packages():
-        pkg = get_package(pkg_name)
-        output = _list_units_for_template(pkg.template, executor=ex)
-
-        if output.strip():
-            for line in output.splitlines():
-                if pkg.template in line:
-                    parts = line.split()
-                    if parts:
-                        unit_name = parts[0]
-                        if "@" in unit_name and ".service" in unit_name:
-                            instance = unit_name.split("@")[1].replace(".service", "")
-                            active = is_service_active(unit_name, executor=ex)
-                            enabled = is_service_enabled(unit_name, executor=ex)
-                            config_exists = _file_exists(pkg.config_file(instance), ex)
-                            all_instances.append(
-                                {
-                                    "package": pkg_name,
-                                    "instance": instance,
-                                    "unit": unit_name,
-                                    "active": active,
-                                    "enabled": enabled,
-                                    "config_exists": config_exists,
-                                }
-                            )
+    packages = {name: get_package(name) for name in list_packages()}
+    unit_names = _list_units_for_templates(
+        *(pkg.template for pkg in packages.values()), executor=ex
+    )
 
-    if json_output:
-        import json
+    # Bucket units by template once (templates end at the '@') instead of
+    # re-testing every unit against every package.
+    units_by_template: dict[str, list[str]] = {}
+    for unit_name in unit_names:
+        template = unit_name[: unit_name.index("@") + 1]
+        units_by_template.setdefault(template, []).append(unit_name)
+
+    for pkg_name, pkg in packages.items():
+        for unit_name in units_by_template.get(pkg.template, []):
+            instance = _instance_from_unit(unit_name, pkg.template)
+            all_instances.append(
+                {
+                    "package": pkg_name,
+                    "instance": instance,
+                    "unit": unit_name,
+                    "active": False,
+                    "enabled": False,
+                    "config_exists": False,
+                }
+            )
+            config_paths.append(pkg.config_file(instance))
+
+    # One systemctl call for every unit's active/enabled state, and one
+    # existence probe for every config file
+    states = unit_states([inst["unit"] for inst in all_instances], executor=ex)
+    config_exists = _files_exist(config_paths, ex)
+    for inst, exists in zip(all_instances, config_exists, strict=True):
+        inst["active"], inst["enabled"] = states.get(inst["unit"], (False, False))
+        inst["config_exists"] = exists
 
+    if json_output:
         print(json.dumps(all_instances, indent=2))
         return
 
     if not all_instances:
-        print("No service instances found.")
-        print()
-        print("Available packages:")
-        for name in list_packages():
-            pkg = get_package(name)
-            print(f"  {name:10} - {pkg.template}.service")
-        print()
-        print("Initialize with: ots service init <package> <instance>")
+        lines = ["No service instances found.", "", "Available packages:"]
+        lines += [f"  {name:10} - {pkg.template}.service" for name, pkg in packages.items()]
+        lines += ["", "Initialize with: ots service init <package> <instance>"]
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
-    print("Service instances:")
-    print("-" * 70)
-    print(f"{'PACKAGE':<10} {'INSTANCE':<10} {'STATUS':<10} {'ENABLED':<10} {'CONFIG':<10}")
-    print("-" * 70)
-
+    # Build the table and emit it with one write rather than one print() per row
+    lines = [
+        "Service instances:",
+        "-" * 70,
+        f"{'PACKAGE':<10} {'INSTANCE':<10} {'STATUS':<10} {'ENABLED':<10} {'CONFIG':<10}",
+        "-" * 70,
+    ]
     for inst in all_instances:
         status = "active" if inst["active"] else "inactive"
         enabled = "enabled" if inst["enabled"] else "disabled"
         config = "ok" if inst["config_exists"] else "missing"
-        print(
+        lines.append(
             f"{inst['package']:<10} {inst['instance']:<10} {status:<10} {enabled:<10} {config:<10}"
         )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 @app.command
@@ -223,6 +259,19 @@ def init(
         ots service init valkey 6379 --dry-run
         ots service init valkey 6379 --force                  # Overwrite existing config
     """
+    from ._helpers import (
+        _file_exists,
+        _unlink,
+        add_secrets_include,
+        check_default_service_conflict,
+        copy_default_config,
+        create_secrets_file,
+        ensure_data_dir,
+        systemctl_run,
+        update_config_values,
+    )
+    from .packages import get_package
+
     ex = _get_executor()
     pkg = get_package(package)
     if port is not None:
@@ -283,16 +332,22 @@ def init(
         logger.error(f"{e}")
         raise SystemExit(1)
 
-    # Step 2: Update port and bind in config
-    logger.info("Updating config values...")
-    update_config_value(config_path, pkg.port_config_key, str(port_num), pkg, executor=ex)
-    update_config_value(config_path, pkg.bind_config_key, bind, pkg, executor=ex)
-
-    # Step 3: Set data directory
+    # Step 2: Set up data directory
     data_dir = ensure_data_dir(pkg, instance, executor=ex)
     logger.info(f"  Data dir: {data_dir}")
-    # Update config to point to instance-specific data dir
-    update_config_value(config_path, "dir", str(data_dir), pkg, executor=ex)
+
+    # Step 3: Update port, bind and instance-specific data dir in one rewrite
+    logger.info("Updating config values...")
+    update_config_values(
+        config_path,
+        {
+            pkg.port_config_key: str(port_num),
+            pkg.bind_config_key: bind,
+            "dir": str(data_dir),
+        },
+        pkg,
+        executor=ex,
+    )
 
     # Step 4: Create secrets file (if applicable)
     if not no_secrets and pkg.secrets:
@@ -305,12 +360,26 @@ def init(
     else:
         logger.info("Skipping secrets file (--no-secrets or package has no secrets config)")
 
-    # Step 5: Enable service
     unit = pkg.instance_unit(instance)
+
+    # Steps 5+6 in one call when both are requested.  On failure, fall
+    # through to the separate steps so the error is attributed to
+    # enable or start as usual.
+    if enable and start:
+        logger.info(f"Enabling and starting {unit}...")
+        try:
+            systemctl_run("enable", "--now", unit, executor=ex)
+        except _SystemctlError as e:
+            logger.debug(f"enable --now failed, retrying separately: {_error_stderr(e)}")
+        else:
+            logger.info("  Enabled and started")
+            enable = start = False
+
+    # Step 5: Enable service
     if enable:
         logger.info(f"Enabling {unit}...")
         try:
-            systemctl("enable", unit, executor=ex)
+            systemctl_run("enable", unit, executor=ex)
             logger.info("  Enabled")
         except _SystemctlError as e:
             logger.warning(f"Could not enable: {_error_stderr(e)}")
@@ -319,7 +388,7 @@ def init(
     if start:
         logger.info(f"Starting {unit}...")
         try:
-            systemctl("start", unit, executor=ex)
+            systemctl_run("start", unit, executor=ex)
             logger.info("  Started")
         except _SystemctlError as e:
             logger.error(f"Could not start: {_error_stderr(e)}")
@@ -331,26 +400,36 @@ def init(
     logger.info(f"  Status: ots service status {package} {instance}")
 
 
-@app.command
-def enable(package: Package, instance: Instance):
-    """Enable a service instance to start at boot.
+def _unit_action(verb: str, package: str, instance: str, progress: str, done: str) -> None:
+    """Run ``systemctl <verb>`` on one instance, exiting 1 on failure.
 
-    Examples:
-        ots service enable valkey 6379
+    Shared body of the enable/start/stop/restart commands.
     """
+    from ._helpers import systemctl_run
+    from .packages import get_package
+
     ex = _get_executor()
-    pkg = get_package(package)
-    unit = pkg.instance_unit(instance)
+    unit = get_package(package).instance_unit(instance)
 
-    logger.info(f"Enabling {unit}...")
+    logger.info(f"{progress} {unit}...")
     try:
-        systemctl("enable", unit, executor=ex)
-        logger.info("Enabled")
+        systemctl_run(verb, unit, executor=ex)
+        logger.info(done)
     except _SystemctlError as e:
         logger.error(f"{_error_stderr(e)}")
         raise SystemExit(1)
 
 
+@app.command
+def enable(package: Package, instance: Instance):
+    """Enable a service instance to start at boot.
+
+    Examples:
+        ots service enable valkey 6379
+    """
+    _unit_action("enable", package, instance, "Enabling", "Enabled")
+
+
 @app.command
 def disable(
     package: Package,
@@ -363,6 +442,9 @@ def disable(
         ots service disable valkey 6379
         ots service disable valkey 6379 -y
     """
+    from ._helpers import systemctl_run
+    from .packages import get_package
+
     ex = _get_executor()
     pkg = get_package(package)
     unit = pkg.instance_unit(instance)
@@ -374,12 +456,10 @@ def disable(
             logger.info("Aborted")
             return
 
-    logger.info(f"Stopping {unit}...")
-    systemctl("stop", unit, check=False, executor=ex)
-
-    logger.info(f"Disabling {unit}...")
+    # disable --now stops the unit too; stopping an inactive unit is a no-op
+    logger.info(f"Stopping and disabling {unit}...")
     try:
-        systemctl("disable", unit, executor=ex)
+        systemctl_run("disable", "--now", unit, executor=ex)
         logger.info("Disabled")
     except _SystemctlError as e:
         logger.error(f"{_error_stderr(e)}")
@@ -394,18 +474,21 @@ def status(package: Package, instance: OptInstance = None):
         ots service status valkey 6379
         ots service status valkey  # Shows all valkey instances
     """
+    from ._helpers import systemctl_capture
+    from .packages import get_package
+
     ex = _get_executor()
     pkg = get_package(package)
 
     if instance:
         unit = pkg.instance_unit(instance)
-        result = systemctl("status", unit, check=False, executor=ex)
+        result = systemctl_capture("status", unit, check=False, executor=ex)
         print(result.stdout)
         if result.stderr:
             print(result.stderr)
     else:
         # Show all instances of this template
-        result = systemctl(
+        result = systemctl_capture(
             "list-units",
             "--type=service",
             f"{pkg.template}*",
@@ -423,17 +506,7 @@ def start(package: Package, instance: Instance):
     Examples:
         ots service start valkey 6379
     """
-    ex = _get_executor()
-    pkg = get_package(package)
-    unit = pkg.instance_unit(instance)
-
-    logger.info(f"Starting {unit}...")
-    try:
-        systemctl("start", unit, executor=ex)
-        logger.info("Started")
-    except _SystemctlError as e:
-        logger.error(f"{_error_stderr(e)}")
-        raise SystemExit(1)
+    _unit_action("start", package, instance, "Starting", "Started")
 
 
 @app.command
@@ -443,17 +516,7 @@ def stop(package: Package, instance: Instance):
     Examples:
         ots service stop valkey 6379
     """
-    ex = _get_executor()
-    pkg = get_package(package)
-    unit = pkg.instance_unit(instance)
-
-    logger.info(f"Stopping {unit}...")
-    try:
-        systemctl("stop", unit, executor=ex)
-        logger.info("Stopped")
-    except _SystemctlError as e:
-        logger.error(f"{_error_stderr(e)}")
-        raise SystemExit(1)
+    _unit_action("stop", package, instance, "Stopping", "Stopped")
 
 
 @app.command
@@ -463,17 +526,7 @@ def restart(package: Package, instance: Instance):
     Examples:
         ots service restart valkey 6379
     """
-    ex = _get_executor()
-    pkg = get_package(package)
-    unit = pkg.instance_unit(instance)
-
-    logger.info(f"Restarting {unit}...")
-    try:
-        systemctl("restart", unit, executor=ex)
-        logger.info("Restarted")
-    except _SystemctlError as e:
-        logger.error(f"{_error_stderr(e)}")
-        raise SystemExit(1)
+    _unit_action("restart", package, instance, "Restarting", "Restarted")
 
 
 @app.command
@@ -493,6 +546,8 @@ def logs(
     """
     from ots_shared.ssh import is_remote
 
+    from .packages import get_package
+
     ex = _get_executor()
     pkg = get_package(package)
     unit = pkg.instance_unit(instance)
@@ -523,83 +578,58 @@ def list_instances(
         ots service list valkey
         ots service list valkey --json
     """
+    from ._helpers import _list_dir, unit_states
+    from .packages import get_package
+
     ex = _get_executor()
     pkg = get_package(package)
     instances = []
 
-    output = _list_units_for_template(pkg.template, executor=ex)
-
-    if output.strip():
-        # Parse output to extract instance names
-        for line in output.splitlines():
-            if pkg.template in line:
-                parts = line.split()
-                if parts:
-                    unit_name = parts[0]
-                    # Extract instance from unit name
-                    # e.g., valkey-server@6379.service -> 6379
-                    if "@" in unit_name and ".service" in unit_name:
-                        instance = unit_name.split("@")[1].replace(".service", "")
-                        active = is_service_active(unit_name, executor=ex)
-                        enabled = is_service_enabled(unit_name, executor=ex)
-                        config_exists = _file_exists(pkg.config_file(instance), ex)
-                        instances.append(
-                            {
-                                "instance": instance,
-                                "unit": unit_name,
-                                "active": active,
-                                "enabled": enabled,
-                                "config_exists": config_exists,
-                            }
-                        )
+    # One directory listing answers both "does this instance have a config"
+    # and the config-file summary below, instead of a stat per instance.
+    config_dir = pkg.instance_config_dir
+    name_prefix = "" if pkg.use_instances_subdir else f"{pkg.name}-"
+    filenames = _list_dir(config_dir, ex)
+    present = set(filenames)
+    config_files = [
+        (filename, pkg.instance_unit(filename.removesuffix(".conf").removeprefix(name_prefix)))
+        for filename in filenames
+        if filename.endswith(".conf")
+    ]
+
+    for unit_name in _list_units_for_templates(pkg.template, executor=ex):
+        instance = _instance_from_unit(unit_name, pkg.template)
+        instances.append(
+            {
+                "instance": instance,
+                "unit": unit_name,
+                "active": False,
+                "enabled": False,
+                "config_exists": pkg.config_file_name(instance) in present,
+            }
+        )
+
+    # One systemctl call for the discovered units and the config-file units
+    query = dict.fromkeys([inst["unit"] for inst in instances] + [u for _, u in config_files])
+    states = unit_states(list(query), executor=ex)
+    for inst in instances:
+        inst["active"], inst["enabled"] = states.get(inst["unit"], (False, False))
 
     if json_output:
-        import json
-
         print(json.dumps(instances, indent=2))
         return
 
-    print(f"Instances of {pkg.name} ({pkg.template}):")
-    print("-" * 50)
-
-    if instances:
-        for inst in instances:
-            active = "active" if inst["active"] else "inactive"
-            enabled = "enabled" if inst["enabled"] else "disabled"
-            config_status = "config ok" if inst["config_exists"] else "no config"
-            print(f"  {inst['instance']:10} {active:10} {enabled:10} {config_status}")
-
-    # Also check for config files (local only — remote would need ls)
-    from ots_shared.ssh import is_remote
-
-    if not is_remote(ex):
-        config_dir = pkg.instances_dir if pkg.use_instances_subdir else pkg.config_dir
-        if config_dir.exists():
-            print()
-            print("Config files in config directory:")
-            for conf in config_dir.glob("*.conf"):
-                if pkg.use_instances_subdir:
-                    instance = conf.stem
-                else:
-                    instance = conf.stem.replace(f"{pkg.name}-", "")
-
-                unit = pkg.instance_unit(instance)
-                active = "active" if is_service_active(unit, executor=ex) else "inactive"
-                print(f"  {conf.name:30} -> {active}")
-    else:
-        # Remote: list config files via executor
-        config_dir = pkg.instances_dir if pkg.use_instances_subdir else pkg.config_dir
-        result = ex.run(["ls", str(config_dir)], timeout=10)  # type: ignore[union-attr]
-        if result.ok and result.stdout.strip():
-            print()
-            print("Config files in config directory:")
-            for filename in result.stdout.strip().splitlines():
-                if filename.endswith(".conf"):
-                    if pkg.use_instances_subdir:
-                        instance = filename.replace(".conf", "")
-                    else:
-                        instance = filename.replace(".conf", "").replace(f"{pkg.name}-", "")
-
-                    unit = pkg.instance_unit(instance)
-                    active = "active" if is_service_active(unit, executor=ex) else "inactive"
-                    print(f"  {filename:30} -> {active}")
+    lines = [f"Instances of {pkg.name} ({pkg.template}):", "-" * 50]
+    for inst in instances:
+        active = "active" if inst["active"] else "inactive"
+        enabled = "enabled" if inst["enabled"] else "disabled"
+        config_status = "config ok" if inst["config_exists"] else "no config"
+        lines.append(f"  {inst['instance']:10} {active:10} {enabled:10} {config_status}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    if config_files:
+        lines = ["", "Config files in config directory:"]
+        for filename, unit in config_files:
+            active = "active" if states.get(unit, (False, False))[0] else "inactive"
+            lines.append(f"  {filename:30} -> {active}")
+        sys.stdout.write("\n".join(lines) + "\n")
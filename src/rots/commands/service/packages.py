@@ -7,10 +7,33 @@ manage different systemd template services (valkey-server@, redis-server@, etc.)
 """
 
 from dataclasses import dataclass, field
+from functools import cache, cached_property
 from pathlib import Path
+from types import MappingProxyType
 
 
-@dataclass(frozen=True)
+@cache
+def _split_pattern(pattern: str) -> tuple[str, str] | None:
+    """Split a ``{instance}`` pattern into (prefix, suffix), once per pattern.
+
+    Returns None when the pattern has no single ``{instance}`` placeholder,
+    in which case callers fall back to str.format().
+    """
+    prefix, sep, suffix = pattern.partition("{instance}")
+    if not sep or "{" in prefix or "{" in suffix:
+        return None
+    return prefix, suffix
+
+
+def _fill_pattern(pattern: str, instance: str) -> str:
+    """Substitute *instance* into a ``{instance}`` file-name pattern."""
+    parts = _split_pattern(pattern)
+    if parts is None:
+        return pattern.format(instance=instance)
+    return parts[0] + instance + parts[1]
+
+
+@dataclass(frozen=True, slots=True)
 class SecretConfig:
     """Configuration for secret handling in service configs.
 
@@ -47,6 +70,8 @@ class ServicePackage:
 
     Describes the paths, patterns, and behaviors for managing a specific
     package's template service (e.g., valkey-server@.service).
+
+    Not slotted: the cached_property attributes below need an instance __dict__.
     """
 
     # Package name (e.g., "valkey", "redis")
@@ -102,34 +127,42 @@ class ServicePackage:
     # Comment prefix in config files
     comment_prefix: str = "#"
 
-    @property
+    @cached_property
     def instances_dir(self) -> Path:
-        """Directory for instance-specific config files."""
+        """Directory for instance-specific config files.
+
+        Cached because config_file()/secrets_file() consult it on every call.
+        """
         return self.config_dir / "instances"
 
-    @property
+    @cached_property
     def template_unit(self) -> str:
         """Full template unit name with .service suffix."""
         return f"{self.template}.service"
 
+    @cached_property
+    def instance_config_dir(self) -> Path:
+        """Directory holding instance config files (instances/ or config_dir)."""
+        return self.instances_dir if self.use_instances_subdir else self.config_dir
+
     def instance_unit(self, instance: str) -> str:
         """Get full unit name for a specific instance."""
         return f"{self.template}{instance}.service"
 
+    def config_file_name(self, instance: str) -> str:
+        """Get the bare config file name for an instance, without building a Path."""
+        return _fill_pattern(self.config_file_pattern, instance)
+
     def config_file(self, instance: str) -> Path:
         """Get config file path for a specific instance."""
-        config_name = self.config_file_pattern.format(instance=instance)
-        if self.use_instances_subdir:
-            return self.instances_dir / config_name
-        return self.config_dir / config_name
+        return self.instance_config_dir / self.config_file_name(instance)
 
     def secrets_file(self, instance: str) -> Path | None:
         """Get secrets file path for a specific instance, if using separate secrets."""
         if self.secrets and self.secrets.secrets_file_pattern:
-            secrets_name = self.secrets.secrets_file_pattern.format(instance=instance)
-            if self.use_instances_subdir:
-                return self.instances_dir / secrets_name
-            return self.config_dir / secrets_name
+            return self.instance_config_dir / _fill_pattern(
+                self.secrets.secrets_file_pattern, instance
+            )
         return None
 
     def data_path(self, instance: str) -> Path:
@@ -188,11 +221,17 @@ REDIS = ServicePackage(
     config_format="space",
 )
 
-# Registry of all known packages
-PACKAGES: dict[str, ServicePackage] = {
-    "valkey": VALKEY,
-    "redis": REDIS,
-}
+# Registry of all known packages (read-only view)
+PACKAGES: MappingProxyType[str, ServicePackage] = MappingProxyType(
+    {
+        "valkey": VALKEY,
+        "redis": REDIS,
+    }
+)
+
+# Sorted names, computed once since PACKAGES is frozen
+_PACKAGE_NAMES: tuple[str, ...] = tuple(sorted(PACKAGES))
+_AVAILABLE = ", ".join(_PACKAGE_NAMES)
 
 
 def get_package(name: str) -> ServicePackage:
@@ -207,12 +246,12 @@ def get_package(name: str) -> ServicePackage:
     Raises:
         SystemExit: If the package name is not registered, with available names listed.
     """
-    if name not in PACKAGES:
-        available = ", ".join(sorted(PACKAGES.keys()))
-        raise SystemExit(f"Unknown service package '{name}'. Available packages: {available}")
-    return PACKAGES[name]
+    pkg = PACKAGES.get(name)
+    if pkg is None:
+        raise SystemExit(f"Unknown service package '{name}'. Available packages: {_AVAILABLE}")
+    return pkg
 
 
 def list_packages() -> list[str]:
     """List all registered package names."""
-    return sorted(PACKAGES.keys())
+    return list(_PACKAGE_NAMES)
@@ -7,9 +7,12 @@ import logging
 import os
 import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from . import db
+
 if TYPE_CHECKING:
     from ots_shared.ssh.executor import Executor
 
@@ -24,6 +27,10 @@ DEFAULT_IMAGE = "ghcr.io/onetimesecret/onetimesecret"
 # This prevents accidental pulls of a registry tag literally named "current".
 DEFAULT_TAG = "@current"
 
+# Tag values (after stripping a leading '@', case-insensitive) that name a
+# deployment-database alias rather than a registry tag.
+ALIAS_NAMES = frozenset({"current", "rollback"})
+
 # Default environment file path (infrastructure env vars for OTS containers)
 DEFAULT_ENV_FILE = Path("/etc/default/onetimesecret")
 
@@ -245,10 +252,13 @@ class Config:
     def image_with_tag(self) -> str:
         return join_image_tag(self.image, self.tag)
 
-    @property
+    @cached_property
     def registry_auth_file(self) -> Path:
         """Container registry auth file path.
 
+        Computed once per Config: the probe below stats the filesystem and
+        every pull/login/quadlet render consults it.
+
         Resolution order:
         1. Explicit override via _registry_auth_file
         2. REGISTRY_AUTH_FILE env var
@@ -412,20 +422,21 @@ class Config:
 
         When *executor* is None or a LocalExecutor, delegates to the
         :attr:`existing_config_files` property.  For remote executors,
-        probes the remote filesystem via ``test -f``.
+        probes the remote filesystem with one ``test -f`` loop (a single
+        round trip for all of CONFIG_FILES).
         """
         from ots_shared.ssh import is_remote
 
         if not is_remote(executor):
             return self.existing_config_files
 
-        files: list[Path] = []
-        for fname in CONFIG_FILES:
-            fpath = self.config_dir / fname
-            result = executor.run(["test", "-f", str(fpath)])  # type: ignore[union-attr]
-            if result.ok:
-                files.append(fpath)
-        return files
+        candidates = [self.config_dir / fname for fname in CONFIG_FILES]
+        script = 'for f do if [ -f "$f" ]; then echo "$f"; fi; done'
+        result = executor.run(  # type: ignore[union-attr]
+            ["sh", "-c", script, "sh", *(str(p) for p in candidates)]
+        )
+        found = set(result.stdout.splitlines())
+        return [fpath for fpath in candidates if str(fpath) in found]
 
     @property
     def has_custom_config(self) -> bool:
@@ -570,14 +581,15 @@ class Config:
 
         Returns (image, tag) tuple.
         """
-        from . import db
-
         # Normalize: strip the leading '@' from sentinel values so the lookup
         # key is the plain alias name ("current", "rollback").
         tag_key = self.tag.lstrip("@")
+        alias_name = tag_key.lower()
 
         # Check if tag is an alias name (sentinel or bare)
-        if tag_key.lower() in ("current", "rollback"):
+        if alias_name in ALIAS_NAMES:
+            # db.get_alias memoizes per process, so the repeated resolutions
+            # while rendering a deploy cost one lookup.
             alias = db.get_alias(self.db_path, tag_key, executor=executor)
             if alias:
                 # Explicit image (env var or CLI positional) takes precedence
@@ -18,12 +18,15 @@ of using the Python sqlite3 module.  The remote ``sqlite3`` must be >= 3.33
 
 from __future__ import annotations
 
+import atexit
 import json as _json
 import logging
 import sqlite3
-from collections.abc import Iterator
+import threading
+from collections.abc import Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -34,6 +37,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Alias lookups memoized for this process: (db path, executor, ALIAS) -> alias.
+# Rendering a deploy resolves the same alias several times (quadlet, assets,
+# run); each lookup is a DB read or, remotely, an SSH round trip.  Every alias
+# write made by this process clears it.
+_alias_cache: dict[tuple[str, object, str], ImageAlias | None] = {}
+
+
+def invalidate_alias_cache() -> None:
+    """Forget memoized alias lookups (e.g. after an out-of-band DB change)."""
+    _alias_cache.clear()
+
 
 @dataclass
 class Deployment:
@@ -49,9 +63,12 @@ class Deployment:
     notes: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class ImageAlias:
-    """An image alias (CURRENT, ROLLBACK, etc.)."""
+    """An image alias (CURRENT, ROLLBACK, etc.).
+
+    Frozen because get_alias hands the same memoized instance to every caller.
+    """
 
     alias: str
     image: str
@@ -81,6 +98,13 @@ CREATE TABLE IF NOT EXISTS image_aliases (
 CREATE INDEX IF NOT EXISTS idx_deployments_timestamp ON deployments(timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_deployments_port ON deployments(port);
 CREATE INDEX IF NOT EXISTS idx_deployments_tag ON deployments(tag);
+-- Rollback/previous-tags lookups: only successful image-changing actions,
+-- grouped by (image, tag) straight from the index.  action and success are
+-- carried as trailing columns so the WHERE clause is answered from the index
+-- too and the lookup never touches the table (covering index).
+CREATE INDEX IF NOT EXISTS idx_deployments_rollback
+    ON deployments(image, tag, id, timestamp, action, success)
+    WHERE success = 1 AND action IN ('deploy', 'redeploy', 'set-current');
 
 -- Service instances (systemd template services like valkey-server@)
 CREATE TABLE IF NOT EXISTS service_instances (
@@ -109,8 +133,10 @@ CREATE TABLE IF NOT EXISTS service_actions (
 
 CREATE INDEX IF NOT EXISTS idx_service_instances_package ON service_instances(package);
 CREATE INDEX IF NOT EXISTS idx_service_actions_timestamp ON service_actions(timestamp DESC);
-CREATE INDEX IF NOT EXISTS idx_service_actions_pkg_inst
-    ON service_actions(package, instance);
+-- Per-instance history, newest first (supersedes the (package, instance) index)
+DROP INDEX IF EXISTS idx_service_actions_pkg_inst;
+CREATE INDEX IF NOT EXISTS idx_service_actions_pkg_inst_ts
+    ON service_actions(package, instance, timestamp DESC);
 
 -- DNS record audit trail
 CREATE TABLE IF NOT EXISTS dns_records (
@@ -219,23 +245,84 @@ def _interpolate_params(sql: str, params: tuple) -> str:
 
 def _remote_init_db(db_path: Path, *, executor: Executor) -> None:
     """Ensure the remote database exists and has the schema applied."""
-    # Use a single sqlite3 invocation with the full schema
+    # Use a single sqlite3 invocation with the full schema.  journal_mode is
+    # persistent, so later per-query sqlite3 processes also get WAL.
     result = executor.run(
-        ["sqlite3", str(db_path), SCHEMA],
+        ["sqlite3", str(db_path), "PRAGMA journal_mode=WAL;\n" + SCHEMA],
         timeout=15,
     )
     if not result.ok:
         logger.warning(f"Remote init_db failed: {result.stderr.strip()}")
 
 
+# Per-connection tuning for local connections.  The workload is a handful
+# of small commits per command; with WAL each commit appends to the log
+# instead of rewriting and fsyncing the main file, and readers (status,
+# list) don't block on a concurrent deploy.  synchronous=NORMAL is the
+# documented safe pairing for WAL.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    # SQLite's default, stated explicitly: checkpoint once the WAL passes
+    # ~1000 pages so an append-only timeline can't grow it without bound.
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+
+def _configure_connection(conn: sqlite3.Connection, db_path: Path) -> None:
+    """Apply journal mode and tuning PRAGMAs to a freshly opened connection."""
+    # journal_mode is persistent in the file; in-memory databases can't use WAL.
+    if str(db_path) != ":memory:":
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError as e:
+            # Read-only access to a database not yet in WAL mode: keep the
+            # existing journal mode rather than failing the read.
+            logger.debug(f"Could not switch {db_path} to WAL: {e}")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
 def init_db(db_path: Path, *, executor: Executor | None = None) -> None:
     """Initialize the database with schema. Idempotent."""
     if _is_remote(executor):
         _remote_init_db(db_path, executor=executor)  # type: ignore[arg-type]
         return
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(db_path) as conn:
+    conn = sqlite3.connect(db_path)
+    try:
+        _configure_connection(conn, db_path)
         conn.executescript(SCHEMA)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# Process-wide cache of local connections: (db path, thread id) -> connection.
+# A CLI run touches the same database from several helpers (record, alias
+# lookup, rollback); reusing one connection keeps its page cache and skips
+# the open/PRAGMA setup each time.  Closed at interpreter exit.
+_conn_cache: dict[tuple[str, int], sqlite3.Connection] = {}
+_conn_lock = threading.Lock()
+
+
+def close_connections() -> None:
+    """Close all cached local connections. Registered via atexit."""
+    with _conn_lock:
+        for conn in _conn_cache.values():
+            try:
+                # Recommended on close for short-lived connections; cheap
+                # unless statistics are actually stale.
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            conn.close()
+        _conn_cache.clear()
+
+
+atexit.register(close_connections)
 
 
 @contextmanager
@@ -246,6 +333,10 @@ def get_connection(
 ) -> Iterator[sqlite3.Connection]:
     """Get a local database connection, initializing if needed.
 
+    Connections are cached per (path, thread) and stay open after the
+    ``with`` block; see :func:`close_connections`.  Any transaction the
+    caller left uncommitted is rolled back on exit, as closing would have.
+
     For remote execution paths, callers should use ``_remote_query`` /
     ``_remote_execute`` directly instead of opening a connection.
 
@@ -258,14 +349,101 @@ def get_connection(
             "get_connection() cannot be used with a remote executor. "
             "Use _remote_query() / _remote_execute() directly."
         )
-    if not db_path.exists():
-        init_db(db_path)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    key = (str(db_path), threading.get_ident())
+    conn = _conn_cache.get(key)
+    if conn is None:
+        if not db_path.exists():
+            init_db(db_path)
+        # check_same_thread=False only so a recycled thread id can reuse
+        # the entry; the key still confines each connection to one thread.
+        # isolation_level=None: no implicit deferred BEGIN.  Single-statement
+        # writes autocommit; multi-statement writers open their own
+        # BEGIN IMMEDIATE so they take the WAL write lock up front instead of
+        # upgrading mid-transaction (which can fail with SQLITE_BUSY).
+        conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        _configure_connection(conn, db_path)
+        with _conn_lock:
+            _conn_cache[key] = conn
     try:
         yield conn
     finally:
-        conn.close()
+        if conn.in_transaction:
+            conn.rollback()
+
+
+def _fetch_tuples(conn: sqlite3.Connection, sql: str, params: Sequence = ()) -> list[tuple]:
+    """Run a SELECT and return plain tuples, bypassing the Row factory.
+
+    For readers that map every column straight onto a dataclass in SELECT
+    order: positional unpacking skips a by-name lookup per field.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor.execute(sql, params).fetchall()
+
+
+def maintenance(db_path: Path, *, executor: Executor | None = None) -> None:
+    """Checkpoint and truncate the WAL, then refresh query-planner statistics.
+
+    ``wal_checkpoint(TRUNCATE)`` copies committed WAL pages into the main
+    database file and resets the -wal file to zero bytes; ``optimize`` runs
+    ANALYZE only for tables whose statistics look stale.
+    """
+    if _is_remote(executor):
+        _remote_execute(
+            db_path,
+            "PRAGMA wal_checkpoint(TRUNCATE); PRAGMA optimize;",
+            executor=executor,  # type: ignore[arg-type]
+        )
+        return
+    with get_connection(db_path) as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("PRAGMA optimize")
+
+
+# RETURNING arrived in SQLite 3.35 (2021); older libraries fall back to lastrowid.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def _insert_returning_id(conn: sqlite3.Connection, sql: str, params: Sequence) -> int:
+    """Execute an INSERT (or upsert) and return the id of the affected row.
+
+    ``RETURNING id`` reports the row actually written, including the
+    existing row when an upsert takes its UPDATE branch; ``lastrowid``
+    would instead report whatever this (cached) connection last inserted.
+    """
+    if _HAS_RETURNING:
+        row = conn.execute(f"{sql.rstrip()} RETURNING id", params).fetchone()
+        return row[0] if row else 0
+    return conn.execute(sql, params).lastrowid or 0
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in the format SQLite's ``datetime('now')`` produces."""
+    return datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+
+_SQL_INSERT_DEPLOYMENT = """
+    INSERT INTO deployments (port, image, tag, action, success, notes)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_DEPLOYMENT_AT = """
+    INSERT INTO deployments (timestamp, port, image, tag, action, success, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_ALIAS = """
+    INSERT INTO image_aliases (alias, image, tag, set_at)
+    VALUES (?, ?, ?, datetime('now'))
+    ON CONFLICT(alias) DO UPDATE SET
+        image = excluded.image,
+        tag = excluded.tag,
+        set_at = datetime('now')
+"""
+
+_SQL_SELECT_ALIAS = "SELECT alias, image, tag, set_at FROM image_aliases WHERE alias = ?"
 
 
 def record_deployment(
@@ -280,18 +458,42 @@ def record_deployment(
     executor: Executor | None = None,
 ) -> int:
     """Record a deployment action to the timeline. Returns the deployment ID."""
-    sql = """
-        INSERT INTO deployments (port, image, tag, action, success, notes)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """
+    sql = _SQL_INSERT_DEPLOYMENT
     params = (port, image, tag, action, 1 if success else 0, notes)
     if _is_remote(executor):
         _remote_execute(db_path, sql, params, executor=executor)  # type: ignore[arg-type]
         return 0  # Remote doesn't return lastrowid
-    with get_connection(db_path) as conn:
-        cursor = conn.execute(sql, params)
-        conn.commit()
-        return cursor.lastrowid or 0
+    with get_connection(db_path) as conn, conn:
+        return _insert_returning_id(conn, sql, params)
+
+
+def record_deployments_bulk(
+    db_path: Path,
+    rows: Iterable[tuple[int | None, str, str, str, bool, str | None]],
+    *,
+    executor: Executor | None = None,
+) -> int:
+    """Record several deployment actions in one transaction.
+
+    Each row is ``(port, image, tag, action, success, notes)``, the same
+    fields :func:`record_deployment` takes.  Returns the number of rows
+    recorded.  All rows share one timestamp, taken once for the batch.
+    """
+    ts = _utc_timestamp()
+    params = [
+        (ts, port, image, tag, action, 1 if success else 0, notes)
+        for port, image, tag, action, success, notes in rows
+    ]
+    if not params:
+        return 0
+    if _is_remote(executor):
+        statements = [(_SQL_INSERT_DEPLOYMENT_AT, p) for p in params]
+        _remote_execute_all(db_path, statements, executor=executor)  # type: ignore[arg-type]
+        return len(params)
+    with get_connection(db_path) as conn, conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(_SQL_INSERT_DEPLOYMENT_AT, params)
+    return len(params)
 
 
 def get_deployments(
@@ -313,6 +515,33 @@ def get_deployments(
         notes_like: Filter by notes pattern using SQL LIKE (e.g., "%worker_id=1%").
         executor: Executor for command dispatch. None uses local sqlite3.
     """
+    return list(
+        iter_deployments(
+            db_path,
+            limit=limit,
+            port=port,
+            action_like=action_like,
+            notes_like=notes_like,
+            executor=executor,
+        )
+    )
+
+
+def iter_deployments(
+    db_path: Path,
+    limit: int = 50,
+    port: int | None = None,
+    action_like: str | None = None,
+    notes_like: str | None = None,
+    *,
+    executor: Executor | None = None,
+) -> Iterator[Deployment]:
+    """Yield deployment history newest first; see :func:`get_deployments`.
+
+    Locally, rows are read from the cursor as they are consumed, so callers
+    that stop early never materialize the rest.  Remote results arrive as
+    one ``sqlite3 -json`` document and are yielded from that.
+    """
     # Build query dynamically based on filters
     conditions: list[str] = []
     params: list[int | str] = []
@@ -339,8 +568,8 @@ def get_deployments(
 
     if _is_remote(executor):
         rows = _remote_query(db_path, query, tuple(params), executor=executor)  # type: ignore[arg-type]
-        return [
-            Deployment(
+        for row in rows:
+            yield Deployment(
                 id=row["id"],
                 timestamp=row["timestamp"],
                 port=row.get("port"),
@@ -350,24 +579,15 @@ def get_deployments(
                 success=bool(row["success"]),
                 notes=row.get("notes"),
             )
-            for row in rows
-        ]
+        return
 
     with get_connection(db_path) as conn:
-        rows = conn.execute(query, params).fetchall()
-        return [
-            Deployment(
-                id=row["id"],
-                timestamp=row["timestamp"],
-                port=row["port"],
-                image=row["image"],
-                tag=row["tag"],
-                action=row["action"],
-                success=bool(row["success"]),
-                notes=row["notes"],
-            )
-            for row in rows
-        ]
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        for id_, timestamp, port_, image, tag, action, success, notes in cursor.execute(
+            query, params
+        ):
+            yield Deployment(id_, timestamp, port_, image, tag, action, bool(success), notes)
 
 
 def set_alias(
@@ -379,21 +599,16 @@ def set_alias(
     executor: Executor | None = None,
 ) -> None:
     """Set an image alias (e.g., CURRENT, ROLLBACK)."""
-    sql = """
-        INSERT INTO image_aliases (alias, image, tag, set_at)
-        VALUES (?, ?, ?, datetime('now'))
-        ON CONFLICT(alias) DO UPDATE SET
-            image = excluded.image,
-            tag = excluded.tag,
-            set_at = datetime('now')
-    """
+    sql = _SQL_UPSERT_ALIAS
     params = (alias.upper(), image, tag)
-    if _is_remote(executor):
-        _remote_execute(db_path, sql, params, executor=executor)  # type: ignore[arg-type]
-        return
-    with get_connection(db_path) as conn:
-        conn.execute(sql, params)
-        conn.commit()
+    try:
+        if _is_remote(executor):
+            _remote_execute(db_path, sql, params, executor=executor)  # type: ignore[arg-type]
+            return
+        with get_connection(db_path) as conn, conn:
+            conn.execute(sql, params)
+    finally:
+        invalidate_alias_cache()
 
 
 def get_alias(
@@ -402,30 +617,36 @@ def get_alias(
     *,
     executor: Executor | None = None,
 ) -> ImageAlias | None:
-    """Get an image alias."""
-    sql = "SELECT alias, image, tag, set_at FROM image_aliases WHERE alias = ?"
-    params = (alias.upper(),)
+    """Get an image alias.
+
+    Results are memoized per process until the next alias write; see
+    :func:`invalidate_alias_cache`.  The returned ImageAlias is frozen, so
+    callers cannot alter what later lookups see.
+    """
+    key = (str(db_path), executor, alias.upper())
+    if key in _alias_cache:
+        return _alias_cache[key]
+
+    sql = _SQL_SELECT_ALIAS
+    params = (key[2],)
+    result = None
     if _is_remote(executor):
         rows = _remote_query(db_path, sql, params, executor=executor)  # type: ignore[arg-type]
         if rows:
             row = rows[0]
-            return ImageAlias(
+            result = ImageAlias(
                 alias=row["alias"],
                 image=row["image"],
                 tag=row["tag"],
                 set_at=row["set_at"],
             )
-        return None
-    with get_connection(db_path) as conn:
-        row = conn.execute(sql, params).fetchone()
-        if row:
-            return ImageAlias(
-                alias=row["alias"],
-                image=row["image"],
-                tag=row["tag"],
-                set_at=row["set_at"],
-            )
-        return None
+    else:
+        with get_connection(db_path) as conn:
+            rows = _fetch_tuples(conn, sql, params)
+        if rows:
+            result = ImageAlias(*rows[0])
+    _alias_cache[key] = result
+    return result
 
 
 def get_all_aliases(
@@ -447,16 +668,8 @@ def get_all_aliases(
             for row in rows
         ]
     with get_connection(db_path) as conn:
-        rows = conn.execute(sql).fetchall()
-        return [
-            ImageAlias(
-                alias=row["alias"],
-                image=row["image"],
-                tag=row["tag"],
-                set_at=row["set_at"],
-            )
-            for row in rows
-        ]
+        rows = _fetch_tuples(conn, sql)
+    return [ImageAlias(*row) for row in rows]
 
 
 def get_current_image(
@@ -483,6 +696,33 @@ def get_rollback_image(
     return None
 
 
+def _promote_statements(
+    previous: tuple[str, str] | None,
+    image: str,
+    tag: str,
+    action: str,
+    notes: str,
+) -> list[tuple[str, tuple]]:
+    """Writes that make (image, tag) CURRENT, demoting *previous* to ROLLBACK."""
+    statements: list[tuple[str, tuple]] = []
+    if previous:
+        statements.append((_SQL_UPSERT_ALIAS, ("ROLLBACK", *previous)))
+    statements.append((_SQL_UPSERT_ALIAS, ("CURRENT", image, tag)))
+    statements.append((_SQL_INSERT_DEPLOYMENT, (None, image, tag, action, 1, notes)))
+    return statements
+
+
+def _remote_execute_all(
+    db_path: Path,
+    statements: list[tuple[str, tuple]],
+    *,
+    executor: Executor,
+) -> None:
+    """Run several writes on a remote host as one transaction, one sqlite3 call."""
+    body = "".join(f"{_interpolate_params(sql, params).strip()};\n" for sql, params in statements)
+    _remote_execute(db_path, f"BEGIN IMMEDIATE;\n{body}COMMIT;", executor=executor)
+
+
 def set_current(
     db_path: Path,
     image: str,
@@ -492,32 +732,30 @@ def set_current(
 ) -> str | None:
     """Set CURRENT alias, moving previous CURRENT to ROLLBACK.
 
+    The alias moves and the timeline entry are written in one transaction.
+
     Returns the previous CURRENT tag (now ROLLBACK), or None if no previous.
     """
-    # Get current before updating
-    previous = get_current_image(db_path, executor=executor)
-    previous_tag = None
 
-    if previous:
-        prev_image, prev_tag = previous
-        # Move current to rollback
-        set_alias(db_path, "ROLLBACK", prev_image, prev_tag, executor=executor)
-        previous_tag = prev_tag
-
-    # Set new current
-    set_alias(db_path, "CURRENT", image, tag, executor=executor)
-
-    # Record the action
-    record_deployment(
-        db_path,
-        image=image,
-        tag=tag,
-        action="set-current",
-        notes=f"Previous: {previous_tag}" if previous_tag else "Initial current",
-        executor=executor,
-    )
+    def statements(previous: tuple[str, str] | None) -> list[tuple[str, tuple]]:
+        notes = f"Previous: {previous[1]}" if previous else "Initial current"
+        return _promote_statements(previous, image, tag, "set-current", notes)
+
+    if _is_remote(executor):
+        previous = get_current_image(db_path, executor=executor)
+        _remote_execute_all(db_path, statements(previous), executor=executor)  # type: ignore[arg-type]
+    else:
+        with get_connection(db_path) as conn, conn:
+            # IMMEDIATE takes the write lock up front so the CURRENT we read
+            # is still CURRENT when we demote it.
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(_SQL_SELECT_ALIAS, ("CURRENT",)).fetchone()
+            previous = (row["image"], row["tag"]) if row else None
+            for sql, params in statements(previous):
+                conn.execute(sql, params)
+    invalidate_alias_cache()
 
-    return previous_tag
+    return previous[1] if previous else None
 
 
 def rollback(
@@ -531,52 +769,56 @@ def rollback(
     deployment, NOT the ROLLBACK alias. This ensures consecutive rollbacks
     work correctly by walking back through history.
 
+    The alias moves and the timeline entry are written in one transaction.
+
     Returns (image, tag) of the new CURRENT, or None if no rollback available.
     """
+    # One round trip for both reads: the last two distinct successful
+    # deployments ('timeline' rows, newest first) plus the CURRENT alias.
     sql = """
-        SELECT image, tag, MAX(id) as last_id
-        FROM deployments
-        WHERE success = 1
-          AND action IN ('deploy', 'redeploy', 'set-current')
-        GROUP BY image, tag
+        WITH recent AS (
+            SELECT image, tag, MAX(id) AS last_id
+            FROM deployments
+            WHERE success = 1
+              AND action IN ('deploy', 'redeploy', 'set-current')
+            GROUP BY image, tag
+            ORDER BY last_id DESC
+            LIMIT 2
+        )
+        SELECT 'timeline' AS source, image, tag, last_id FROM recent
+        UNION ALL
+        SELECT 'alias' AS source, image, tag, NULL FROM image_aliases WHERE alias = 'CURRENT'
         ORDER BY last_id DESC
-        LIMIT 2
     """
 
-    if _is_remote(executor):
-        rows = _remote_query(db_path, sql, executor=executor)  # type: ignore[arg-type]
-    else:
-        with get_connection(db_path) as conn:
-            rows = [dict(r) for r in conn.execute(sql).fetchall()]
-
-    if len(rows) < 2:
-        return None
-
-    # rows[0] is current (most recent), rows[1] is what we want to roll back to
-    rollback_image = rows[1]["image"]
-    rollback_tag = rows[1]["tag"]
-
-    # Get what we're rolling back from
-    current = get_current_image(db_path, executor=executor)
-    current_tag = current[1] if current else "unknown"
-
-    # Update aliases - CURRENT becomes ROLLBACK, then new tag becomes CURRENT
-    if current:
-        set_alias(db_path, "ROLLBACK", current[0], current[1], executor=executor)
+    def split(rows: list) -> tuple[list, tuple[str, str] | None]:
+        timeline = [r for r in rows if r["source"] == "timeline"]
+        current = next(((r["image"], r["tag"]) for r in rows if r["source"] == "alias"), None)
+        return timeline, current
 
-    set_alias(db_path, "CURRENT", rollback_image, rollback_tag, executor=executor)
+    def statements(target, current: tuple[str, str] | None) -> list[tuple[str, tuple]]:
+        current_tag = current[1] if current else "unknown"
+        return _promote_statements(
+            current, target["image"], target["tag"], "rollback", f"Rolled back from {current_tag}"
+        )
 
-    # Record the rollback action
-    record_deployment(
-        db_path,
-        image=rollback_image,
-        tag=rollback_tag,
-        action="rollback",
-        notes=f"Rolled back from {current_tag}",
-        executor=executor,
-    )
+    if _is_remote(executor):
+        timeline, current = split(_remote_query(db_path, sql, executor=executor))  # type: ignore[arg-type]
+        if len(timeline) < 2:
+            return None
+        _remote_execute_all(db_path, statements(timeline[1], current), executor=executor)  # type: ignore[arg-type]
+    else:
+        with get_connection(db_path) as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            timeline, current = split(conn.execute(sql).fetchall())
+            if len(timeline) < 2:
+                return None
+            for stmt, params in statements(timeline[1], current):
+                conn.execute(stmt, params)
+    invalidate_alias_cache()
 
-    return (rollback_image, rollback_tag)
+    # timeline[0] is current (most recent), timeline[1] is what we roll back to
+    return (timeline[1]["image"], timeline[1]["tag"])
 
 
 def get_previous_tags(
@@ -590,7 +832,7 @@ def get_previous_tags(
     Used for displaying rollback options. Returns list of (image, tag, timestamp).
     """
     sql = """
-        SELECT DISTINCT image, tag, MAX(timestamp) as last_used
+        SELECT image, tag, MAX(timestamp) as last_used
         FROM deployments
         WHERE success = 1
           AND action IN ('deploy', 'redeploy', 'set-current')
@@ -669,10 +911,8 @@ def record_service_instance(
     if _is_remote(executor):
         _remote_execute(db_path, sql, params, executor=executor)  # type: ignore[arg-type]
         return 0  # Remote doesn't return lastrowid
-    with get_connection(db_path) as conn:
-        cursor = conn.execute(sql, params)
-        conn.commit()
-        return cursor.lastrowid or 0
+    with get_connection(db_path) as conn, conn:
+        return _insert_returning_id(conn, sql, params)
 
 
 def get_service_instance(
@@ -706,20 +946,8 @@ def get_service_instance(
             )
         return None
     with get_connection(db_path) as conn:
-        row = conn.execute(sql, params).fetchone()
-        if row:
-            return ServiceInstance(
-                id=row["id"],
-                package=row["package"],
-                instance=row["instance"],
-                config_file=row["config_file"],
-                data_dir=row["data_dir"],
-                port=row["port"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                notes=row["notes"],
-            )
-        return None
+        rows = _fetch_tuples(conn, sql, params)
+    return ServiceInstance(*rows[0]) if rows else None
 
 
 def get_service_instances(
@@ -765,21 +993,9 @@ def get_service_instances(
         ]
 
     with get_connection(db_path) as conn:
-        rows = conn.execute(sql, params).fetchall()
-        return [
-            ServiceInstance(
-                id=row["id"],
-                package=row["package"],
-                instance=row["instance"],
-                config_file=row["config_file"],
-                data_dir=row["data_dir"],
-                port=row["port"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                notes=row["notes"],
-            )
-            for row in rows
-        ]
+        rows = _fetch_tuples(conn, sql, params)
+    # Columns are selected in ServiceInstance field order
+    return [ServiceInstance(*row) for row in rows]
 
 
 def delete_service_instance(
@@ -802,12 +1018,22 @@ def delete_service_instance(
             return False
         _remote_execute(db_path, sql, params, executor=executor)  # type: ignore[arg-type]
         return True
-    with get_connection(db_path) as conn:
+    with get_connection(db_path) as conn, conn:
         cursor = conn.execute(sql, params)
-        conn.commit()
         return cursor.rowcount > 0
 
 
+_SQL_INSERT_SERVICE_ACTION = """
+    INSERT INTO service_actions (package, instance, action, success, notes)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_SERVICE_ACTION_AT = """
+    INSERT INTO service_actions (timestamp, package, instance, action, success, notes)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
 def record_service_action(
     db_path: Path,
     package: str,
@@ -819,18 +1045,42 @@ def record_service_action(
     executor: Executor | None = None,
 ) -> int:
     """Record a service action to the audit trail. Returns the action ID."""
-    sql = """
-        INSERT INTO service_actions (package, instance, action, success, notes)
-        VALUES (?, ?, ?, ?, ?)
-    """
+    sql = _SQL_INSERT_SERVICE_ACTION
     params = (package, instance, action, 1 if success else 0, notes)
     if _is_remote(executor):
         _remote_execute(db_path, sql, params, executor=executor)  # type: ignore[arg-type]
         return 0  # Remote doesn't return lastrowid
-    with get_connection(db_path) as conn:
-        cursor = conn.execute(sql, params)
-        conn.commit()
-        return cursor.lastrowid or 0
+    with get_connection(db_path) as conn, conn:
+        return _insert_returning_id(conn, sql, params)
+
+
+def record_service_actions_bulk(
+    db_path: Path,
+    rows: Iterable[tuple[str, str, str, bool, str | None]],
+    *,
+    executor: Executor | None = None,
+) -> int:
+    """Record several service actions in one transaction.
+
+    Each row is ``(package, instance, action, success, notes)``.  Returns
+    the number of rows recorded.  All rows share one timestamp, taken once
+    for the batch.
+    """
+    ts = _utc_timestamp()
+    params = [
+        (ts, package, instance, action, 1 if success else 0, notes)
+        for package, instance, action, success, notes in rows
+    ]
+    if not params:
+        return 0
+    if _is_remote(executor):
+        statements = [(_SQL_INSERT_SERVICE_ACTION_AT, p) for p in params]
+        _remote_execute_all(db_path, statements, executor=executor)  # type: ignore[arg-type]
+        return len(params)
+    with get_connection(db_path) as conn, conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(_SQL_INSERT_SERVICE_ACTION_AT, params)
+    return len(params)
 
 
 def get_service_actions(
@@ -878,19 +1128,11 @@ def get_service_actions(
         ]
 
     with get_connection(db_path) as conn:
-        rows = conn.execute(sql, params).fetchall()
-        return [
-            ServiceAction(
-                id=row["id"],
-                timestamp=row["timestamp"],
-                package=row["package"],
-                instance=row["instance"],
-                action=row["action"],
-                success=bool(row["success"]),
-                notes=row["notes"],
-            )
-            for row in rows
-        ]
+        rows = _fetch_tuples(conn, sql, params)
+    return [
+        ServiceAction(id_, timestamp, pkg, inst, action, bool(success), notes)
+        for id_, timestamp, pkg, inst, action, success, notes in rows
+    ]
 
 
 # =============================================================================
@@ -949,10 +1191,8 @@ def record_dns_action(
     if _is_remote(executor):
         _remote_execute(db_path, sql, params, executor=executor)  # type: ignore[arg-type]
         return 0  # Remote doesn't return lastrowid
-    with get_connection(db_path) as conn:
-        cursor = conn.execute(sql, params)
-        conn.commit()
-        return cursor.lastrowid or 0
+    with get_connection(db_path) as conn, conn:
+        return _insert_returning_id(conn, sql, params)
 
 
 def upsert_dns_current(
@@ -980,9 +1220,8 @@ def upsert_dns_current(
     if _is_remote(executor):
         _remote_execute(db_path, sql, params, executor=executor)  # type: ignore[arg-type]
         return
-    with get_connection(db_path) as conn:
+    with get_connection(db_path) as conn, conn:
         conn.execute(sql, params)
-        conn.commit()
 
 
 def get_dns_current(
@@ -1012,17 +1251,8 @@ def get_dns_current(
             )
         return None
     with get_connection(db_path) as conn:
-        row = conn.execute(sql, params).fetchone()
-        if row:
-            return DnsCurrent(
-                hostname=row["hostname"],
-                record_type=row["record_type"],
-                value=row["value"],
-                ttl=row["ttl"],
-                provider=row["provider"],
-                updated_at=row["updated_at"],
-            )
-        return None
+        rows = _fetch_tuples(conn, sql, params)
+    return DnsCurrent(*rows[0]) if rows else None
 
 
 def get_all_dns_current(
@@ -1128,7 +1358,6 @@ def delete_dns_current(
     if _is_remote(executor):
         _remote_execute(db_path, sql, params, executor=executor)  # type: ignore[arg-type]
         return True
-    with get_connection(db_path) as conn:
+    with get_connection(db_path) as conn, conn:
         cursor = conn.execute(sql, params)
-        conn.commit()
         return cursor.rowcount > 0
@@ -15,8 +15,8 @@ Convention:
 
 from __future__ import annotations
 
+import functools
 import logging
-import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -40,16 +40,14 @@ def _get_executor(executor: Executor | None = None) -> Executor:
     return LocalExecutor()
 
 
-# Regex to parse env file lines: KEY=VALUE or KEY="VALUE" or KEY='VALUE'
-ENV_LINE_PATTERN = re.compile(r"^(?P<key>[A-Za-z_][A-Za-z0-9_]*)=(?P<value>.*)$")
-
-# Pattern for quoted values
-QUOTED_VALUE_PATTERN = re.compile(r'^(["\'])(.*)(\1)$')
-
 SECRET_NAMES_KEY = "SECRET_VARIABLE_NAMES"
 SECRET_PREFIX = "ots_"
 
 
+# Both conversions are pure and see the same few names (those listed in
+# SECRET_VARIABLE_NAMES) many times per run; bounded because the names come
+# from user files.
+@functools.lru_cache(maxsize=512)
 def env_var_to_secret_name(var_name: str) -> str:
     """Convert environment variable name to podman secret name.
 
@@ -58,6 +56,7 @@ def env_var_to_secret_name(var_name: str) -> str:
     return f"{SECRET_PREFIX}{var_name.lower()}"
 
 
+@functools.lru_cache(maxsize=512)
 def secret_name_to_env_var(secret_name: str) -> str:
     """Convert podman secret name back to environment variable name.
 
@@ -68,6 +67,13 @@ def secret_name_to_env_var(secret_name: str) -> str:
     return secret_name.upper()
 
 
+def _unquote(value: str) -> str:
+    """Strip one pair of matching outer quotes ('...' or "...") if present."""
+    if len(value) >= 2 and value[0] in "\"'" and value[-1] == value[0]:
+        return value[1:-1]
+    return value
+
+
 def parse_secret_variable_names(value: str) -> list[str]:
     """Parse SECRET_VARIABLE_NAMES value supporting multiple delimiters.
 
@@ -83,10 +89,7 @@ def parse_secret_variable_names(value: str) -> list[str]:
         return []
 
     # Strip outer quotes if present
-    value = value.strip()
-    match = QUOTED_VALUE_PATTERN.match(value)
-    if match:
-        value = match.group(2)
+    value = _unquote(value.strip())
 
     # Try each delimiter in order of precedence
     for delimiter in [",", " ", ":"]:
@@ -97,7 +100,7 @@ def parse_secret_variable_names(value: str) -> list[str]:
     return [value.strip()] if value.strip() else []
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvEntry:
     """Represents a single entry in an environment file."""
 
@@ -115,6 +118,14 @@ class EnvFile:
     path: Path
     entries: list[EnvEntry] = field(default_factory=list)
     _variables: dict[str, str] = field(default_factory=dict, repr=False)
+    # key -> first entry with that key; built on first use, see _entries_by_key
+    _entry_index: dict[str, EnvEntry] | None = field(default=None, repr=False, compare=False)
+    # keys that appear on more than one entry; maintained with _entry_index
+    _duplicate_keys: set[str] = field(default_factory=set, repr=False, compare=False)
+    # (raw SECRET_VARIABLE_NAMES value, names parsed from it)
+    _secret_names_cache: tuple[str, list[str]] | None = field(
+        default=None, repr=False, compare=False
+    )
 
     @classmethod
     def parse(cls, path: Path | str, *, executor: Executor | None = None) -> EnvFile:
@@ -123,68 +134,52 @@ class EnvFile:
         Preserves comments and blank lines for round-trip editing.
         """
         path = Path(path)
-        entries: list[EnvEntry] = []
-        variables: dict[str, str] = {}
 
         if _is_remote(executor):
             result = executor.run(["test", "-f", str(path)])  # type: ignore[union-attr]
             if not result.ok:
-                return cls(path=path, entries=entries, _variables=variables)
+                return cls(path=path)
             result = executor.run(["cat", str(path)])  # type: ignore[union-attr]
             if not result.ok:
-                return cls(path=path, entries=entries, _variables=variables)
+                return cls(path=path)
             text = result.stdout
         else:
             if not path.exists():
-                return cls(path=path, entries=entries, _variables=variables)
+                return cls(path=path)
             text = path.read_text()
 
-        for line in text.splitlines():
-            raw_line = line
-            line = line.strip()
+        entries: list[EnvEntry] = []
+        append = entries.append
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
 
             # Blank line
             if not line:
-                entries.append(EnvEntry(key="", value="", raw_line=raw_line))
+                append(EnvEntry(key="", value="", raw_line=raw_line))
                 continue
 
-            # Full comment line
-            if line.startswith("#"):
-                entries.append(
-                    EnvEntry(
-                        key="",
-                        value="",
-                        comment=line,
-                        is_comment_line=True,
-                        raw_line=raw_line,
-                    )
+            # KEY=VALUE, KEY="VALUE" or KEY='VALUE'.  The key runs up to the
+            # first "=" and must be [A-Za-z_][A-Za-z0-9_]*, which for ASCII
+            # text is exactly str.isidentifier().
+            if line[0] != "#":
+                key, sep, value = line.partition("=")
+                if sep and key.isascii() and key.isidentifier():
+                    append(EnvEntry(key=key, value=_unquote(value), raw_line=raw_line))
+                    continue
+
+            # Full comment line, or unparseable line preserved as comment
+            append(
+                EnvEntry(
+                    key="",
+                    value="",
+                    comment=line,
+                    is_comment_line=True,
+                    raw_line=raw_line,
                 )
-                continue
-
-            # Try to parse as KEY=VALUE
-            match = ENV_LINE_PATTERN.match(line)
-            if match:
-                key = match.group("key")
-                value = match.group("value")
+            )
 
-                # Strip quotes from value if present
-                quoted_match = QUOTED_VALUE_PATTERN.match(value)
-                if quoted_match:
-                    value = quoted_match.group(2)
-
-                entries.append(EnvEntry(key=key, value=value, raw_line=raw_line))
-                variables[key] = value
-            else:
-                # Unparseable line, preserve as comment
-                entries.append(
-                    EnvEntry(
-                        key="",
-                        value="",
-                        comment=line,
-                        is_comment_line=True,
-                        raw_line=raw_line,
-                    )
-                )
+        # Only KEY=VALUE entries have a key; a repeated key keeps its last value.
+        variables = {entry.key: entry.value for entry in entries if entry.key}
 
         return cls(path=path, entries=entries, _variables=variables)
 
@@ -192,21 +187,44 @@ class EnvFile:
         """Get a variable value."""
         return self._variables.get(key, default)
 
+    def _entries_by_key(self) -> dict[str, EnvEntry]:
+        """Return the key -> first entry index, building it on first use.
+
+        Built lazily rather than in parse() so an EnvFile constructed with
+        entries directly is indexed from what it holds.  Once built, only
+        set/remove/rename keep it in step: code that replaces ``entries``
+        afterwards must reset ``_entry_index`` to None.
+        """
+        index = self._entry_index
+        if index is None:
+            index = {}
+            duplicates: set[str] = set()
+            for entry in self.entries:
+                if entry.key and index.setdefault(entry.key, entry) is not entry:
+                    duplicates.add(entry.key)
+            self._entry_index = index
+            self._duplicate_keys = duplicates
+        return index
+
     def set(self, key: str, value: str) -> None:
         """Set or update a variable value."""
         self._variables[key] = value
+        index = self._entries_by_key()
         # Update existing entry or add new one
-        for entry in self.entries:
-            if entry.key == key:
-                entry.value = value
-                return
-        # Add new entry
-        self.entries.append(EnvEntry(key=key, value=value, raw_line=f"{key}={value}"))
+        entry = index.get(key)
+        if entry is not None:
+            entry.value = value
+            return
+        entry = EnvEntry(key=key, value=value, raw_line=f"{key}={value}")
+        self.entries.append(entry)
+        index[key] = entry
 
     def remove(self, key: str) -> str | None:
         """Remove a variable, returning its value if it existed."""
         value = self._variables.pop(key, None)
-        self.entries = [e for e in self.entries if e.key != key]
+        if self._entries_by_key().pop(key, None) is not None:
+            self.entries = [e for e in self.entries if e.key != key]
+            self._duplicate_keys.discard(key)
         return value
 
     def rename(self, old_key: str, new_key: str, new_value: str | None = None) -> bool:
@@ -229,14 +247,26 @@ class EnvFile:
         self._variables[new_key] = final_value
 
         # Update entry in place (preserving position)
-        for entry in self.entries:
-            if entry.key == old_key:
-                entry.key = new_key
-                entry.value = final_value
-                entry.raw_line = f"{new_key}={final_value}"
-                return True
-
-        return False
+        index = self._entries_by_key()
+        entry = index.pop(old_key, None)
+        if entry is None:
+            return False
+        entry.key = new_key
+        entry.value = final_value
+        entry.raw_line = f"{new_key}={final_value}"
+
+        # Only a known duplicate needs the tail scanned for old_key's next entry.
+        if old_key in self._duplicate_keys:
+            entries = self.entries
+            start = next(i for i, e in enumerate(entries) if e is entry) + 1
+            rest = [e for e in entries[start:] if e.key == old_key]
+            if rest:
+                index[old_key] = rest[0]
+            if len(rest) < 2:
+                self._duplicate_keys.discard(old_key)
+        if index.setdefault(new_key, entry) is not entry:
+            self._duplicate_keys.add(new_key)
+        return True
 
     def has(self, key: str) -> bool:
         """Check if a variable exists."""
@@ -244,8 +274,17 @@ class EnvFile:
 
     @property
     def secret_variable_names(self) -> list[str]:
-        """Get the list of secret variable names from SECRET_VARIABLE_NAMES."""
-        return parse_secret_variable_names(self.get(SECRET_NAMES_KEY))
+        """Get the list of secret variable names from SECRET_VARIABLE_NAMES.
+
+        The parse is cached against the raw value, so it is redone only
+        after SECRET_VARIABLE_NAMES changes, however it was changed.
+        """
+        raw = self.get(SECRET_NAMES_KEY)
+        cached = self._secret_names_cache
+        if cached is None or cached[0] != raw:
+            cached = (raw, parse_secret_variable_names(raw))
+            self._secret_names_cache = cached
+        return list(cached[1])
 
     def iter_variables(self) -> Iterator[tuple[str, str]]:
         """Iterate over all variables as (key, value) pairs."""
@@ -282,7 +321,7 @@ class EnvFile:
             path.write_text(content)
 
 
-@dataclass
+@dataclass(slots=True)
 class SecretSpec:
     """Specification for a secret to be created/managed."""
 
@@ -310,11 +349,14 @@ def is_processed_secret_entry(key: str, value: str) -> bool:
 
     Post-processed secrets have format: _VARNAME=ots_varname
     """
-    if not key.startswith("_"):
+    if not key.startswith("_") or not value.startswith(SECRET_PREFIX):
+        return False
+    # The secret name swaps the "_" for SECRET_PREFIX, so the lengths must
+    # agree; checking that first keeps mismatches out of the name cache.
+    if len(value) != len(SECRET_PREFIX) + len(key) - 1:
         return False
     original_name = key[1:]  # Remove underscore prefix
-    expected_secret = env_var_to_secret_name(original_name)
-    return value == expected_secret
+    return value == env_var_to_secret_name(original_name)
 
 
 def extract_secrets(env_file: EnvFile) -> tuple[list[SecretSpec], list[str]]:
@@ -384,11 +426,19 @@ def process_env_file(
     secrets, messages = extract_secrets(env_file)
     file_modified = False
 
+    # One `podman secret ls` up front instead of a `podman secret exists`
+    # per secret; None falls back to the per-secret check.
+    existing: set[str] | None = None
+    if create_secrets and not dry_run and any(spec.value is not None for spec in secrets):
+        existing = existing_secret_names(executor=executor)
+
     for spec in secrets:
         if spec.value is not None:
             # Has a value to process - this secret needs extraction
             if create_secrets and not dry_run:
-                action = ensure_podman_secret(spec.secret_name, spec.value, executor=executor)
+                action = ensure_podman_secret(
+                    spec.secret_name, spec.value, executor=executor, existing=existing
+                )
                 messages.append(f"Podman secret {action}: {spec.secret_name}")
 
             # Transform the entry in env file (in place, preserving position)
@@ -405,13 +455,22 @@ def process_env_file(
     return secrets, messages
 
 
-def ensure_podman_secret(secret_name: str, value: str, *, executor: Executor | None = None) -> str:
+def ensure_podman_secret(
+    secret_name: str,
+    value: str,
+    *,
+    executor: Executor | None = None,
+    existing: set[str] | None = None,
+) -> str:
     """Create or replace a podman secret.
 
     Args:
         secret_name: Name for the secret
         value: Secret value
         executor: Optional executor for remote operations
+        existing: Secret names already present, from :func:`existing_secret_names`.
+            When given, it replaces the ``podman secret exists`` check and is
+            updated with *secret_name* once created.
 
     Returns:
         "created" if new, "replaced" if existing was overwritten
@@ -421,22 +480,43 @@ def ensure_podman_secret(secret_name: str, value: str, *, executor: Executor | N
     require_podman(executor=executor)
 
     ex = _get_executor(executor)
-    result = ex.run(["podman", "secret", "exists", secret_name], timeout=15)
-    existed = result.ok
-
-    if existed:
-        ex.run(["podman", "secret", "rm", secret_name], check=True, timeout=15)
-
+    if existing is None:
+        result = ex.run(["podman", "secret", "exists", secret_name], timeout=15)
+        existed = result.ok
+    else:
+        existed = secret_name in existing
+
+    # --replace swaps an existing secret in one call, instead of a separate
+    # `podman secret rm` (and no window where the secret is missing).
+    replace = ["--replace"] if existed else []
     ex.run(
-        ["podman", "secret", "create", secret_name, "-"],
+        ["podman", "secret", "create", *replace, secret_name, "-"],
         input=value,
         check=True,
         timeout=30,
     )
+    if existing is not None:
+        existing.add(secret_name)
 
     return "replaced" if existed else "created"
 
 
+def existing_secret_names(*, executor: Executor | None = None) -> set[str] | None:
+    """Return the names of all podman secrets, from a single ``podman secret ls``.
+
+    Returns None if the listing fails (e.g. podman unavailable), so callers
+    can fall back to per-secret checks.
+    """
+    try:
+        ex = _get_executor(executor)
+        result = ex.run(["podman", "secret", "ls", "--format", "{{.Name}}"], timeout=15)
+    except Exception:
+        return None
+    if not result.ok:
+        return None
+    return {name for name in (line.strip() for line in result.stdout.splitlines()) if name}
+
+
 def secret_exists(secret_name: str, *, executor: Executor | None = None) -> bool:
     """Check if a podman secret exists. Returns False if podman is unavailable."""
     try:
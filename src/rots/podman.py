@@ -101,13 +101,22 @@ class Podman:
 
         Converts underscores to hyphens for subcommand names.
         Supports nested subcommands like podman.volume.create().
+
+        The child is stored as an instance attribute, so later accesses
+        (``p.secret`` on every call) find it directly and this method runs
+        once per name.  Private names are never subcommands; rejecting them
+        keeps copy/pickle/mock probing from creating bogus children.
         """
+        if name.startswith("_"):
+            raise AttributeError(name)
         subcommand = name.replace("_", "-")
-        return Podman(
+        child = Podman(
             executable=self.executable,
             _subcommand=[*self._subcommand, subcommand],
             executor=self._executor,
         )
+        setattr(self, name, child)
+        return child
 
 
 # Module-level singleton for local-only commands (image pull/push/build/tag).
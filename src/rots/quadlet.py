@@ -10,6 +10,8 @@ SECRET_VARIABLE_NAMES defined in the environment file.
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -18,6 +20,7 @@ from ots_shared.ssh import is_remote as _is_remote
 from . import systemd
 from .config import Config
 from .environment_file import (
+    SecretSpec,
     generate_quadlet_secret_lines,
     get_secrets_from_env_file,
     secret_exists,
@@ -122,6 +125,25 @@ WantedBy=multi-user.target
 """
 
 
+# Parsed secret specs per local env file: path -> (st_mtime_ns, st_size, specs).
+# Writing the web, worker and scheduler templates reads the same env file
+# once each; any edit changes the stat and replaces the file's single entry.
+# Only the parse is cached; podman secret existence is re-checked every call.
+_env_secrets_cache: dict[str, tuple[int, int, list[SecretSpec]]] = {}
+
+
+def _parsed_env_secrets(env_path: Path, st: os.stat_result) -> list[SecretSpec]:
+    """Return secret specs for a local env file, memoized on its stat."""
+    key = str(env_path)
+    cached = _env_secrets_cache.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        secrets = cached[2]
+    else:
+        secrets = get_secrets_from_env_file(env_path)
+        _env_secrets_cache[key] = (st.st_mtime_ns, st.st_size, secrets)
+    return list(secrets)
+
+
 def get_secrets_section(
     env_file_path: Path | None = None,
     *,
@@ -150,11 +172,17 @@ def get_secrets_section(
     """
     env_path = env_file_path or DEFAULT_ENV_FILE
 
+    env_stat: os.stat_result | None = None
     if _is_remote(executor):
         result = executor.run(["test", "-f", str(env_path)])  # type: ignore[union-attr]
         env_exists = result.ok
     else:
-        env_exists = env_path.exists()
+        try:
+            env_stat = env_path.stat()
+        except OSError:
+            env_exists = False
+        else:
+            env_exists = True
 
     if not env_exists:
         msg = (
@@ -180,7 +208,10 @@ def get_secrets_section(
         logger.error(msg)
         raise SystemExit(_EXIT_PRECOND)
 
-    secrets = get_secrets_from_env_file(env_path, executor=executor)
+    if env_stat is not None:
+        secrets = _parsed_env_secrets(env_path, env_stat)
+    else:
+        secrets = get_secrets_from_env_file(env_path, executor=executor)
     if not secrets:
         msg = (
             f"No secrets configured in {env_path}\n"
@@ -334,8 +365,8 @@ def _build_fmt_vars(
 ) -> dict:
     """Build the format variables dict for a quadlet template.
 
-    Shared by both ``_write_template`` (which writes to disk) and
-    ``render_template`` (dry-run, no disk I/O).
+    Shared by ``write_all_templates`` (which writes to disk) and the
+    ``render_*_template`` functions (dry-run, no disk I/O).
     """
     secrets_section = get_secrets_section(env_file_path, force=force, executor=executor)
     config_volumes_section = get_config_volumes_section(cfg, executor=executor)
@@ -403,45 +434,64 @@ def render_scheduler_template(
     return SCHEDULER_TEMPLATE.format(**fmt_vars)
 
 
-def _write_template(
-    template: str,
-    path: Path,
-    cfg: Config,
-    env_file_path: Path | None,
-    *,
-    force: bool,
-    extra_vars: dict | None = None,
-    executor: Executor | None = None,
-) -> None:
-    """Shared implementation for writing a quadlet template to disk.
+# Creates the parent directory ($1) and writes stdin to the file ($2).
+_REMOTE_WRITE_SCRIPT = 'mkdir -p "$1" && cat > "$2"'
 
-    Resolves the secrets section and config volumes section, formats the
-    template string, writes the file, and triggers a systemd daemon-reload.
 
-    Args:
-        template: Template string containing ``{image}``, ``{config_dir}``,
-                  ``{secrets_section}``, ``{config_volumes_section}``, and
-                  any keys in *extra_vars*.
-        path: Destination file path (parent dirs created if absent).
-        cfg: Configuration object.
-        env_file_path: Optional override for the environment file location.
-        force: Pass ``force=True`` to ``get_secrets_section`` to allow deploy
-               without secrets.
-        extra_vars: Additional ``str.format`` keyword arguments (e.g.
-                    ``valkey_after``, ``valkey_wants`` for the web template).
-        executor: Optional executor for remote file writes.
+def _write_if_changed(path: Path, content: str, *, executor: Executor | None = None) -> bool:
+    """Write *content* to *path* unless the file already holds exactly that.
+
+    The rendered unit is its own content address: when it matches what is
+    on disk there is nothing for quadlet to regenerate, so callers can skip
+    the ``daemon-reload`` as well.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
     """
-    fmt_vars = _build_fmt_vars(
-        cfg, env_file_path, force=force, extra_vars=extra_vars, executor=executor
-    )
-    content = template.format(**fmt_vars)
     if _is_remote(executor):
-        executor.run(["mkdir", "-p", str(path.parent)])  # type: ignore[union-attr]
-        executor.run(["tee", str(path)], input=content)  # type: ignore[union-attr]
-    else:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
-    systemd.daemon_reload(executor=executor)
+        current = executor.run(["cat", str(path)])  # type: ignore[union-attr]
+        if current.ok and current.stdout == content:
+            logger.info(f"[skip] {path} unchanged")
+            return False
+        # One round trip for mkdir + write instead of separate mkdir and tee.
+        executor.run(  # type: ignore[union-attr]
+            ["sh", "-c", _REMOTE_WRITE_SCRIPT, "sh", str(path.parent), str(path)],
+            input=content,
+        )
+        return True
+
+    try:
+        if path.read_text() == content:
+            logger.info(f"[skip] {path} unchanged")
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return True
+
+
+def _unit_name(path: Path) -> str:
+    """Return the service quadlet generates from the unit file at *path*."""
+    if path.suffix == ".image":
+        return f"{path.stem}-image.service"
+    return f"{path.stem}.service"
+
+
+def _reload_pending(paths: list[Path], *, executor: Executor | None = None) -> bool:
+    """Check whether systemd still runs an older version of any unit in *paths*.
+
+    An unchanged file is only proof of an up-to-date unit if the last
+    ``daemon-reload`` succeeded.  Quadlet points ``SourcePath=`` at the unit
+    file, so systemd reports ``NeedDaemonReload`` while it holds a stale copy.
+    """
+    if not paths:
+        return False
+    props = systemd.show_properties(
+        [_unit_name(path) for path in paths], ["NeedDaemonReload"], executor=executor
+    )
+    # systemctl prints yes/no, the D-Bus backend stringifies a bool.
+    return any(unit.get("NeedDaemonReload") in ("yes", "True") for unit in props.values())
 
 
 def write_web_template(
@@ -459,18 +509,7 @@ def write_web_template(
         force: If True, allow deployment even when secrets are not configured.
         executor: Optional executor for remote writes.
     """
-    if cfg.registry:
-        write_image_template(cfg, executor=executor)
-    valkey_after, valkey_wants = _get_valkey_unit_dependencies(cfg)
-    _write_template(
-        WEB_TEMPLATE,
-        cfg.web_template_path,
-        cfg,
-        env_file_path,
-        force=force,
-        extra_vars={"valkey_after": valkey_after, "valkey_wants": valkey_wants},
-        executor=executor,
-    )
+    write_all_templates(cfg, env_file_path, unit_types=("web",), force=force, executor=executor)
 
 
 # Worker quadlet template - for background job processing (Sneakers/RabbitMQ)
@@ -573,16 +612,7 @@ def write_worker_template(
         force: If True, allow deployment even when secrets are not configured.
         executor: Optional executor for remote writes.
     """
-    if cfg.registry:
-        write_image_template(cfg, executor=executor)
-    _write_template(
-        WORKER_TEMPLATE,
-        cfg.worker_template_path,
-        cfg,
-        env_file_path,
-        force=force,
-        executor=executor,
-    )
+    write_all_templates(cfg, env_file_path, unit_types=("worker",), force=force, executor=executor)
 
 
 # Scheduler quadlet template - for cron-like job scheduling
@@ -716,15 +746,12 @@ def write_image_template(
     pulls the image with AuthFile= credentials. All .container units that
     reference Image=onetime.image will auto-depend on onetime-image.service.
     """
-    content = render_image_template(cfg, executor=executor)
     path = cfg.image_template_path
-    if _is_remote(executor):
-        executor.run(["mkdir", "-p", str(path.parent)])  # type: ignore[union-attr]
-        executor.run(["tee", str(path)], input=content)  # type: ignore[union-attr]
-    else:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
-    systemd.daemon_reload(executor=executor)
+    content = render_image_template(cfg, executor=executor)
+    if _write_if_changed(path, content, executor=executor) or _reload_pending(
+        [path], executor=executor
+    ):
+        systemd.daemon_reload(executor=executor)
 
 
 def write_scheduler_template(
@@ -742,13 +769,60 @@ def write_scheduler_template(
         force: If True, allow deployment even when secrets are not configured.
         executor: Optional executor for remote writes.
     """
-    if cfg.registry:
-        write_image_template(cfg, executor=executor)
-    _write_template(
-        SCHEDULER_TEMPLATE,
-        cfg.scheduler_template_path,
-        cfg,
-        env_file_path,
-        force=force,
-        executor=executor,
+    write_all_templates(
+        cfg, env_file_path, unit_types=("scheduler",), force=force, executor=executor
     )
+
+
+def write_all_templates(
+    cfg: Config,
+    env_file_path: Path | None = None,
+    *,
+    unit_types: Iterable[str] = ("web", "worker", "scheduler"),
+    force: bool = False,
+    executor: Executor | None = None,
+) -> None:
+    """Write the quadlet templates for several instance types in one pass.
+
+    The secrets section, config volumes and image reference are resolved
+    once and shared by every template, the ``onetime.image`` unit is
+    written once when a registry is configured, and at most one
+    daemon-reload is issued for the whole batch.
+
+    Args:
+        cfg: Configuration object with image and paths
+        env_file_path: Optional path to environment file for secret discovery
+        unit_types: Instance types to write, any of "web", "worker", "scheduler".
+        force: If True, allow deployment even when secrets are not configured.
+        executor: Optional executor for remote writes.
+    """
+    templates = {
+        "web": (WEB_TEMPLATE, cfg.web_template_path),
+        "worker": (WORKER_TEMPLATE, cfg.worker_template_path),
+        "scheduler": (SCHEDULER_TEMPLATE, cfg.scheduler_template_path),
+    }
+    unit_types = tuple(unit_types)
+    if not unit_types:
+        return
+
+    with systemd.deferred_reload():
+        if cfg.registry:
+            write_image_template(cfg, executor=executor)
+        extra_vars = None
+        if "web" in unit_types:
+            valkey_after, valkey_wants = _get_valkey_unit_dependencies(cfg)
+            extra_vars = {"valkey_after": valkey_after, "valkey_wants": valkey_wants}
+        fmt_vars = _build_fmt_vars(
+            cfg, env_file_path, force=force, extra_vars=extra_vars, executor=executor
+        )
+        unchanged = []
+        for unit_type in unit_types:
+            template, path = templates[unit_type]
+            if _write_if_changed(path, template.format(**fmt_vars), executor=executor):
+                systemd.daemon_reload(executor=executor)
+            else:
+                unchanged.append(path)
+        # A reload for any written file covers the rest; otherwise make sure
+        # the skipped files were actually loaded.
+        if len(unchanged) == len(unit_types) and _reload_pending(unchanged, executor=executor):
+            systemd.daemon_reload(executor=executor)
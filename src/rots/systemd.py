@@ -9,12 +9,15 @@ unreachable.  Remote executors always use the CLI path over SSH.
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import functools
 import logging
 import os
 import re
 import shutil
 import sys
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -86,6 +89,15 @@ def _use_dbus(executor: Executor | None) -> bool:
     return _is_local(_get_executor(executor)) and _dbus_is_available()
 
 
+def uses_dbus(executor: Executor | None = None) -> bool:
+    """Whether systemd operations for *executor* go through D-Bus.
+
+    For callers outside this module that pick between D-Bus and their own
+    ``systemctl`` invocation.  Honours the ``--backend`` override.
+    """
+    return _use_dbus(executor)
+
+
 # ---------------------------------------------------------------------------
 # Executor helpers (unchanged)
 # ---------------------------------------------------------------------------
@@ -176,6 +188,7 @@ def _dbus_action(action: str, unit: str, *, executor: Executor | None = None) ->
         "start": _dbus.start_unit,
         "stop": _dbus.stop_unit,
         "restart": _dbus.restart_unit,
+        "reload": _dbus.reload_unit,
     }
     try:
         dispatch[action](unit)
@@ -297,73 +310,84 @@ def unit_to_container_name(unit: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _discover_instances(
-    unit_type: str,
+# onetime-{type}@{instance}.service; compiled once for the discovery line loop.
+_UNIT_RE = re.compile(r"onetime-([a-z]+)@([^.]+)\.service")
+
+
+def _discover_by_type(
+    unit_types: tuple[str, ...],
     running_only: bool = False,
     *,
     executor: Executor | None = None,
-) -> list[str]:
-    """Find onetime-{unit_type}@* units and return their instance identifiers.
+) -> dict[str, list[str]]:
+    """Find onetime-{type}@* units for several types with one unit listing.
 
-    This is the shared implementation for all discover_*_instances functions.
-    Callers are responsible for converting identifiers to the appropriate type
-    (e.g., int for web ports).
+    This is the shared implementation for all discover_*_instances functions:
+    one ``systemctl list-units`` (or one D-Bus ListUnitsByPatterns call) with
+    a glob per type, dispatched to types by unit name.
 
     Args:
-        unit_type: The unit type segment, e.g. "web", "worker", "scheduler".
+        unit_types: Unit type segments, e.g. ("web", "worker", "scheduler").
         running_only: If True, only return units that are active and running.
                       If False (default), return all loaded units regardless of state.
         executor: Executor for command dispatch. None uses LocalExecutor.
 
     Returns:
-        Sorted list of instance identifier strings.
+        Mapping of each requested type to its sorted instance identifier strings.
     """
-    pattern = re.compile(rf"onetime-{re.escape(unit_type)}@([^.]+)\.service")
+    globs = [f"onetime-{t}@*" for t in unit_types]
 
     if _use_dbus(executor):
         from rots import _dbus
 
-        units = _dbus.list_units_by_pattern(f"onetime-{unit_type}@*")
-        instances = []
-        for u in units:
-            if u.load_state != "loaded":
-                continue
-            if running_only and (u.active_state != "active" or u.sub_state != "running"):
+        rows = [
+            (u.name, u.load_state, u.active_state, u.sub_state)
+            for u in _dbus.list_units_by_pattern(*globs)
+        ]
+    else:
+        # CLI fallback (remote executor or no D-Bus)
+        ex = _get_executor(executor)
+        if _is_local(ex):
+            require_systemctl()
+        result = ex.run(
+            ["systemctl", "list-units", *globs, "--plain", "--no-legend", "--all"],
+            timeout=10,
+        )
+        rows = []
+        for line in result.stdout.strip().splitlines():
+            # UNIT LOAD ACTIVE SUB DESCRIPTION; leave the description unsplit
+            parts = line.split(None, 4)
+            if len(parts) < 4:
                 continue
-            match = pattern.match(u.name)
-            if match:
-                instances.append(match.group(1))
-        return sorted(instances)
+            rows.append((parts[0], parts[1], parts[2], parts[3]))
 
-    # CLI fallback (remote executor or no D-Bus)
-    ex = _get_executor(executor)
-    if _is_local(ex):
-        require_systemctl()
-    result = ex.run(
-        [
-            "systemctl",
-            "list-units",
-            f"onetime-{unit_type}@*",
-            "--plain",
-            "--no-legend",
-            "--all",
-        ],
-        timeout=10,
-    )
-    instances = []
-    for line in result.stdout.strip().splitlines():
-        parts = line.split()
-        if len(parts) < 4:
-            continue
-        unit, load, active, sub = parts[:4]
+    found: dict[str, list[str]] = {t: [] for t in unit_types}
+    for unit, load, active, sub in rows:
         if load != "loaded":
             continue
         if running_only and (active != "active" or sub != "running"):
             continue
-        match = pattern.match(unit)
-        if match:
-            instances.append(match.group(1))
-    return sorted(instances)
+        match = _UNIT_RE.match(unit)
+        if match and match.group(1) in found:
+            found[match.group(1)].append(match.group(2))
+    return {t: sorted(ids) for t, ids in found.items()}
+
+
+def _discover_instances(
+    unit_type: str,
+    running_only: bool = False,
+    *,
+    executor: Executor | None = None,
+) -> list[str]:
+    """Find onetime-{unit_type}@* units and return their instance identifiers.
+
+    Callers are responsible for converting identifiers to the appropriate type
+    (e.g., int for web ports).
+
+    Returns:
+        Sorted list of instance identifier strings.
+    """
+    return _discover_by_type((unit_type,), running_only=running_only, executor=executor)[unit_type]
 
 
 def discover_web_instances(
@@ -417,6 +441,32 @@ def discover_scheduler_instances(
     return _discover_instances("scheduler", running_only=running_only, executor=executor)
 
 
+def discover_all_instances(
+    running_only: bool = False,
+    *,
+    executor: Executor | None = None,
+) -> dict[str, list[str]]:
+    """Find web, worker and scheduler units with a single unit listing.
+
+    Equivalent to calling the three discover_*_instances functions, but with
+    one ``systemctl list-units`` instead of three.
+
+    Args:
+        running_only: If True, only return units that are active and running.
+                      If False (default), return all loaded units regardless of state.
+        executor: Executor for command dispatch. None uses LocalExecutor.
+
+    Returns:
+        ``{"web": [...], "worker": [...], "scheduler": [...]}`` of identifier
+        strings; web ports are numeric-only and sorted by value.
+    """
+    found = _discover_by_type(
+        ("web", "worker", "scheduler"), running_only=running_only, executor=executor
+    )
+    found["web"] = [str(p) for p in sorted(int(i) for i in found["web"] if i.isdigit())]
+    return found
+
+
 # ---------------------------------------------------------------------------
 # Unit state queries
 # ---------------------------------------------------------------------------
@@ -436,6 +486,71 @@ def is_active(unit: str, *, executor: Executor | None = None) -> str:
     return result.stdout.strip()
 
 
+def show_properties(
+    units: list[str],
+    properties: list[str],
+    *,
+    executor: Executor | None = None,
+) -> dict[str, dict[str, str]]:
+    """Fetch unit properties for many units in one ``systemctl show`` call.
+
+    Cheaper than ``status`` (no journal tail or cgroup walk) and a single
+    subprocess regardless of how many units are queried.
+
+    Args:
+        units: Unit names to query.
+        properties: Property names, e.g. ``["ActiveState", "SubState"]``.
+        executor: Executor for command dispatch. None uses LocalExecutor.
+
+    Returns:
+        Dict mapping each unit to a ``{property: value}`` dict.  Properties
+        systemd did not report (or units it could not be asked about) map
+        to ``""``.  Values are returned as each backend reports them, so
+        only request properties whose D-Bus and ``systemctl show`` forms
+        agree (states, PIDs); timestamps, for one, do not.
+    """
+    if not units:
+        return {}
+
+    if _use_dbus(executor):
+        from rots import _dbus
+
+        props: dict[str, dict[str, str]] = {}
+        for unit in units:
+            try:
+                props[unit] = _dbus.get_unit_properties(unit, properties)
+            except _dbus.DBusError:
+                logger.debug("Failed to read properties of %s via D-Bus", unit, exc_info=True)
+                props[unit] = dict.fromkeys(properties, "")
+        return props
+
+    ex = _get_executor(executor)
+    if _is_local(ex):
+        require_systemctl()
+    result = ex.run(
+        ["systemctl", "show", f"--property=Id,{','.join(properties)}", *units],
+        timeout=10,
+    )
+    # One KEY=VALUE block per unit separated by blank lines.  Key blocks by
+    # Id rather than position so a missing block cannot shift the rest.
+    by_id: dict[str, dict[str, str]] = {}
+    for record in result.stdout.split("\n\n"):
+        block: dict[str, str] = {}
+        for line in record.splitlines():
+            key, sep, value = line.partition("=")
+            if sep:
+                block[key] = value
+        unit_id = block.get("Id")
+        if unit_id:
+            by_id[unit_id] = block
+
+    props = {}
+    for unit in units:
+        block = by_id.get(unit) or by_id.get(f"{unit}.service") or {}
+        props[unit] = {prop: block.get(prop, "") for prop in properties}
+    return props
+
+
 def unit_exists(unit: str, *, executor: Executor | None = None) -> bool:
     """Check if a systemd unit exists (loaded or not)."""
     if _use_dbus(executor):
@@ -488,6 +603,17 @@ def restart(unit: str, *, executor: Executor | None = None) -> None:
     _run_systemctl("restart", unit, executor=executor)
 
 
+def reload(unit: str, *, executor: Executor | None = None) -> None:
+    """Ask a unit to reload its configuration without restarting."""
+    if _use_dbus(executor):
+        _dbus_action("reload", unit, executor=executor)
+        return
+    ex = _get_executor(executor)
+    if _is_local(ex):
+        require_systemctl()
+    _run_systemctl("reload", unit, executor=executor)
+
+
 def enable(unit: str, *, executor: Executor | None = None) -> None:
     """Enable a unit to auto-start on reboot."""
     if _use_dbus(executor):
@@ -527,7 +653,42 @@ def disable(unit: str, *, executor: Executor | None = None) -> None:
     ex.run(cmd, sudo=True, timeout=10)
 
 
+# Executors whose daemon-reload is pending inside a deferred_reload() block.
+# None means reloads are issued immediately.
+_deferred_reloads: contextvars.ContextVar[list[Executor | None] | None] = contextvars.ContextVar(
+    "ots_deferred_reloads", default=None
+)
+
+
+@contextlib.contextmanager
+def deferred_reload() -> Iterator[None]:
+    """Coalesce ``daemon_reload()`` calls made inside the block into one.
+
+    Each reload re-parses every unit on the host, so writing several
+    quadlet templates back-to-back should only pay for it once. Nested
+    blocks defer to the outermost one. The pending reload is still issued
+    when the block exits with an exception, since files may already have
+    been written.
+    """
+    if _deferred_reloads.get() is not None:
+        yield
+        return
+    pending: list[Executor | None] = []
+    token = _deferred_reloads.set(pending)
+    try:
+        yield
+    finally:
+        _deferred_reloads.reset(token)
+        for executor in pending:
+            daemon_reload(executor=executor)
+
+
 def daemon_reload(*, executor: Executor | None = None) -> None:
+    pending = _deferred_reloads.get()
+    if pending is not None:
+        if not any(executor is ex for ex in pending):
+            pending.append(executor)
+        return
     if _use_dbus(executor):
         from rots import _dbus
 
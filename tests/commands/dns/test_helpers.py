@@ -50,13 +50,13 @@ class TestGetPublicIp:
                 "__exit__": lambda *_a: None,
             },
         )()
-        _target = "rots.commands.dns._helpers.urllib.request.urlopen"
+        _target = "urllib.request.urlopen"
         with patch(_target, return_value=mock_resp):
             assert get_public_ip() == "1.2.3.4"
 
     def test_get_public_ip_failure(self):
         """Network error returns None."""
-        _target = "rots.commands.dns._helpers.urllib.request.urlopen"
+        _target = "urllib.request.urlopen"
         with patch(_target, side_effect=OSError("no network")):
             assert get_public_ip() is None
 
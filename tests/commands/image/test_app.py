@@ -1698,3 +1698,35 @@ class TestRmImageBasenameDerivation:
         assert attempted_images[0] == "myapp:v1.0.0"
 
         assert "Removed myapp:v1.0.0" in caplog.text
+
+
+class TestAliasesCommand:
+    """Test the aliases command output."""
+
+    def test_resolution_reuses_listed_aliases(self, mocker, tmp_path, capsys):
+        """aliases should resolve current/rollback from the one alias query."""
+        from rots.commands.image.app import aliases
+        from rots.db import ImageAlias
+
+        mocker.patch(
+            "rots.config.Config.db_path",
+            new_callable=mocker.PropertyMock,
+            return_value=tmp_path / "deployments.db",
+        )
+        mocker.patch(
+            "rots.commands.image.app.db.get_all_aliases",
+            return_value=[
+                ImageAlias("CURRENT", "ghcr.io/org/app", "v2", "2026-01-02 00:00:00"),
+                ImageAlias("ROLLBACK", "ghcr.io/org/app", "v1", "2026-01-01 00:00:00"),
+            ],
+        )
+        mock_current = mocker.patch("rots.commands.image.app.db.get_current_image")
+        mock_rollback = mocker.patch("rots.commands.image.app.db.get_rollback_image")
+
+        aliases()
+
+        out = capsys.readouterr().out
+        assert "TAG=current  -> ghcr.io/org/app:v2" in out
+        assert "TAG=rollback -> ghcr.io/org/app:v1" in out
+        mock_current.assert_not_called()
+        mock_rollback.assert_not_called()
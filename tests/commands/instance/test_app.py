@@ -384,16 +384,8 @@ class TestRedeployCommand:
     def test_redeploy_with_no_instances_found(self, mocker, capsys):
         """redeploy with no instances should print message."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": [], "worker": [], "scheduler": []},
         )
 
         instance.redeploy()
@@ -414,19 +406,11 @@ class TestRedeployCommand:
         mock_config.resolve_image_tag.return_value = ("ghcr.io/test/image", "v1.0.0")
         mocker.patch("rots.commands.instance.app.Config", return_value=mock_config)
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7143],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7143"], "worker": [], "scheduler": []},
         )
         mocker.patch("rots.commands.instance.app.assets.update")
-        mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
+        mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
         mocker.patch("rots.commands.instance.app.systemd.recreate")
         mocker.patch("rots.commands.instance.app.db.record_deployment")
         mocker.patch(
@@ -437,6 +421,32 @@ class TestRedeployCommand:
         # Should not raise AttributeError
         instance.redeploy()
 
+    def test_redeploy_worker_logs_worker_template_dir(self, mocker, tmp_path, caplog):
+        """A worker-only redeploy should not report the web template directory."""
+        import logging
+
+        mock_config = mocker.MagicMock()
+        mock_config.web_template_path = tmp_path / "web" / "onetime-web@.container"
+        mock_config.worker_template_path = tmp_path / "worker" / "onetime-worker@.container"
+        mock_config.db_path = tmp_path / "test.db"
+        mock_config.resolve_image_tag.return_value = ("ghcr.io/test/image", "v1.0.0")
+        mocker.patch("rots.commands.instance.app.Config", return_value=mock_config)
+        mocker.patch(
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": [], "worker": ["1"], "scheduler": []},
+        )
+        mock_write = mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
+        mocker.patch("rots.commands.instance.app.systemd.recreate")
+        mocker.patch("rots.commands.instance.app.db.record_deployment")
+        mocker.patch("rots.commands.instance.app.systemd.container_exists", return_value=True)
+
+        with caplog.at_level(logging.INFO):
+            instance.redeploy(worker="")
+
+        assert mock_write.call_args.kwargs["unit_types"] == ["worker"]
+        assert f"Writing quadlet files to {tmp_path / 'worker'}" in caplog.text
+        assert str(tmp_path / "web") not in caplog.text
+
 
 class TestShowEnvCommand:
     """Test show_env command - displays shared /etc/default/onetimesecret."""
@@ -472,6 +482,30 @@ class TestShowEnvCommand:
         env_lines = [line for line in lines if "=" in line and not line.startswith("===")]
         assert env_lines == ["AAA_VAR=first", "MMM_VAR=middle", "ZZZ_VAR=last"]
 
+    def test_show_env_sorts_case_insensitively(self, mocker, capsys, tmp_path):
+        """show_env should interleave upper- and lower-case keys alphabetically."""
+        from pathlib import Path
+
+        env_file = tmp_path / "onetimesecret"
+        env_file.write_text("Z_FOO=1\na_bar=2\nB_BAZ=3\n")
+
+        original_path = Path
+
+        def mock_path(path_str):
+            if path_str == "/etc/default/onetimesecret":
+                return env_file
+            return original_path(path_str)
+
+        mocker.patch("pathlib.Path", side_effect=mock_path)
+
+        instance.show_env()
+
+        captured = capsys.readouterr()
+        env_lines = [
+            line for line in captured.out.splitlines() if "=" in line and not line.startswith("===")
+        ]
+        assert env_lines == ["a_bar=2", "B_BAZ=3", "Z_FOO=1"]
+
 
 class TestExecCommand:
     """Test the exec_shell command."""
@@ -484,16 +518,8 @@ class TestExecCommand:
     def test_exec_with_no_instances(self, mocker, capsys):
         """exec_shell with no running instances should report none found."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": [], "worker": [], "scheduler": []},
         )
         instance.exec_shell()
         captured = capsys.readouterr()
@@ -527,16 +553,8 @@ class TestListInstancesCommand:
     def test_list_with_no_instances(self, mocker, capsys):
         """list should print message when no instances found."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": [], "worker": [], "scheduler": []},
         )
 
         instance.list_instances()
@@ -547,16 +565,8 @@ class TestListInstancesCommand:
     def test_list_displays_header(self, mocker, capsys, tmp_path):
         """list should display table header."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
         mocker.patch(
             "rots.commands.instance.app.systemd.is_active",
@@ -601,16 +611,8 @@ class TestEnableCommand:
     def test_enable_calls_systemctl(self, mocker, capsys):
         """enable should call systemd.enable()."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
         mock_enable = mocker.patch("rots.commands.instance.app.systemd.enable")
 
@@ -643,16 +645,8 @@ class TestStopCommand:
     def test_stop_discovers_instances_when_no_identifiers(self, mocker):
         """stop with no identifiers should discover all types."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043, 7044],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=["1"],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043", "7044"], "worker": ["1"], "scheduler": []},
         )
         mock_stop = mocker.patch("rots.commands.instance.app.systemd.stop")
 
@@ -711,16 +705,8 @@ class TestLogsCommand:
     def test_logs_discovers_all_instances_when_no_identifiers(self, mocker):
         """logs with no identifiers should discover all instances."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043, 7044],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=["1"],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043", "7044"], "worker": ["1"], "scheduler": []},
         )
         mock_run = mocker.patch("subprocess.run")
         mock_run.return_value = mocker.Mock(returncode=0, stdout="", stderr="")
@@ -750,16 +736,8 @@ class TestDisableCommand:
     def test_disable_aborts_without_confirmation(self, mocker, capsys):
         """disable should abort without --yes if user declines."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
         mocker.patch("builtins.input", return_value="n")
 
@@ -771,16 +749,8 @@ class TestDisableCommand:
     def test_disable_calls_systemctl(self, mocker, capsys):
         """disable should call systemctl disable with --yes."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
         mock_disable = mocker.patch("rots.commands.instance._helpers.systemd.disable")
 
@@ -922,8 +892,8 @@ class TestSchedulerCommands:
     def test_stop_discovers_scheduler_instances(self, mocker):
         """stop --scheduler with no identifiers should discover scheduler instances."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=["main", "cron"],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": ["main", "cron"]},
         )
         mock_stop = mocker.patch("rots.commands.instance.app.systemd.stop")
 
@@ -937,8 +907,8 @@ class TestSchedulerCommands:
     def test_restart_discovers_scheduler_instances(self, mocker):
         """restart --scheduler with no identifiers should discover scheduler instances."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=["main"],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": ["main"]},
         )
         mock_restart = mocker.patch("rots.commands.instance.app.systemd.restart")
 
@@ -1103,7 +1073,7 @@ class TestRedeployEnvVarResolution:
 
         # Mock all external calls needed for non-dry-run redeploy
         mocker.patch("rots.commands.instance.app.assets.update")
-        mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
+        mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
         mocker.patch(
             "rots.commands.instance.app.systemd.container_exists",
             return_value=True,
@@ -1459,16 +1429,8 @@ class TestRedeployWaitFlag:
     def _patch_discover(self, mocker, web_ports=(7043,)):
         """Patch instance discovery to return specific ports."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=list(web_ports),
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": [str(p) for p in list(web_ports)], "worker": [], "scheduler": []},
         )
 
     def test_redeploy_with_wait_calls_wait_for_http_healthy(self, mocker, tmp_path):
@@ -1477,7 +1439,7 @@ class TestRedeployWaitFlag:
         mocker.patch("rots.commands.instance.app.Config", return_value=mock_config)
         self._patch_discover(mocker)
         mocker.patch("rots.commands.instance.app.assets.update")
-        mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
+        mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
         mocker.patch("rots.commands.instance.app.systemd.recreate")
         mocker.patch("rots.commands.instance.app.db.record_deployment")
         mocker.patch(
@@ -1500,7 +1462,7 @@ class TestRedeployWaitFlag:
         mocker.patch("rots.commands.instance.app.Config", return_value=mock_config)
         self._patch_discover(mocker)
         mocker.patch("rots.commands.instance.app.assets.update")
-        mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
+        mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
         mocker.patch("rots.commands.instance.app.systemd.recreate")
         mocker.patch("rots.commands.instance.app.db.record_deployment")
         mocker.patch(
@@ -1521,7 +1483,7 @@ class TestRedeployWaitFlag:
         mocker.patch("rots.commands.instance.app.Config", return_value=mock_config)
         self._patch_discover(mocker)
         mocker.patch("rots.commands.instance.app.assets.update")
-        mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
+        mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
         mocker.patch("rots.commands.instance.app.systemd.recreate")
         mock_record = mocker.patch("rots.commands.instance.app.db.record_deployment")
         mocker.patch(
@@ -1559,9 +1521,23 @@ class TestCleanupCommand:
 
         instance.cleanup(yes=True)
 
-        mock_executor.run.assert_called_once()
-        cmd = mock_executor.run.call_args[0][0]
-        assert cmd == ["podman", "volume", "rm", "static_assets"]
+        cmds = [c[0][0] for c in mock_executor.run.call_args_list]
+        assert cmds[0] == ["podman", "volume", "rm", "static_assets"]
+
+    def test_cleanup_clears_asset_sync_marker(self, mocker, tmp_path):
+        """Removing the volume should also forget which image it was synced from."""
+        mock_executor = mocker.MagicMock()
+        mock_result = mocker.MagicMock()
+        mock_result.returncode = 0
+        mock_result.stderr = ""
+        mock_executor.run.return_value = mock_result
+        mocker.patch.object(Config, "get_executor", return_value=mock_executor)
+        mock_clear = mocker.patch("rots.commands.instance.app.assets.clear_sync_marker")
+
+        instance.cleanup(yes=True)
+
+        mock_clear.assert_called_once()
+        assert mock_clear.call_args.kwargs["executor"] is mock_executor
 
     def test_cleanup_volume_not_found_is_treated_as_success(self, mocker, tmp_path, capsys):
         """When volume doesn't exist, cleanup should report success (idempotent)."""
@@ -1737,7 +1713,7 @@ class TestRollbackCommand:
             return_value={InstanceType.WEB: ["7043"]},
         )
         mocker.patch("rots.commands.instance.app.assets.update")
-        mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
+        mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
         mock_recreate = mocker.patch("rots.commands.instance.app.systemd.recreate")
         mock_record = mocker.patch("rots.commands.instance.app.db.record_deployment")
 
@@ -1898,16 +1874,8 @@ class TestRedeployHooks:
     def _patch_discover(self, mocker, web_ports=(7043,)):
         """Patch instance discovery to return specific ports."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=list(web_ports),
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": [str(p) for p in list(web_ports)], "worker": [], "scheduler": []},
         )
 
     def _make_mock_config(self, mocker, tmp_path):
@@ -1929,7 +1897,7 @@ class TestRedeployHooks:
         mocker.patch("rots.commands.instance.app.Config", return_value=mock_config)
         self._patch_discover(mocker)
         mocker.patch("rots.commands.instance.app.assets.update")
-        mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
+        mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
         mocker.patch("rots.commands.instance.app.systemd.recreate")
         mocker.patch("rots.commands.instance.app.db.record_deployment")
         mocker.patch(
@@ -1952,7 +1920,7 @@ class TestRedeployHooks:
         mocker.patch("rots.commands.instance.app.Config", return_value=mock_config)
         self._patch_discover(mocker)
         mocker.patch("rots.commands.instance.app.assets.update")
-        mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
+        mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
         mocker.patch("rots.commands.instance.app.systemd.recreate")
         mocker.patch("rots.commands.instance.app.db.record_deployment")
         mocker.patch(
@@ -2093,16 +2061,8 @@ class TestEnableDisableRequireSystemctl:
     def test_enable_uses_systemd_module(self, mocker, capsys):
         """enable() should delegate to systemd.enable()."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
         mock_enable = mocker.patch("rots.commands.instance.app.systemd.enable")
 
@@ -2113,16 +2073,8 @@ class TestEnableDisableRequireSystemctl:
     def test_disable_uses_systemd_module(self, mocker, capsys):
         """disable() should delegate to systemd.disable()."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
         mock_disable = mocker.patch("rots.commands.instance.app.systemd.disable")
 
@@ -2146,16 +2098,8 @@ class TestListInstancesJsonOutput:
         import json
 
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
         mocker.patch(
             "rots.commands.instance.app.systemd.is_active",
@@ -2189,16 +2133,8 @@ class TestListInstancesJsonOutput:
         import json
 
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
         mocker.patch(
             "rots.commands.instance.app.systemd.is_active",
@@ -2498,16 +2434,8 @@ class TestExecShellCommand:
     def test_exec_no_running_instances(self, mocker, capsys):
         """exec with no running instances should print message."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": [], "worker": [], "scheduler": []},
         )
 
         instance.exec_shell()
@@ -2523,16 +2451,8 @@ class TestExecShellCommand:
         mock_ex.run_interactive.return_value = 0
 
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
 
         instance.exec_shell(web="")
@@ -2551,16 +2471,8 @@ class TestExecShellCommand:
         mock_ex.run_interactive.return_value = 0
 
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
 
         instance.exec_shell(web="", command="/bin/sh")
@@ -2580,16 +2492,8 @@ class TestMetricsCommand:
     def test_metrics_no_instances(self, mocker, capsys):
         """metrics with no configured instances should print message."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": [], "worker": [], "scheduler": []},
         )
 
         instance.metrics()
@@ -2602,16 +2506,8 @@ class TestMetricsCommand:
         import json
 
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": [], "worker": [], "scheduler": []},
         )
 
         instance.metrics(json_output=True)
@@ -2625,16 +2521,8 @@ class TestMetricsCommand:
         import json
 
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
 
         stats_output = json.dumps(
@@ -2682,16 +2570,8 @@ class TestMetricsCommand:
         import json
 
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
 
         stats_output = json.dumps(
@@ -2745,16 +2625,8 @@ class TestMetricsCommand:
         import json
 
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
 
         mock_executor = mocker.MagicMock()
@@ -2833,19 +2705,11 @@ class TestRemoteExecutorPropagation:
         """redeploy should pass the executor to systemd.recreate and db.record_deployment."""
         mock_config, mock_executor = self._make_mock_config(mocker, tmp_path)
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=["7043"],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
         mocker.patch("rots.commands.instance.app.assets.update")
-        mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
+        mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
         mocker.patch(
             "rots.commands.instance.app.systemd.container_exists",
             return_value=True,
@@ -2881,7 +2745,7 @@ class TestRemoteExecutorPropagation:
             return_value={InstanceType.WEB: ["7043"]},
         )
         mocker.patch("rots.commands.instance.app.assets.update")
-        mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
+        mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
         mock_recreate = mocker.patch("rots.commands.instance.app.systemd.recreate")
         mock_record = mocker.patch("rots.commands.instance.app.db.record_deployment")
 
@@ -2992,21 +2856,50 @@ class TestRemoteExecutorPropagation:
         assert mock_disable.call_args.kwargs["executor"] is mock_executor
 
     def test_status_passes_executor_to_systemd(self, mocker, tmp_path):
-        """status should pass executor to systemd.is_active (json mode) and systemd.status."""
+        """status (json mode) should pass executor to systemd.show_properties."""
         mock_config, mock_executor = self._make_mock_config(mocker, tmp_path)
         mocker.patch(
             "rots.commands.instance.app.resolve_identifiers",
             return_value={InstanceType.WEB: ["7043"]},
         )
-        mock_is_active = mocker.patch(
-            "rots.commands.instance.app.systemd.is_active",
-            return_value="active",
+        mock_show = mocker.patch(
+            "rots.commands.instance.app.systemd.show_properties",
+            return_value={"onetime-web@7043": {"ActiveState": "active"}},
         )
 
         instance.status(web="7043", json_output=True)
 
-        mock_is_active.assert_called_once()
-        assert mock_is_active.call_args.kwargs["executor"] is mock_executor
+        mock_show.assert_called_once()
+        assert mock_show.call_args.kwargs["executor"] is mock_executor
+
+    def test_status_json_queries_all_units_in_one_call(self, mocker, tmp_path, capsys):
+        """status --json should fetch every unit with a single show_properties call."""
+        import json
+
+        self._make_mock_config(mocker, tmp_path)
+        mocker.patch(
+            "rots.commands.instance.app.resolve_identifiers",
+            return_value={InstanceType.WEB: ["7043", "7044"]},
+        )
+        mock_show = mocker.patch(
+            "rots.commands.instance.app.systemd.show_properties",
+            return_value={
+                "onetime-web@7043": {"ActiveState": "active", "SubState": "running"},
+                "onetime-web@7044": {"ActiveState": "failed", "SubState": "failed"},
+            },
+        )
+        mock_is_active = mocker.patch("rots.commands.instance.app.systemd.is_active")
+
+        instance.status(web="7043,7044", json_output=True)
+
+        mock_show.assert_called_once()
+        assert mock_show.call_args.args[0] == ["onetime-web@7043", "onetime-web@7044"]
+        mock_is_active.assert_not_called()
+        data = json.loads(capsys.readouterr().out)
+        assert [i["active"] for i in data["instances"]] == [True, False]
+        assert data["instances"][0]["sub_state"] == "running"
+        # Timestamps are formatted differently by D-Bus and systemctl; not reported
+        assert "active_enter_timestamp" not in data["instances"][0]
 
     def test_status_text_passes_executor_to_systemd(self, mocker, tmp_path):
         """status (text mode) should pass executor to systemd.status."""
@@ -3068,16 +2961,8 @@ class TestRemoteExecutorPropagation:
         """metrics should pass executor to systemd.is_active for status checks."""
         mock_config, mock_executor = self._make_mock_config(mocker, tmp_path)
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
 
         def mock_run_side_effect(cmd, **kwargs):
@@ -3162,16 +3047,8 @@ class TestStreamingCommands:
         _mock_config, mock_ex = self._mock_executor(mocker)
         mocker.patch.dict("os.environ", {"SHELL": "/bin/bash"})
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
 
         instance.exec_shell(web="")
@@ -3221,16 +3098,8 @@ class TestStreamingCommands:
         """logs -f should use run_stream (not run) for real-time output."""
         _mock_config, mock_ex = self._mock_executor(mocker)
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
 
         instance.logs(web="", follow=True)
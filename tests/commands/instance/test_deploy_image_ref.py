@@ -39,6 +39,7 @@ def _setup_deploy_mocks(mocker, tmp_path, **config_kwargs):
     mocker.patch("rots.commands.instance.app.quadlet.write_web_template")
     mocker.patch("rots.commands.instance.app.quadlet.write_worker_template")
     mocker.patch("rots.commands.instance.app.quadlet.write_scheduler_template")
+    mocker.patch("rots.commands.instance.app.quadlet.write_all_templates")
     mocker.patch("rots.commands.instance.app.systemd.start")
     mocker.patch("rots.commands.instance.app.db.record_deployment")
 
@@ -159,16 +159,12 @@ class TestListInstancesWithHealth:
     def _mock_discovery(self, mocker, web_ports=None, workers=None, schedulers=None):
         """Mock instance discovery."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=web_ports or [],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=workers or [],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=schedulers or [],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={
+                "web": [str(p) for p in web_ports or []],
+                "worker": workers or [],
+                "scheduler": schedulers or [],
+            },
         )
 
     def test_list_displays_healthy_status(self, mocker, capsys, tmp_path):
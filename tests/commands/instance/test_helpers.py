@@ -16,6 +16,7 @@ from rots.commands.instance._helpers import (
     for_each_instance,
     format_command,
     format_journalctl_hint,
+    instance_units,
     resolve_identifiers,
 )
 from rots.commands.instance.annotations import InstanceType
@@ -327,6 +328,26 @@ class TestFormatJournalctlHint:
         assert result == "journalctl -t onetime-worker-1 -f"
 
 
+class TestInstanceUnits:
+    """Test instance_units helper."""
+
+    def test_flattens_mixed_types_in_order(self):
+        """Should yield (type, id, unit) triples in discovery order."""
+        instances = {
+            InstanceType.WEB: ["7043", "7044"],
+            InstanceType.SCHEDULER: ["main"],
+        }
+        assert instance_units(instances) == [
+            (InstanceType.WEB, "7043", "onetime-web@7043"),
+            (InstanceType.WEB, "7044", "onetime-web@7044"),
+            (InstanceType.SCHEDULER, "main", "onetime-scheduler@main"),
+        ]
+
+    def test_empty_instances(self):
+        """Should return an empty list for empty instances."""
+        assert instance_units({}) == []
+
+
 class TestFormatCommand:
     """Test format_command helper."""
 
@@ -392,8 +413,12 @@ class TestResolveIdentifiers:
     def test_auto_discover_web_only(self, mocker):
         """Should discover only web instances when type is WEB."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043, 7044],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={
+                "web": ["7043", "7044"],
+                "worker": ["1", "billing"],
+                "scheduler": ["main"],
+            },
         )
         result = resolve_identifiers((), instance_type=InstanceType.WEB)
         assert result == {InstanceType.WEB: ["7043", "7044"]}
@@ -401,8 +426,12 @@ class TestResolveIdentifiers:
     def test_auto_discover_worker_only(self, mocker):
         """Should discover only worker instances when type is WORKER."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=["1", "billing"],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={
+                "web": ["7043", "7044"],
+                "worker": ["1", "billing"],
+                "scheduler": ["main"],
+            },
         )
         result = resolve_identifiers((), instance_type=InstanceType.WORKER)
         assert result == {InstanceType.WORKER: ["1", "billing"]}
@@ -410,8 +439,12 @@ class TestResolveIdentifiers:
     def test_auto_discover_scheduler_only(self, mocker):
         """Should discover only scheduler instances when type is SCHEDULER."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=["main"],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={
+                "web": ["7043", "7044"],
+                "worker": ["1", "billing"],
+                "scheduler": ["main"],
+            },
         )
         result = resolve_identifiers((), instance_type=InstanceType.SCHEDULER)
         assert result == {InstanceType.SCHEDULER: ["main"]}
@@ -419,16 +452,8 @@ class TestResolveIdentifiers:
     def test_auto_discover_all_types(self, mocker):
         """Should discover all types when no type specified."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=["1"],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=["main"],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": ["1"], "scheduler": ["main"]},
         )
         result = resolve_identifiers((), instance_type=None)
         assert result == {
@@ -440,16 +465,8 @@ class TestResolveIdentifiers:
     def test_auto_discover_empty_results_omitted(self, mocker):
         """Should omit types with no discovered instances."""
         mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[7043],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": ["7043"], "worker": [], "scheduler": []},
         )
         result = resolve_identifiers((), instance_type=None)
         assert result == {InstanceType.WEB: ["7043"]}
@@ -458,22 +475,12 @@ class TestResolveIdentifiers:
 
     def test_running_only_flag_passed(self, mocker):
         """Should pass running_only flag to discovery functions."""
-        mock_web = mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_web_instances",
-            return_value=[],
-        )
-        mock_worker = mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_worker_instances",
-            return_value=[],
-        )
-        mock_scheduler = mocker.patch(
-            "rots.commands.instance._helpers.systemd.discover_scheduler_instances",
-            return_value=[],
+        mock_all = mocker.patch(
+            "rots.commands.instance._helpers.systemd.discover_all_instances",
+            return_value={"web": [], "worker": [], "scheduler": []},
         )
         resolve_identifiers((), instance_type=None, running_only=True)
-        mock_web.assert_called_once_with(running_only=True, executor=None)
-        mock_worker.assert_called_once_with(running_only=True, executor=None)
-        mock_scheduler.assert_called_once_with(running_only=True, executor=None)
+        mock_all.assert_called_once_with(running_only=True, executor=None)
 
 
 class TestForEachInstance:
@@ -172,6 +172,39 @@ class TestReloadCaddy:
         """Should call systemctl reload caddy."""
         from rots.commands.proxy._helpers import reload_caddy
 
+        mocker.patch("rots.systemd._use_dbus", return_value=False)
+        mock_run = mocker.patch("subprocess.run")
+
+        reload_caddy()
+
+        mock_run.assert_called_once_with(
+            ["sudo", "systemctl", "reload", "caddy"],
+            check=True,
+        )
+
+    def test_reload_caddy_uses_dbus_when_available(self, mocker):
+        """Should reload via D-Bus without spawning sudo/systemctl."""
+        from rots.commands.proxy._helpers import reload_caddy
+
+        mocker.patch("rots.systemd._use_dbus", return_value=True)
+        mock_reload = mocker.patch("rots._dbus.reload_unit")
+        mock_run = mocker.patch("subprocess.run")
+
+        reload_caddy()
+
+        mock_reload.assert_called_once_with("caddy")
+        mock_run.assert_not_called()
+
+    def test_reload_caddy_falls_back_when_dbus_fails(self, mocker):
+        """A D-Bus failure should retry through sudo systemctl, not abort."""
+        from rots import systemd
+        from rots.commands.proxy._helpers import reload_caddy
+
+        mocker.patch("rots.systemd._use_dbus", return_value=True)
+        mocker.patch(
+            "rots.systemd.reload",
+            side_effect=systemd.SystemctlError("caddy", "reload", ""),
+        )
         mock_run = mocker.patch("subprocess.run")
 
         reload_caddy()
@@ -185,6 +218,8 @@ class TestReloadCaddy:
         """Should raise ProxyError when reload fails."""
         from rots.commands.proxy._helpers import ProxyError, reload_caddy
 
+        mocker.patch("rots.systemd._use_dbus", return_value=False)
+
         mocker.patch(
             "subprocess.run",
             side_effect=subprocess.CalledProcessError(1, "cmd"),
@@ -8,6 +8,8 @@ import pytest
 from ots_shared.ssh.executor import CommandError, Result
 
 from rots.commands.service.app import (
+    _instance_from_unit,
+    _list_units_for_templates,
     app,
     disable,
     enable,
@@ -79,14 +81,29 @@ class TestServiceAppExists:
         """Test list command is registered."""
         assert list_instances is not None
 
+    def test_registered_commands(self):
+        """Test each command is registered once and list_all is the default."""
+        commands = {name for name in app if not name.startswith("-")}
+        assert commands == {
+            "disable",
+            "enable",
+            "init",
+            "list",
+            "logs",
+            "restart",
+            "start",
+            "status",
+            "stop",
+        }
+        assert app.default_command is list_all
+
 
 class TestDefaultCommand:
     """Tests for default command (list_all)."""
 
-    @patch("rots.commands.service.app.is_service_enabled")
-    @patch("rots.commands.service.app.is_service_active")
+    @patch("rots.commands.service._helpers.unit_states")
     @patch("subprocess.run")
-    def test_default_no_instances(self, mock_run, mock_active, mock_enabled, capsys):
+    def test_default_no_instances(self, mock_run, mock_states, capsys):
         """Test default command when no instances found."""
         mock_run.return_value = MagicMock(stdout="")
 
@@ -102,12 +119,12 @@ class TestDefaultCommand:
 class TestInitCommand:
     """Tests for init command."""
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_calls_copy_default_config(
         self,
         mock_copy,
@@ -131,12 +148,12 @@ class TestInitCommand:
         assert call_args[0][0].name == "valkey"
         assert call_args[0][1] == "6379"
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_updates_port_and_bind(
         self,
         mock_copy,
@@ -154,18 +171,20 @@ class TestInitCommand:
 
         init("valkey", "6379", port=6379, bind="0.0.0.0", start=False, enable=False)
 
-        # Check update_config_value was called for port and bind
-        call_keys = [call[0][1] for call in mock_update.call_args_list]
-        assert "port" in call_keys
-        assert "bind" in call_keys
-
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.add_secrets_include")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+        # Port, bind and data dir are written in a single update
+        mock_update.assert_called_once()
+        updates = mock_update.call_args[0][1]
+        assert updates["port"] == "6379"
+        assert updates["bind"] == "0.0.0.0"
+        assert updates["dir"] == str(tmp_path / "data")
+
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.add_secrets_include")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_creates_secrets_file(
         self,
         mock_copy,
@@ -186,12 +205,12 @@ class TestInitCommand:
 
         mock_secrets.assert_called_once()
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_skips_secrets_with_no_secrets(
         self,
         mock_copy,
@@ -210,12 +229,12 @@ class TestInitCommand:
 
         mock_secrets.assert_not_called()
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_enables_service(
         self,
         mock_copy,
@@ -237,12 +256,12 @@ class TestInitCommand:
         calls = [str(call) for call in mock_systemctl.call_args_list]
         assert any("enable" in call for call in calls)
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_starts_service(
         self,
         mock_copy,
@@ -264,13 +283,68 @@ class TestInitCommand:
         calls = [str(call) for call in mock_systemctl.call_args_list]
         assert any("start" in call for call in calls)
 
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
+    def test_init_enable_and_start_uses_enable_now(
+        self,
+        mock_copy,
+        mock_update,
+        mock_data,
+        mock_secrets,
+        mock_systemctl,
+        mock_check_conflict,
+        tmp_path,
+    ):
+        """Test init uses a single enable --now when both flags are set."""
+        mock_copy.return_value = tmp_path / "test.conf"
+        mock_data.return_value = tmp_path / "data"
+        mock_secrets.return_value = None
+
+        init("valkey", "6379", enable=True, start=True)
+
+        mock_systemctl.assert_called_once_with(
+            "enable", "--now", "valkey-server@6379.service", executor=None
+        )
+
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
+    def test_init_enable_now_failure_falls_back(
+        self,
+        mock_copy,
+        mock_update,
+        mock_data,
+        mock_secrets,
+        mock_systemctl,
+        mock_check_conflict,
+        tmp_path,
+    ):
+        """Test a failed enable --now retries enable and start separately."""
+        mock_copy.return_value = tmp_path / "test.conf"
+        mock_data.return_value = tmp_path / "data"
+        mock_secrets.return_value = None
+        mock_systemctl.side_effect = [_make_command_error("boom"), None, _make_command_error("x")]
+
+        with pytest.raises(SystemExit):
+            init("valkey", "6379", enable=True, start=True)
+
+        actions = [c[0][0] for c in mock_systemctl.call_args_list]
+        assert actions == ["enable", "enable", "start"]
+
 
 class TestInitIdempotency:
     """Tests for init command idempotency (BUG: config modification on re-run)."""
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_skips_modifications_when_config_exists(
         self,
         mock_copy,
@@ -289,9 +363,9 @@ class TestInitIdempotency:
         assert "already exists" in caplog.text
         assert "Skipping" in caplog.text
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_returns_early_when_config_exists(
         self,
         mock_copy,
@@ -308,12 +382,12 @@ class TestInitIdempotency:
 
         assert "already configured" in caplog.text.lower()
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_force_overwrites_existing_config(
         self,
         mock_copy,
@@ -342,7 +416,7 @@ class TestInitIdempotency:
         mock_secrets.return_value = None
 
         # Mock the pkg.config_file to return our existing config
-        with patch("rots.commands.service.app.get_package") as mock_get_pkg:
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
             mock_pkg = MagicMock()
             mock_pkg.name = "valkey"
             mock_pkg.template_unit = "valkey-server@.service"
@@ -362,7 +436,7 @@ class TestInitIdempotency:
 
     def test_init_dry_run_existing_config_shows_skip_notice(self, caplog, tmp_path):
         """init --dry-run with existing config should show skip notice."""
-        with patch("rots.commands.service.app.get_package") as mock_get_pkg:
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
             mock_pkg = MagicMock()
             mock_pkg.name = "valkey"
             mock_pkg.template_unit = "valkey-server@.service"
@@ -385,7 +459,7 @@ class TestInitIdempotency:
 class TestEnableCommand:
     """Tests for enable command."""
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_enable_calls_systemctl(self, mock_systemctl, capsys):
         """Test enable calls systemctl enable."""
         enable("valkey", "6379")
@@ -394,7 +468,7 @@ class TestEnableCommand:
             "enable", "valkey-server@6379.service", executor=None
         )
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_enable_prints_enabled(self, mock_systemctl, caplog):
         """Test enable prints enabled message."""
         with caplog.at_level(logging.INFO, logger="rots.commands.service.app"):
@@ -407,19 +481,20 @@ class TestEnableCommand:
 class TestDisableCommand:
     """Tests for disable command."""
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_disable_calls_systemctl(self, mock_systemctl, capsys):
-        """Test disable calls systemctl stop and disable."""
+        """Test disable stops and disables in one systemctl call."""
         disable("valkey", "6379", yes=True)
 
-        # Should call stop then disable
-        assert mock_systemctl.call_count >= 2
+        mock_systemctl.assert_called_once_with(
+            "disable", "--now", "valkey-server@6379.service", executor=None
+        )
 
 
 class TestStartCommand:
     """Tests for start command."""
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_start_calls_systemctl(self, mock_systemctl, capsys):
         """Test start calls systemctl start."""
         start("valkey", "6379")
@@ -430,7 +505,7 @@ class TestStartCommand:
 class TestStopCommand:
     """Tests for stop command."""
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_stop_calls_systemctl(self, mock_systemctl, capsys):
         """Test stop calls systemctl stop."""
         stop("valkey", "6379")
@@ -441,7 +516,7 @@ class TestStopCommand:
 class TestRestartCommand:
     """Tests for restart command."""
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_restart_calls_systemctl(self, mock_systemctl, capsys):
         """Test restart calls systemctl restart."""
         restart("valkey", "6379")
@@ -454,7 +529,7 @@ class TestRestartCommand:
 class TestStatusCommand:
     """Tests for status command."""
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_capture")
     def test_status_calls_systemctl_with_instance(self, mock_systemctl, capsys):
         """Test status calls systemctl status for specific instance."""
         mock_systemctl.return_value = MagicMock(stdout="active", stderr="")
@@ -512,10 +587,9 @@ class TestLogsCommand:
 class TestListCommand:
     """Tests for list command."""
 
-    @patch("rots.commands.service.app.is_service_enabled")
-    @patch("rots.commands.service.app.is_service_active")
+    @patch("rots.commands.service._helpers.unit_states")
     @patch("subprocess.run")
-    def test_list_calls_systemctl(self, mock_run, mock_active, mock_enabled, capsys):
+    def test_list_calls_systemctl(self, mock_run, mock_states, capsys):
         """Test list calls systemctl list-units."""
         mock_run.return_value = MagicMock(stdout="")
 
@@ -530,12 +604,12 @@ class TestListCommand:
 class TestInitDefaults:
     """Verify that --start and --enable default to False (opt-in, not opt-out)."""
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_does_not_start_by_default(
         self,
         mock_copy,
@@ -559,12 +633,12 @@ class TestInitDefaults:
             "systemctl start was called despite --start defaulting to False"
         )
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_does_not_enable_by_default(
         self,
         mock_copy,
@@ -587,12 +661,12 @@ class TestInitDefaults:
             "systemctl enable was called despite --enable defaulting to False"
         )
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_no_systemctl_calls_by_default(
         self,
         mock_copy,
@@ -620,12 +694,12 @@ class TestServiceErrorPaths:
     SystemExit(1) on CommandError so the caller gets a non-zero exit.
     """
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_copy_default_config_file_not_found_exits(
         self,
         mock_copy,
@@ -651,12 +725,12 @@ class TestServiceErrorPaths:
         assert exc_info.value.code == 1
         assert "ERROR" in caplog.text
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_start_command_error_exits(
         self,
         mock_copy,
@@ -688,7 +762,7 @@ class TestServiceErrorPaths:
 
         assert exc_info.value.code == 1
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_enable_command_error_exits(self, mock_systemctl, caplog):
         """enable() exits with code 1 when systemctl enable raises CommandError."""
         import pytest
@@ -702,12 +776,12 @@ class TestServiceErrorPaths:
         assert exc_info.value.code == 1
         assert "ERROR" in caplog.text
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_disable_command_error_exits(self, mock_systemctl, caplog):
         """disable() exits with code 1 when systemctl disable raises CommandError."""
         import pytest
 
-        def systemctl_side_effect(action, unit, **kwargs):
+        def systemctl_side_effect(action, *args, **kwargs):
             if action == "disable":
                 raise _make_command_error(stderr="disable failed")
             return MagicMock()
@@ -721,7 +795,7 @@ class TestServiceErrorPaths:
         assert exc_info.value.code == 1
         assert "ERROR" in caplog.text
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_start_command_error_exits(self, mock_systemctl, caplog):
         """start() exits with code 1 when systemctl start raises CommandError."""
         import pytest
@@ -735,7 +809,7 @@ class TestServiceErrorPaths:
         assert exc_info.value.code == 1
         assert "ERROR" in caplog.text
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_stop_command_error_exits(self, mock_systemctl, caplog):
         """stop() exits with code 1 when systemctl stop raises CommandError."""
         import pytest
@@ -749,7 +823,7 @@ class TestServiceErrorPaths:
         assert exc_info.value.code == 1
         assert "ERROR" in caplog.text
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_restart_command_error_exits(self, mock_systemctl, caplog):
         """restart() exits with code 1 when systemctl restart raises CommandError."""
         import pytest
@@ -777,12 +851,12 @@ class TestInitNonNumericInstance:
     def test_init_non_numeric_instance_with_port_succeeds(self, caplog, tmp_path):
         """init with non-numeric instance and explicit --port should work."""
         with (
-            patch("rots.commands.service.app.check_default_service_conflict"),
-            patch("rots.commands.service.app.copy_default_config") as mock_copy,
-            patch("rots.commands.service.app.update_config_value"),
-            patch("rots.commands.service.app.ensure_data_dir") as mock_data,
-            patch("rots.commands.service.app.create_secrets_file") as mock_secrets,
-            patch("rots.commands.service.app.systemctl"),
+            patch("rots.commands.service._helpers.check_default_service_conflict"),
+            patch("rots.commands.service._helpers.copy_default_config") as mock_copy,
+            patch("rots.commands.service._helpers.update_config_values"),
+            patch("rots.commands.service._helpers.ensure_data_dir") as mock_data,
+            patch("rots.commands.service._helpers.create_secrets_file") as mock_secrets,
+            patch("rots.commands.service._helpers.systemctl_run"),
         ):
             mock_copy.return_value = tmp_path / "primary.conf"
             mock_data.return_value = tmp_path / "data"
@@ -795,54 +869,128 @@ class TestInitNonNumericInstance:
         assert "6379" in caplog.text
 
 
+class TestListUnitsForTemplates:
+    """Tests for _list_units_for_templates JSON parsing."""
+
+    @patch("subprocess.run")
+    def test_requests_json_output(self, mock_run):
+        """list-units should be asked for JSON rather than --plain columns."""
+        mock_run.return_value = MagicMock(stdout="[]", returncode=0)
+
+        _list_units_for_templates("valkey-server@")
+
+        call_args = mock_run.call_args[0][0]
+        assert "--output=json" in call_args
+        assert "--plain" not in call_args
+
+    @patch("subprocess.run")
+    def test_description_with_spaces(self, mock_run):
+        """Unit descriptions containing whitespace must not affect parsing."""
+        mock_run.return_value = MagicMock(
+            stdout='[{"unit": "valkey-server@6379.service", "load": "loaded", '
+            '"active": "active", "sub": "running", '
+            '"description": "Advanced key-value store for 6379"}]',
+            returncode=0,
+        )
+
+        assert _list_units_for_templates("valkey-server@") == ["valkey-server@6379.service"]
+
+    @patch("subprocess.run")
+    def test_skips_units_outside_template(self, mock_run):
+        """Only <template>*.service units are returned."""
+        mock_run.return_value = MagicMock(
+            stdout='[{"unit": "valkey-server@6379.service"}, '
+            '{"unit": "valkey-server@6379.socket"}, {"unit": "redis-server@1.service"}]',
+            returncode=0,
+        )
+
+        assert _list_units_for_templates("valkey-server@") == ["valkey-server@6379.service"]
+
+    def test_instance_from_unit(self):
+        """Instance is the text between the template and .service."""
+        assert _instance_from_unit("valkey-server@6379.service", "valkey-server@") == "6379"
+        assert _instance_from_unit("redis-server@cache.service", "redis-server@") == "cache"
+
+    @patch("subprocess.run")
+    def test_invalid_json_returns_empty(self, mock_run):
+        """Unparseable output is treated as no units."""
+        mock_run.return_value = MagicMock(stdout="not json", returncode=0)
+
+        assert _list_units_for_templates("valkey-server@") == []
+
+
 class TestListAllWithInstances:
     """Tests for list_all (default command) when instances are found."""
 
-    @patch("rots.commands.service.app.is_service_enabled")
-    @patch("rots.commands.service.app.is_service_active")
+    @patch("rots.commands.service._helpers.unit_states")
     @patch("subprocess.run")
-    def test_list_all_with_instances_shows_table(self, mock_run, mock_active, mock_enabled, capsys):
+    def test_list_all_with_instances_shows_table(self, mock_run, mock_states, capsys):
         """list_all should display a table when instances are found."""
-        mock_active.return_value = True
-        mock_enabled.return_value = True
-        # Return output that looks like systemctl --plain output for valkey
+        mock_states.return_value = {"valkey-server@6379.service": (True, True)}
+        # Return output that looks like systemctl --output=json output for valkey
         mock_run.return_value = MagicMock(
-            stdout="valkey-server@6379.service loaded active running Valkey\n"
+            stdout='[{"unit": "valkey-server@6379.service", "load": "loaded", '
+            '"active": "active", "sub": "running", "description": "Valkey"}]'
         )
-        with patch("rots.commands.service.app.get_package") as mock_get_pkg:
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
             mock_pkg = MagicMock()
             mock_pkg.name = "valkey"
             mock_pkg.template = "valkey-server@"
             mock_pkg.config_file.return_value = MagicMock(exists=lambda: True)
             mock_get_pkg.return_value = mock_pkg
 
-            with patch("rots.commands.service.app.list_packages", return_value=["valkey"]):
+            with patch("rots.commands.service.packages.list_packages", return_value=["valkey"]):
                 list_all()
 
         captured = capsys.readouterr()
         assert "PACKAGE" in captured.out
         assert "INSTANCE" in captured.out
 
-    @patch("rots.commands.service.app.is_service_enabled")
-    @patch("rots.commands.service.app.is_service_active")
+    @patch("rots.commands.service._helpers.unit_states", return_value={})
     @patch("subprocess.run")
-    def test_list_all_json_output(self, mock_run, mock_active, mock_enabled, capsys):
+    def test_list_all_single_list_units_call(self, mock_run, mock_states, capsys):
+        """list_all should query every package template in one list-units call."""
+        import json
+
+        mock_run.return_value = MagicMock(
+            stdout='[{"unit": "redis-server@6380.service"}, '
+            '{"unit": "valkey-server@6379.service"}]',
+            returncode=0,
+        )
+
+        list_all(json_output=True)
+
+        list_calls = [c for c in mock_run.call_args_list if "list-units" in c[0][0]]
+        assert len(list_calls) == 1
+        cmd = list_calls[0][0][0]
+        assert "redis-server@*" in cmd
+        assert "valkey-server@*" in cmd
+
+        data = json.loads(capsys.readouterr().out)
+        assert [(d["package"], d["instance"]) for d in data] == [
+            ("redis", "6380"),
+            ("valkey", "6379"),
+        ]
+
+    @patch("rots.commands.service._helpers.unit_states")
+    @patch("subprocess.run")
+    def test_list_all_json_output(self, mock_run, mock_states, capsys):
         """list_all --json should output valid JSON."""
         import json
 
-        mock_active.return_value = True
-        mock_enabled.return_value = False
+        mock_states.return_value = {"valkey-server@6379.service": (True, False)}
         mock_run.return_value = MagicMock(
-            stdout="valkey-server@6379.service loaded active running Valkey\n"
+            stdout='[{"unit": "valkey-server@6379.service", "load": "loaded", '
+            '"active": "active", "sub": "running", "description": "Valkey"}]'
         )
-        with patch("rots.commands.service.app.get_package") as mock_get_pkg:
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
             mock_pkg = MagicMock()
             mock_pkg.name = "valkey"
             mock_pkg.template = "valkey-server@"
             mock_pkg.config_file.return_value = MagicMock(exists=lambda: False)
             mock_get_pkg.return_value = mock_pkg
 
-            with patch("rots.commands.service.app.list_packages", return_value=["valkey"]):
+            with patch("rots.commands.service.packages.list_packages", return_value=["valkey"]):
                 list_all(json_output=True)
 
         captured = capsys.readouterr()
@@ -853,26 +1001,22 @@ class TestListAllWithInstances:
 class TestListInstancesWithInstances:
     """Tests for list_instances when instances are found."""
 
-    @patch("rots.commands.service.app.is_service_enabled")
-    @patch("rots.commands.service.app.is_service_active")
+    @patch("rots.commands.service._helpers.unit_states")
     @patch("subprocess.run")
-    def test_list_instances_shows_instance_details(
-        self, mock_run, mock_active, mock_enabled, capsys, tmp_path
-    ):
+    def test_list_instances_shows_instance_details(self, mock_run, mock_states, capsys, tmp_path):
         """list_instances should show each instance when systemctl returns data."""
-        mock_active.return_value = True
-        mock_enabled.return_value = True
+        mock_states.return_value = {"valkey-server@6379.service": (True, True)}
         mock_run.return_value = MagicMock(
-            stdout="valkey-server@6379.service loaded active running Valkey\n"
+            stdout='[{"unit": "valkey-server@6379.service", "load": "loaded", '
+            '"active": "active", "sub": "running", "description": "Valkey"}]'
         )
 
-        with patch("rots.commands.service.app.get_package") as mock_get_pkg:
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
             mock_pkg = MagicMock()
             mock_pkg.name = "valkey"
             mock_pkg.template = "valkey-server@"
             mock_pkg.config_file.return_value = MagicMock(exists=lambda: True)
-            mock_pkg.use_instances_subdir = True
-            mock_pkg.instances_dir = tmp_path
+            mock_pkg.instance_config_dir = tmp_path
             mock_get_pkg.return_value = mock_pkg
 
             list_instances("valkey")
@@ -880,28 +1024,24 @@ class TestListInstancesWithInstances:
         captured = capsys.readouterr()
         assert "6379" in captured.out
 
-    @patch("rots.commands.service.app.is_service_enabled")
-    @patch("rots.commands.service.app.is_service_active")
+    @patch("rots.commands.service._helpers.unit_states")
     @patch("subprocess.run")
-    def test_list_instances_json_output(
-        self, mock_run, mock_active, mock_enabled, capsys, tmp_path
-    ):
+    def test_list_instances_json_output(self, mock_run, mock_states, capsys, tmp_path):
         """list_instances --json should output valid JSON."""
         import json
 
-        mock_active.return_value = False
-        mock_enabled.return_value = False
+        mock_states.return_value = {"valkey-server@6379.service": (False, False)}
         mock_run.return_value = MagicMock(
-            stdout="valkey-server@6379.service loaded inactive dead Valkey\n"
+            stdout='[{"unit": "valkey-server@6379.service", "load": "loaded", '
+            '"active": "inactive", "sub": "dead", "description": "Valkey"}]'
         )
 
-        with patch("rots.commands.service.app.get_package") as mock_get_pkg:
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
             mock_pkg = MagicMock()
             mock_pkg.name = "valkey"
             mock_pkg.template = "valkey-server@"
             mock_pkg.config_file.return_value = MagicMock(exists=lambda: False)
-            mock_pkg.use_instances_subdir = True
-            mock_pkg.instances_dir = tmp_path
+            mock_pkg.instance_config_dir = tmp_path
             mock_get_pkg.return_value = mock_pkg
 
             list_instances("valkey", json_output=True)
@@ -912,6 +1052,81 @@ class TestListInstancesWithInstances:
         assert data[0]["instance"] == "6379"
 
 
+class TestListInstancesConfigFiles:
+    """Tests for the config-file summary in list_instances."""
+
+    @patch("rots.commands.service._helpers.unit_states")
+    @patch("subprocess.run")
+    def test_lists_conf_files_only(self, mock_run, mock_states, capsys, tmp_path):
+        """Only *.conf entries in the config directory are summarised."""
+        (tmp_path / "6380.conf").touch()
+        (tmp_path / "6380.secrets").touch()
+        mock_run.return_value = MagicMock(stdout="[]", returncode=0)
+        mock_states.return_value = {"valkey-server@6380.service": (True, True)}
+
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
+            mock_pkg = MagicMock()
+            mock_pkg.name = "valkey"
+            mock_pkg.template = "valkey-server@"
+            mock_pkg.instance_config_dir = tmp_path
+            mock_pkg.instance_unit.side_effect = lambda i: f"valkey-server@{i}.service"
+            mock_get_pkg.return_value = mock_pkg
+
+            list_instances("valkey")
+
+        out = capsys.readouterr().out
+        assert "Config files in config directory:" in out
+        assert "6380.conf" in out
+        assert "-> active" in out
+        assert "6380.secrets" not in out
+
+    @patch("rots.commands.service._helpers.unit_states", return_value={})
+    @patch("subprocess.run")
+    def test_config_exists_from_directory_listing(self, mock_run, mock_states, capsys, tmp_path):
+        """config_exists comes from one listing of the config directory."""
+        import json
+
+        (tmp_path / "6379.conf").touch()
+        mock_run.return_value = MagicMock(
+            stdout='[{"unit": "redis-server@6379.service"}, {"unit": "redis-server@6380.service"}]',
+            returncode=0,
+        )
+
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
+            mock_pkg = MagicMock()
+            mock_pkg.name = "redis"
+            mock_pkg.template = "redis-server@"
+            mock_pkg.instance_config_dir = tmp_path
+            mock_pkg.config_file_name.side_effect = lambda i: f"{i}.conf"
+            mock_get_pkg.return_value = mock_pkg
+
+            list_instances("redis", json_output=True)
+
+        data = json.loads(capsys.readouterr().out)
+        assert {d["instance"]: d["config_exists"] for d in data} == {
+            "6379": True,
+            "6380": False,
+        }
+        # Discovered units and config-file units share one state query
+        mock_states.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_missing_config_dir(self, mock_run, capsys, tmp_path):
+        """A missing config directory produces no summary."""
+        mock_run.return_value = MagicMock(stdout="[]", returncode=0)
+
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
+            mock_pkg = MagicMock()
+            mock_pkg.name = "valkey"
+            mock_pkg.template = "valkey-server@"
+            mock_pkg.instance_config_dir = tmp_path / "missing"
+            mock_get_pkg.return_value = mock_pkg
+
+            list_instances("valkey")
+
+        assert "Config files" not in capsys.readouterr().out
+
+
 class TestInitDryRunCreate:
     """Tests for init --dry-run when config does not exist."""
 
@@ -919,7 +1134,7 @@ class TestInitDryRunCreate:
         """init --dry-run with no existing config should show 'Would create'."""
         non_existing = tmp_path / "nope.conf"
 
-        with patch("rots.commands.service.app.get_package") as mock_get_pkg:
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
             mock_pkg = MagicMock()
             mock_pkg.name = "valkey"
             mock_pkg.template_unit = "valkey-server@.service"
@@ -939,12 +1154,12 @@ class TestInitDryRunCreate:
 class TestInitForceFileNotFound:
     """Tests for init --force when default config is missing after removing existing."""
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_force_recreate_fails_with_file_not_found(
         self,
         mock_copy,
@@ -972,7 +1187,7 @@ class TestInitForceFileNotFound:
 
         mock_copy.side_effect = copy_side_effect
 
-        with patch("rots.commands.service.app.get_package") as mock_get_pkg:
+        with patch("rots.commands.service.packages.get_package") as mock_get_pkg:
             mock_pkg = MagicMock()
             mock_pkg.name = "valkey"
             mock_pkg.template_unit = "valkey-server@.service"
@@ -993,12 +1208,12 @@ class TestInitForceFileNotFound:
 class TestInitEnableWarning:
     """Tests for init --enable when systemctl enable raises CommandError (warning)."""
 
-    @patch("rots.commands.service.app.check_default_service_conflict")
-    @patch("rots.commands.service.app.systemctl")
-    @patch("rots.commands.service.app.create_secrets_file")
-    @patch("rots.commands.service.app.ensure_data_dir")
-    @patch("rots.commands.service.app.update_config_value")
-    @patch("rots.commands.service.app.copy_default_config")
+    @patch("rots.commands.service._helpers.check_default_service_conflict")
+    @patch("rots.commands.service._helpers.systemctl_run")
+    @patch("rots.commands.service._helpers.create_secrets_file")
+    @patch("rots.commands.service._helpers.ensure_data_dir")
+    @patch("rots.commands.service._helpers.update_config_values")
+    @patch("rots.commands.service._helpers.copy_default_config")
     def test_init_enable_failure_shows_warning_not_exit(
         self,
         mock_copy,
@@ -1032,7 +1247,7 @@ class TestInitEnableWarning:
 class TestDisableAbort:
     """Tests for disable confirmation prompt abort."""
 
-    @patch("rots.commands.service.app.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_run")
     def test_disable_aborts_when_user_says_no(self, mock_systemctl, caplog, monkeypatch):
         """disable should abort without calling systemctl when user declines."""
         monkeypatch.setattr("builtins.input", lambda _: "n")
@@ -2,11 +2,14 @@
 """Tests for service command helpers."""
 
 import subprocess
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from rots.commands.service._helpers import (
+    _files_exist,
+    _list_dir,
     add_secrets_include,
     copy_default_config,
     create_secrets_file,
@@ -14,13 +17,78 @@ from rots.commands.service._helpers import (
     ensure_instances_dir,
     is_service_active,
     is_service_enabled,
-    systemctl,
+    systemctl_capture,
     systemctl_json,
+    systemctl_run,
+    unit_states,
     update_config_value,
+    update_config_values,
 )
 from rots.commands.service.packages import ServicePackage
 
 
+class TestFilesExist:
+    """Tests for _files_exist batch existence check."""
+
+    def test_local_preserves_order(self, tmp_path):
+        """Test local checks return one flag per path in order."""
+        present = tmp_path / "a.conf"
+        present.touch()
+
+        assert _files_exist([tmp_path / "missing.conf", present], None) == [False, True]
+
+    def test_remote_single_round_trip(self):
+        """Test remote checks run one shell command for all paths."""
+        executor = MagicMock()
+        executor.run.return_value = MagicMock(stdout="1\n0\n")
+
+        flags = _files_exist([Path("/etc/a.conf"), Path("/etc/b.conf")], executor)
+
+        assert flags == [True, False]
+        executor.run.assert_called_once()
+        cmd = executor.run.call_args[0][0]
+        assert cmd[:2] == ["sh", "-c"]
+        assert cmd[-2:] == ["/etc/a.conf", "/etc/b.conf"]
+
+    def test_remote_unexpected_output_reports_missing(self):
+        """Test truncated remote output is treated as all missing."""
+        executor = MagicMock()
+        executor.run.return_value = MagicMock(stdout="1\n")
+
+        assert _files_exist([Path("/a"), Path("/b")], executor) == [False, False]
+
+    def test_empty_paths(self):
+        """Test no command is run for an empty list."""
+        executor = MagicMock()
+
+        assert _files_exist([], executor) == []
+        executor.run.assert_not_called()
+
+
+class TestListDir:
+    """Tests for _list_dir directory listing."""
+
+    def test_local_lists_names(self, tmp_path):
+        """Test local listing returns entry names."""
+        (tmp_path / "a.conf").touch()
+        (tmp_path / "b.secrets").touch()
+
+        assert sorted(_list_dir(tmp_path, None)) == ["a.conf", "b.secrets"]
+
+    def test_local_missing_dir(self, tmp_path):
+        """Test a missing local directory lists as empty."""
+        assert _list_dir(tmp_path / "missing", None) == []
+
+    def test_remote_uses_ls(self):
+        """Test remote listing runs ls once."""
+        executor = MagicMock()
+        executor.run.return_value = MagicMock(ok=True, stdout="a.conf\nb.conf\n")
+
+        assert _list_dir(Path("/etc/redis/instances"), executor) == ["a.conf", "b.conf"]
+        executor.run.assert_called_once()
+        assert executor.run.call_args[0][0] == ["ls", "/etc/redis/instances"]
+
+
 class TestEnsureInstancesDir:
     """Tests for ensure_instances_dir function."""
 
@@ -173,6 +241,50 @@ class TestUpdateConfigValue:
         assert "port 6380" in content  # Actual value updated
 
 
+class TestUpdateConfigValues:
+    """Tests for update_config_values function."""
+
+    def test_updates_and_appends_in_one_write(self, tmp_path, mocker):
+        """Test existing keys are rewritten in place and new keys appended."""
+        config_file = tmp_path / "test.conf"
+        config_file.write_text("# port 1234\nport 6379\nbind 127.0.0.1\nsave 60\n")
+
+        pkg = ServicePackage(
+            name="test",
+            template="test@",
+            config_dir=tmp_path,
+            data_dir=tmp_path,
+            config_format="space",
+        )
+        write_spy = mocker.spy(type(config_file), "write_text")
+
+        update_config_values(
+            config_file, {"port": "6380", "bind": "0.0.0.0", "dir": "/var/lib/x"}, pkg
+        )
+
+        assert config_file.read_text() == (
+            "# port 1234\nport 6380\nbind 0.0.0.0\nsave 60\ndir /var/lib/x\n"
+        )
+        assert write_spy.call_count == 1
+
+    def test_equals_format(self, tmp_path):
+        """Test key=value configs keep the = separator."""
+        config_file = tmp_path / "test.conf"
+        config_file.write_text("port=6379\n")
+
+        pkg = ServicePackage(
+            name="test",
+            template="test@",
+            config_dir=tmp_path,
+            data_dir=tmp_path,
+            config_format="equals",
+        )
+
+        update_config_values(config_file, {"port": "6380"}, pkg)
+
+        assert config_file.read_text() == "port=6380\n"
+
+
 class TestCreateSecretsFile:
     """Tests for create_secrets_file function."""
 
@@ -278,19 +390,20 @@ class TestEnsureDataDir:
         assert result == tmp_path / "var" / "test" / "6379"
 
 
-class TestSystemctl:
-    """Tests for systemctl wrapper function."""
+class TestSystemctlCapture:
+    """Tests for systemctl_capture wrapper function."""
 
     @patch("subprocess.run")
     def test_calls_subprocess_run(self, mock_run):
-        """Test systemctl calls subprocess.run."""
+        """Test systemctl_capture calls subprocess.run with captured output."""
         mock_run.return_value = MagicMock(returncode=0)
 
-        systemctl("status", "test.service")
+        systemctl_capture("status", "test.service")
 
         mock_run.assert_called_once()
         call_args = mock_run.call_args[0][0]
         assert call_args == ["systemctl", "status", "test.service"]
+        assert mock_run.call_args[1]["capture_output"] is True
 
     @patch("subprocess.run")
     def test_raises_on_failure_by_default(self, mock_run):
@@ -298,14 +411,87 @@ class TestSystemctl:
         mock_run.side_effect = subprocess.CalledProcessError(1, "systemctl")
 
         with pytest.raises(subprocess.CalledProcessError):
-            systemctl("start", "test.service")
+            systemctl_capture("start", "test.service")
 
     @patch("subprocess.run")
     def test_no_raise_when_check_false(self, mock_run):
         """Test does not raise when check=False."""
         mock_run.return_value = MagicMock(returncode=1)
 
-        result = systemctl("status", "test.service", check=False)
+        result = systemctl_capture("status", "test.service", check=False)
+
+        assert result.returncode == 1
+
+
+class TestSystemctlRun:
+    """Tests for systemctl_run (non-capturing) wrapper function."""
+
+    @patch("subprocess.run")
+    def test_does_not_capture_output(self, mock_run):
+        """Test systemctl_run lets output flow to the terminal."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        result = systemctl_run("start", "test.service")
+
+        call_args = mock_run.call_args
+        assert call_args[0][0] == ["systemctl", "start", "test.service"]
+        assert "capture_output" not in call_args[1]
+        assert "stdout" not in call_args[1]
+        assert result.ok
+        assert result.stdout == ""
+
+    @patch("subprocess.run")
+    def test_uses_dbus_when_available(self, mock_run, mocker):
+        """Test single-unit lifecycle actions skip the subprocess via D-Bus."""
+        mocker.patch("rots.systemd._use_dbus", return_value=True)
+        mock_start = mocker.patch("rots._dbus.start_unit")
+
+        result = systemctl_run("start", "test.service")
+
+        mock_start.assert_called_once_with("test.service")
+        mock_run.assert_not_called()
+        assert result.ok
+
+    @patch("subprocess.run")
+    def test_falls_back_to_cli_when_dbus_fails(self, mock_run, mocker):
+        """Test a D-Bus error (e.g. permission denied) falls back to systemctl."""
+        from rots import _dbus
+
+        mocker.patch("rots.systemd._use_dbus", return_value=True)
+        mocker.patch("rots._dbus.stop_unit", side_effect=_dbus.DBusError("denied"))
+        mock_run.return_value = MagicMock(returncode=0)
+
+        systemctl_run("stop", "test.service")
+
+        assert mock_run.call_args[0][0] == ["systemctl", "stop", "test.service"]
+
+    @patch("subprocess.run")
+    def test_non_dbus_errors_are_not_swallowed(self, mock_run, mocker):
+        """Test only D-Bus errors trigger the CLI fallback."""
+        mocker.patch("rots.systemd._use_dbus", return_value=True)
+        mocker.patch("rots._dbus.stop_unit", side_effect=TypeError("bug"))
+
+        with pytest.raises(TypeError):
+            systemctl_run("stop", "test.service")
+
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_raises_command_error_on_failure(self, mock_run):
+        """Test raises CommandError with the exit code when check=True."""
+        from ots_shared.ssh.executor import CommandError
+
+        mock_run.return_value = MagicMock(returncode=5)
+
+        with pytest.raises(CommandError, match="exit 5"):
+            systemctl_run("start", "test.service")
+
+    @patch("subprocess.run")
+    def test_no_raise_when_check_false(self, mock_run):
+        """Test does not raise when check=False."""
+        mock_run.return_value = MagicMock(returncode=1)
+
+        result = systemctl_run("stop", "test.service", check=False)
 
         assert result.returncode == 1
 
@@ -335,7 +521,7 @@ class TestSystemctlJson:
 class TestIsServiceActive:
     """Tests for is_service_active function."""
 
-    @patch("rots.commands.service._helpers.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_capture")
     def test_returns_true_when_active(self, mock_systemctl):
         """Test returns True when service is active."""
         mock_systemctl.return_value = MagicMock(returncode=0)
@@ -344,7 +530,7 @@ class TestIsServiceActive:
 
         assert result is True
 
-    @patch("rots.commands.service._helpers.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_capture")
     def test_returns_false_when_inactive(self, mock_systemctl):
         """Test returns False when service is inactive."""
         mock_systemctl.return_value = MagicMock(returncode=3)
@@ -357,7 +543,7 @@ class TestIsServiceActive:
 class TestIsServiceEnabled:
     """Tests for is_service_enabled function."""
 
-    @patch("rots.commands.service._helpers.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_capture")
     def test_returns_true_when_enabled(self, mock_systemctl):
         """Test returns True when service is enabled."""
         mock_systemctl.return_value = MagicMock(returncode=0)
@@ -366,7 +552,7 @@ class TestIsServiceEnabled:
 
         assert result is True
 
-    @patch("rots.commands.service._helpers.systemctl")
+    @patch("rots.commands.service._helpers.systemctl_capture")
     def test_returns_false_when_disabled(self, mock_systemctl):
         """Test returns False when service is disabled."""
         mock_systemctl.return_value = MagicMock(returncode=1)
@@ -374,3 +560,70 @@ class TestIsServiceEnabled:
         result = is_service_enabled("test.service")
 
         assert result is False
+
+
+class TestUnitStates:
+    """Tests for unit_states function."""
+
+    @patch("rots.commands.service._helpers.systemctl_capture")
+    def test_single_show_call_for_all_units(self, mock_systemctl):
+        """Test one systemctl show covers every unit."""
+        mock_systemctl.return_value = MagicMock(
+            stdout=(
+                "Id=valkey-server@6379.service\n"
+                "ActiveState=active\n"
+                "UnitFileState=enabled\n"
+                "\n"
+                "Id=valkey-server@6380.service\n"
+                "ActiveState=inactive\n"
+                "UnitFileState=disabled\n"
+            )
+        )
+
+        states = unit_states(["valkey-server@6379.service", "valkey-server@6380.service"])
+
+        mock_systemctl.assert_called_once()
+        args = mock_systemctl.call_args[0]
+        assert args[0] == "show"
+        assert "valkey-server@6379.service" in args
+        assert "valkey-server@6380.service" in args
+        assert states == {
+            "valkey-server@6379.service": (True, True),
+            "valkey-server@6380.service": (False, False),
+        }
+
+    @pytest.mark.parametrize(
+        ("unit_file_state", "enabled"),
+        [
+            ("enabled", True),
+            ("enabled-runtime", True),
+            ("static", True),
+            ("alias", True),
+            ("indirect", True),
+            ("generated", True),
+            ("transient", True),
+            ("linked", False),
+            ("linked-runtime", False),
+            ("disabled", False),
+            ("masked", False),
+            ("masked-runtime", False),
+            ("bad", False),
+            ("", False),
+        ],
+    )
+    @patch("rots.commands.service._helpers.systemctl_capture")
+    def test_enabled_matches_is_enabled_semantics(self, mock_systemctl, unit_file_state, enabled):
+        """Test UnitFileState maps to enabled the way is-enabled's exit code did."""
+        mock_systemctl.return_value = MagicMock(
+            stdout=f"Id=redis-server@1.service\nActiveState=active\nUnitFileState={unit_file_state}\n"
+        )
+
+        states = unit_states(["redis-server@1.service"])
+
+        assert states["redis-server@1.service"] == (True, enabled)
+
+    @patch("rots.commands.service._helpers.systemctl_capture")
+    def test_empty_units_skips_systemctl(self, mock_systemctl):
+        """Test no systemctl call is made when there are no units."""
+        assert unit_states([]) == {}
+        mock_systemctl.assert_not_called()
@@ -9,6 +9,7 @@ from rots.commands.service.packages import (
     PACKAGES,
     REDIS,
     VALKEY,
+    VALKEY_SECRETS,
     SecretConfig,
     ServicePackage,
     get_package,
@@ -79,6 +80,10 @@ class TestServicePackage:
         assert VALKEY.instances_dir == Path("/etc/valkey/instances")
         assert REDIS.instances_dir == Path("/etc/redis/instances")
 
+    def test_instances_dir_is_cached(self):
+        """instances_dir is computed once per package."""
+        assert VALKEY.instances_dir is VALKEY.instances_dir
+
     def test_template_unit_property(self):
         """Test template_unit derived property."""
         assert VALKEY.template_unit == "valkey-server@.service"
@@ -94,6 +99,29 @@ class TestServicePackage:
         assert VALKEY.config_file("6379") == Path("/etc/valkey/valkey-6379.conf")
         assert REDIS.config_file("6380") == Path("/etc/redis/instances/6380.conf")
 
+    def test_config_file_pattern_without_placeholder_prefix_split(self):
+        """Patterns that can't be split once still format correctly."""
+        pkg = ServicePackage(
+            name="test",
+            template="test@",
+            config_dir=Path("/etc/test"),
+            data_dir=Path("/var/lib/test"),
+            config_file_pattern="{instance}/{instance}.conf",
+            use_instances_subdir=False,
+        )
+        assert pkg.config_file("1") == Path("/etc/test/1/1.conf")
+
+    def test_instance_config_dir(self):
+        """Test instance_config_dir follows use_instances_subdir."""
+        assert VALKEY.instance_config_dir == Path("/etc/valkey")
+        assert REDIS.instance_config_dir == Path("/etc/redis/instances")
+
+    def test_config_file_name(self):
+        """config_file_name returns the bare file name used by config_file."""
+        assert VALKEY.config_file_name("6379") == "valkey-6379.conf"
+        assert REDIS.config_file_name("6380") == "6380.conf"
+        assert VALKEY.config_file("6379").name == VALKEY.config_file_name("6379")
+
     def test_secrets_file(self):
         """Test secrets_file method."""
         assert VALKEY.secrets_file("6379") == Path("/etc/valkey/valkey-6379.secrets")
@@ -122,6 +150,10 @@ class TestServicePackage:
         with pytest.raises(FrozenInstanceError):
             setattr(VALKEY, "name", "changed")
 
+    def test_secret_config_is_slotted(self):
+        """SecretConfig instances carry no per-instance __dict__."""
+        assert not hasattr(VALKEY_SECRETS, "__dict__")
+
 
 class TestPackageRegistry:
     """Tests for package registry functions."""
@@ -136,6 +168,11 @@ class TestPackageRegistry:
         assert "redis" in PACKAGES
         assert PACKAGES["redis"] is REDIS
 
+    def test_packages_registry_is_read_only(self):
+        """PACKAGES is a read-only mapping."""
+        with pytest.raises(TypeError):
+            PACKAGES["other"] = VALKEY  # type: ignore[index]
+
     def test_get_package_valkey(self):
         """Test get_package returns valkey."""
         pkg = get_package("valkey")
@@ -36,7 +36,9 @@ class TestAssetsSyncCommand:
 
         from unittest.mock import ANY
 
-        mock_update.assert_called_once_with(mock_config, create_volume=False, executor=ANY)
+        mock_update.assert_called_once_with(
+            mock_config, create_volume=False, force=False, executor=ANY
+        )
 
     def test_sync_calls_assets_update(self, mocker):
         """sync should call assets_module.update."""
@@ -50,7 +52,9 @@ class TestAssetsSyncCommand:
 
         from unittest.mock import ANY
 
-        mock_update.assert_called_once_with(mock_config, create_volume=False, executor=ANY)
+        mock_update.assert_called_once_with(
+            mock_config, create_volume=False, force=False, executor=ANY
+        )
 
     def test_sync_with_create_volume(self, mocker):
         """sync --create-volume should pass flag to update."""
@@ -64,7 +68,25 @@ class TestAssetsSyncCommand:
 
         from unittest.mock import ANY
 
-        mock_update.assert_called_once_with(mock_config, create_volume=True, executor=ANY)
+        mock_update.assert_called_once_with(
+            mock_config, create_volume=True, force=False, executor=ANY
+        )
+
+    def test_sync_with_force(self, mocker):
+        """sync --force should pass force to update."""
+        from rots.commands import assets
+
+        mock_config = mocker.MagicMock()
+        mocker.patch("rots.commands.assets.Config", return_value=mock_config)
+        mock_update = mocker.patch("rots.commands.assets.assets_module.update")
+
+        assets.sync(force=True)
+
+        from unittest.mock import ANY
+
+        mock_update.assert_called_once_with(
+            mock_config, create_volume=False, force=True, executor=ANY
+        )
 
 
 class TestAssetsSyncHostContext:
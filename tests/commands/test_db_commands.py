@@ -1,5 +1,5 @@
 # tests/commands/test_db_commands.py
-"""Tests for db CLI commands (backup, restore, info, deployments)."""
+"""Tests for db CLI commands (backup, restore, info, deployments, maintenance)."""
 
 import json
 import logging
@@ -589,3 +589,36 @@ class TestInfoCommand:
         assert data["total_deployments"] == 1
         assert data["size_bytes"] > 0
         assert len(data["aliases"]) == 1
+
+
+class TestMaintenanceCommand:
+    """Tests for the 'ots db maintenance' command."""
+
+    def test_maintenance_exits_when_db_missing(self, tmp_path, mocker, caplog):
+        """Should exit with code 1 when database does not exist."""
+        from rots.commands.db import maintenance
+
+        _mock_config(mocker, tmp_path / "missing.db")
+
+        with pytest.raises(SystemExit) as exc_info:
+            with caplog.at_level(logging.ERROR):
+                maintenance()
+
+        assert exc_info.value.code == 1
+        assert "not found" in caplog.text
+
+    def test_maintenance_truncates_wal(self, tmp_path, mocker, capsys):
+        """Should fold the WAL into the main file, leaving it empty."""
+        from rots.commands.db import maintenance
+
+        db_path = tmp_path / "deploy.db"
+        db_module.record_deployment(db_path, "img", "v1", "deploy")
+        _mock_config(mocker, db_path)
+
+        maintenance(json_output=True)
+
+        data = json.loads(capsys.readouterr().out)
+        assert data["success"] is True
+        wal = db_path.with_name(db_path.name + "-wal")
+        assert not wal.exists() or wal.stat().st_size == 0
+        assert len(db_module.get_deployments(db_path)) == 1
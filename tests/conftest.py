@@ -7,6 +7,8 @@ behavior should override with their own mocker.patch().
 
 import pytest
 
+from rots import db, quadlet
+
 
 @pytest.fixture(autouse=True)
 def _mock_secret_exists(mocker):
@@ -24,3 +26,12 @@ def _mock_secret_exists(mocker):
         "rots.quadlet.secret_exists",
         return_value=False,
     )
+
+
+@pytest.fixture(autouse=True)
+def _close_db_connections():
+    """Close cached SQLite connections and memo caches so each test starts fresh."""
+    yield
+    db.close_connections()
+    db.invalidate_alias_cache()
+    quadlet._env_secrets_cache.clear()
@@ -237,18 +237,18 @@ class TestProxyReloadRemoteViaSsh:
 
 
 class TestServiceSystemctlRemoteViaSsh:
-    """Test service _helpers.systemctl remote path through a real SSH transport."""
+    """Test service _helpers.systemctl_capture remote path through a real SSH transport."""
 
     def test_systemctl_remote_success(self, fake_ssh_server):
-        """systemctl with SSHExecutor should capture active status."""
-        from rots.commands.service._helpers import systemctl
+        """systemctl_capture with SSHExecutor should capture active status."""
+        from rots.commands.service._helpers import systemctl_capture
 
         fake_ssh_server.add_response("systemctl is-active", stdout="active\n")
 
         client = fake_ssh_server.connect()
         try:
             executor = SSHExecutor(client)
-            result = systemctl(
+            result = systemctl_capture(
                 "is-active", "valkey-server@6379.service", check=False, executor=executor
             )
             assert result.returncode == 0
@@ -257,15 +257,15 @@ class TestServiceSystemctlRemoteViaSsh:
             client.close()
 
     def test_systemctl_remote_inactive(self, fake_ssh_server):
-        """systemctl should report inactive service correctly."""
-        from rots.commands.service._helpers import systemctl
+        """systemctl_capture should report inactive service correctly."""
+        from rots.commands.service._helpers import systemctl_capture
 
         fake_ssh_server.add_response("systemctl is-active", stdout="inactive\n", exit_code=3)
 
         client = fake_ssh_server.connect()
         try:
             executor = SSHExecutor(client)
-            result = systemctl(
+            result = systemctl_capture(
                 "is-active", "valkey-server@6379.service", check=False, executor=executor
             )
             assert result.returncode == 3
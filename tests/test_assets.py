@@ -64,8 +64,8 @@ class TestAssetsUpdate:
             _ok(["podman", "volume", "create", "static_assets"]),
             # volume.mount returns empty path
             _ok(["podman", "volume", "mount", "static_assets"], stdout=""),
-            # image.exists succeeds
-            _ok(["podman", "image", "exists"]),
+            # image.inspect succeeds
+            _ok(["podman", "image", "inspect"]),
             # pre-cleanup rm (no leftover container)
             _ok(["podman", "rm", TEMP_CONTAINER_NAME]),
             # podman.create succeeds
@@ -101,8 +101,8 @@ class TestAssetsUpdate:
                 ["podman", "volume", "mount", "static_assets"],
                 stdout=f"{fake_volume_path}\n",
             ),
-            # image.exists succeeds
-            _ok(["podman", "image", "exists"]),
+            # image.inspect succeeds
+            _ok(["podman", "image", "inspect"]),
             # pre-cleanup rm
             _ok(["podman", "rm", TEMP_CONTAINER_NAME]),
             # podman.create succeeds
@@ -135,8 +135,8 @@ class TestAssetsUpdate:
                 ["podman", "volume", "mount", "static_assets"],
                 stdout=f"{fake_volume_path}\n",
             ),
-            # image.exists succeeds
-            _ok(["podman", "image", "exists"]),
+            # image.inspect succeeds
+            _ok(["podman", "image", "inspect"]),
             # pre-cleanup rm
             _ok(["podman", "rm", TEMP_CONTAINER_NAME]),
             # podman.create succeeds
@@ -188,8 +188,8 @@ class TestAssetsUpdate:
                 ["podman", "volume", "mount", "static_assets"],
                 stdout=f"{fake_volume_path}\n",
             ),
-            # image.exists succeeds
-            _ok(["podman", "image", "exists"]),
+            # image.inspect succeeds
+            _ok(["podman", "image", "inspect"]),
             # pre-cleanup rm (no leftover container)
             _ok(["podman", "rm", TEMP_CONTAINER_NAME]),
             # podman.create succeeds with --image-volume=ignore
@@ -236,8 +236,8 @@ class TestAssetsUpdate:
                 ["podman", "volume", "mount", "static_assets"],
                 stdout=f"{fake_volume_path}\n",
             ),
-            # image.exists succeeds
-            _ok(["podman", "image", "exists"]),
+            # image.inspect succeeds
+            _ok(["podman", "image", "inspect"]),
             # pre-cleanup rm succeeds (leftover container existed)
             _ok(["podman", "rm", TEMP_CONTAINER_NAME]),
             # podman.create succeeds
@@ -271,8 +271,8 @@ class TestAssetsUpdate:
                 ["podman", "volume", "mount", "static_assets"],
                 stdout=f"{fake_volume_path}\n",
             ),
-            # image.exists succeeds (image is present but create still fails)
-            _ok(["podman", "image", "exists"]),
+            # image.inspect succeeds (image is present but create still fails)
+            _ok(["podman", "image", "inspect"]),
             # pre-cleanup rm
             _ok(["podman", "rm", TEMP_CONTAINER_NAME]),
             # podman.create fails
@@ -306,7 +306,7 @@ class TestAssetsUpdate:
                 stdout=f"{fake_volume_path}\n",
             ),
             # image.exists fails — image not found locally
-            subprocess.CompletedProcess(args=["podman", "image", "exists"], returncode=1),
+            subprocess.CompletedProcess(args=["podman", "image", "inspect"], returncode=1),
         ]
 
         cfg = mocker.MagicMock(spec=Config)
@@ -333,7 +333,7 @@ class TestAssetsUpdate:
                 stdout=f"{fake_volume_path}\n",
             ),
             # image.exists fails — image not found locally
-            subprocess.CompletedProcess(args=["podman", "image", "exists"], returncode=1),
+            subprocess.CompletedProcess(args=["podman", "image", "inspect"], returncode=1),
         ]
 
         cfg = mocker.MagicMock(spec=Config)
@@ -348,6 +348,148 @@ class TestAssetsUpdate:
         assert "pull" in error_msg.lower()
 
 
+# =============================================================================
+# Sync marker (skip when unchanged)
+# =============================================================================
+
+
+class TestAssetsUpdateSyncMarker:
+    """Test that update skips the copy when the volume matches the image ID."""
+
+    @pytest.fixture(autouse=True)
+    def _skip_podman_check(self, mocker):
+        mocker.patch("rots.assets.require_podman")
+
+    def test_skips_copy_when_marker_matches(self, mocker, tmp_path):
+        """A marker holding the current image ID should short-circuit the sync."""
+        mock_run = mocker.patch("subprocess.run")
+        var_dir = tmp_path / "var"
+        var_dir.mkdir()
+        (var_dir / assets.SYNC_MARKER_NAME).write_text("sha256:abc\n")
+        manifest = tmp_path / assets.MANIFEST_RELPATH
+        manifest.parent.mkdir(parents=True)
+        manifest.write_text("{}")
+        cfg = mocker.MagicMock(spec=Config)
+        cfg.var_dir = var_dir
+
+        mock_run.side_effect = [
+            _ok(["podman", "volume", "mount", "static_assets"], stdout=f"{tmp_path}\n"),
+            _ok(["podman", "image", "inspect"], stdout="sha256:abc\n"),
+        ]
+
+        assets.update(cfg, create_volume=False)
+
+        assert mock_run.call_count == 2
+
+    def test_cleanup_then_deploy_copies_into_recreated_volume(self, mocker, tmp_path):
+        """A marker left behind by a removed volume must not skip the copy.
+
+        Regression: cleanup removed static_assets, deploy recreated it empty,
+        the stale marker still matched the image and Caddy served nothing.
+        """
+        from rots.commands import instance
+
+        mock_run = mocker.patch("subprocess.run")
+        volume = tmp_path / "volume"
+        volume.mkdir()
+        var_dir = tmp_path / "var"
+        var_dir.mkdir()
+        marker = var_dir / assets.SYNC_MARKER_NAME
+        marker.write_text("sha256:abc\n")
+        cfg = mocker.MagicMock(spec=Config)
+        cfg.var_dir = var_dir
+
+        # cleanup: volume rm succeeds and the marker goes with it
+        mocker.patch("rots.commands.instance.app.Config", return_value=cfg)
+        cfg.get_executor.return_value = None
+        mock_run.side_effect = [_ok(["podman", "volume", "rm", "static_assets"], stderr="")]
+        instance.cleanup(yes=True)
+        assert not marker.exists()
+
+        # Even if the marker survived, a freshly created volume is never skipped
+        marker.write_text("sha256:abc\n")
+        mock_run.side_effect = [
+            _ok(["podman", "volume", "create", "static_assets"]),
+            _ok(["podman", "volume", "mount", "static_assets"], stdout=f"{volume}\n"),
+            _ok(["podman", "image", "inspect"], stdout="sha256:abc\n"),
+            _ok(["podman", "rm", TEMP_CONTAINER_NAME]),
+            _ok(["podman", "create", "image:tag"], stdout="abc123\n"),
+            _ok(["podman", "cp", "abc123:/app/public/.", str(volume)]),
+            _ok(["podman", "rm", "abc123"]),
+        ]
+
+        assets.update(cfg, create_volume=True)
+
+        assert mock_run.call_count == 8
+        assert mock_run.call_args_list[6][0][0][:2] == ["podman", "cp"]
+
+    def test_copies_when_marker_matches_but_manifest_missing(self, mocker, tmp_path):
+        """An existing but emptied volume is re-synced despite a matching marker."""
+        mock_run = mocker.patch("subprocess.run")
+        volume = tmp_path / "volume"
+        volume.mkdir()
+        cfg = mocker.MagicMock(spec=Config)
+        cfg.var_dir = tmp_path
+        (tmp_path / assets.SYNC_MARKER_NAME).write_text("sha256:abc\n")
+
+        mock_run.side_effect = [
+            _ok(["podman", "volume", "mount", "static_assets"], stdout=f"{volume}\n"),
+            _ok(["podman", "image", "inspect"], stdout="sha256:abc\n"),
+            _ok(["podman", "rm", TEMP_CONTAINER_NAME]),
+            _ok(["podman", "create", "image:tag"], stdout="abc123\n"),
+            _ok(["podman", "cp", "abc123:/app/public/.", str(volume)]),
+            _ok(["podman", "rm", "abc123"]),
+        ]
+
+        assets.update(cfg, create_volume=False)
+
+        assert mock_run.call_count == 6
+
+    def test_marker_not_in_served_volume(self, mocker, tmp_path):
+        """The marker is written under var_dir, never into the assets volume."""
+        mock_run = mocker.patch("subprocess.run")
+        volume = tmp_path / "volume"
+        volume.mkdir()
+        cfg = mocker.MagicMock(spec=Config)
+        cfg.var_dir = tmp_path / "var"
+
+        mock_run.side_effect = [
+            _ok(["podman", "volume", "mount", "static_assets"], stdout=f"{volume}\n"),
+            _ok(["podman", "image", "inspect"], stdout="sha256:new\n"),
+            _ok(["podman", "rm", TEMP_CONTAINER_NAME]),
+            _ok(["podman", "create", "image:tag"], stdout="abc123\n"),
+            _ok(["podman", "cp", "abc123:/app/public/.", str(volume)]),
+            _ok(["podman", "rm", "abc123"]),
+        ]
+
+        assets.update(cfg, create_volume=False)
+
+        assert (cfg.var_dir / assets.SYNC_MARKER_NAME).read_text().strip() == "sha256:new"
+        assert list(volume.iterdir()) == []
+
+    def test_force_copies_and_writes_marker(self, mocker, tmp_path):
+        """force=True should copy despite a matching marker and rewrite it."""
+        mock_run = mocker.patch("subprocess.run")
+        marker = tmp_path / assets.SYNC_MARKER_NAME
+        marker.write_text("sha256:old\n")
+        cfg = mocker.MagicMock(spec=Config)
+        cfg.var_dir = tmp_path
+
+        mock_run.side_effect = [
+            _ok(["podman", "volume", "mount", "static_assets"], stdout=f"{tmp_path}\n"),
+            _ok(["podman", "image", "inspect"], stdout="sha256:new\n"),
+            _ok(["podman", "rm", TEMP_CONTAINER_NAME]),
+            _ok(["podman", "create", "image:tag"], stdout="abc123\n"),
+            _ok(["podman", "cp", "abc123:/app/public/.", str(tmp_path)]),
+            _ok(["podman", "rm", "abc123"]),
+        ]
+
+        assets.update(cfg, create_volume=False, force=True)
+
+        assert mock_run.call_count == 6
+        assert marker.read_text().strip() == "sha256:new"
+
+
 # =============================================================================
 # Remote executor tests
 # =============================================================================
@@ -389,8 +531,8 @@ class TestAssetsUpdateRemote:
         mock_mount_result.stdout = "/var/lib/containers/storage/volumes/static_assets/_data\n"
         mock_p.volume.mount.return_value = mock_mount_result
 
-        # image.exists returns ok
-        mock_p.image.exists.return_value = _make_remote_result(returncode=0)
+        # image.inspect returns ok
+        mock_p.image.inspect.return_value = _make_remote_result(returncode=0)
 
         # create returns container id
         mock_p.create.return_value = _make_remote_result(stdout="abc123\n")
@@ -91,6 +91,20 @@ class TestCLISubcommands:
         captured = capsys.readouterr()
         assert "assets" in captured.out.lower() or "sync" in captured.out.lower()
 
+    def test_service_subcommand_exists(self, capsys):
+        """service subcommand should resolve its lazily registered app."""
+        with pytest.raises(SystemExit) as exc_info:
+            app(["service", "--help"])
+        assert exc_info.value.code == 0
+        captured = capsys.readouterr()
+        assert "valkey" in captured.out.lower()
+
+    def test_service_alias_exists(self):
+        """services alias should route to the same app."""
+        with pytest.raises(SystemExit) as exc_info:
+            app(["services", "--help"])
+        assert exc_info.value.code == 0
+
     def test_invalid_subcommand_fails(self):
         """Invalid subcommand should fail."""
         with pytest.raises(SystemExit) as exc_info:
@@ -121,7 +135,9 @@ class TestAssetsSync:
         assert exc_info.value.code == 0
         from unittest.mock import ANY
 
-        mock_update.assert_called_once_with(mock_config, create_volume=False, executor=ANY)
+        mock_update.assert_called_once_with(
+            mock_config, create_volume=False, force=False, executor=ANY
+        )
 
 
 class TestDefaultCommand:
@@ -424,7 +424,7 @@ class TestGetExistingConfigFilesRemote:
         assert len(result) == 2
 
     def test_probes_remote_filesystem_for_ssh_executor(self):
-        """Should use 'test -f' via executor for each config file on remote hosts."""
+        """Should probe every config file on the remote host in one round trip."""
         from pathlib import Path
         from unittest.mock import MagicMock
 
@@ -441,24 +441,27 @@ class TestGetExistingConfigFilesRemote:
         mock_client = MagicMock(spec=paramiko.SSHClient)
         ex = SSHExecutor(mock_client)
 
-        # config.yaml exists, all others do not
+        # config.yaml and puma.rb exist, all others do not
         ex.run = MagicMock(
-            side_effect=[
-                Result(command="test", returncode=0, stdout="", stderr=""),  # config.yaml
-                Result(command="test", returncode=1, stdout="", stderr=""),  # auth.yaml
-                Result(command="test", returncode=1, stdout="", stderr=""),  # logging.yaml
-                Result(command="test", returncode=1, stdout="", stderr=""),  # billing.yaml
-                Result(command="test", returncode=1, stdout="", stderr=""),  # Caddyfile.template
-                Result(command="test", returncode=1, stdout="", stderr=""),  # puma.rb
-            ]
+            return_value=Result(
+                command="sh",
+                returncode=0,
+                stdout="/etc/onetimesecret/config.yaml\n/etc/onetimesecret/puma.rb\n",
+                stderr="",
+            )
         )
 
         cfg = Config(config_dir=Path("/etc/onetimesecret"))
         result = cfg.get_existing_config_files(executor=ex)
 
-        assert len(result) == 1
-        assert result[0] == Path("/etc/onetimesecret/config.yaml")
-        assert ex.run.call_count == 6
+        assert result == [
+            Path("/etc/onetimesecret/config.yaml"),
+            Path("/etc/onetimesecret/puma.rb"),
+        ]
+        ex.run.assert_called_once()
+        cmd = ex.run.call_args[0][0]
+        assert cmd[:2] == ["sh", "-c"]
+        assert "/etc/onetimesecret/auth.yaml" in cmd
 
 
 class TestConfigRegistry:
@@ -547,6 +550,18 @@ class TestConfigRegistryAuthFile:
             expected = Path.home() / ".config" / "containers" / "auth.json"
             assert cfg.registry_auth_file == expected
 
+    def test_resolved_once_per_config(self, monkeypatch, tmp_path):
+        """The resolved path is cached; later env changes don't re-probe."""
+        first = tmp_path / "first-auth.json"
+        monkeypatch.setenv("REGISTRY_AUTH_FILE", str(first))
+        from rots.config import Config
+
+        cfg = Config()
+        assert cfg.registry_auth_file == first
+        monkeypatch.setenv("REGISTRY_AUTH_FILE", str(tmp_path / "second-auth.json"))
+        assert cfg.registry_auth_file == first
+        assert Config().registry_auth_file == tmp_path / "second-auth.json"
+
 
 class TestGetRegistryAuthFile:
     """Test Config.get_registry_auth_file(executor) method."""
@@ -743,6 +758,30 @@ class TestConfigResolveImageTag:
         assert image == "ghcr.io/onetimesecret/onetimesecret"
         assert tag == "v1.0.0"
 
+    def test_memoizes_alias_lookup_until_next_write(self, monkeypatch, tmp_path, mocker):
+        """Repeated resolution should hit the DB once, and again after an alias write."""
+        from rots import db
+        from rots.config import Config
+
+        db_path = tmp_path / "deployments.db"
+        db.init_db(db_path)
+        db.set_current(db_path, "ghcr.io/onetimesecret/onetimesecret", "v1.0.0")
+
+        monkeypatch.delenv("TAG", raising=False)
+        cfg = Config(var_dir=tmp_path)
+        spy = mocker.spy(db, "get_connection")
+
+        assert cfg.resolve_image_tag()[1] == "v1.0.0"
+        assert cfg.resolved_image_with_tag().endswith(":v1.0.0")
+        assert Config(var_dir=tmp_path).resolve_image_tag()[1] == "v1.0.0"
+        assert spy.call_count == 1
+
+        db.set_current(db_path, "ghcr.io/onetimesecret/onetimesecret", "v2.0.0")
+        spy.reset_mock()
+
+        assert cfg.resolve_image_tag()[1] == "v2.0.0"
+        assert spy.call_count == 1
+
     def test_falls_back_to_sentinel_when_no_alias(self, monkeypatch, tmp_path):
         """When no CURRENT alias is set, resolve_image_tag returns the sentinel '@current'.
 
@@ -3,6 +3,7 @@
 
 import json
 import sqlite3
+from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
@@ -31,6 +32,24 @@ class TestInitDb:
 
         assert db_path.exists()
 
+    def test_init_db_enables_wal(self, tmp_path):
+        """init_db should leave the database in WAL journal mode."""
+        db_path = tmp_path / "test.db"
+        db.init_db(db_path)
+
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_get_connection_applies_pragmas(self, tmp_path):
+        """Connections from get_connection use synchronous=NORMAL (1)."""
+        db_path = tmp_path / "test.db"
+        with db.get_connection(db_path) as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
     def test_init_db_creates_parent_dirs(self, tmp_path):
         """init_db should create parent directories."""
         db_path = tmp_path / "subdir" / "test.db"
@@ -93,6 +112,44 @@ class TestInitDb:
         assert "idx_deployments_timestamp" in indexes
         assert "idx_deployments_port" in indexes
         assert "idx_deployments_tag" in indexes
+        assert "idx_deployments_rollback" in indexes
+        assert "idx_service_actions_pkg_inst_ts" in indexes
+
+    def test_rollback_query_uses_covering_index(self, tmp_path):
+        """The rollback timeline lookup should be answered from the index alone."""
+        db_path = tmp_path / "test.db"
+        db.init_db(db_path)
+
+        conn = sqlite3.connect(db_path)
+        plan = conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT image, tag, MAX(id) AS last_id FROM deployments
+            WHERE success = 1 AND action IN ('deploy', 'redeploy', 'set-current')
+            GROUP BY image, tag ORDER BY last_id DESC LIMIT 2
+            """
+        ).fetchall()
+        conn.close()
+
+        assert any("USING COVERING INDEX idx_deployments_rollback" in row[-1] for row in plan)
+
+    def test_previous_tags_query_uses_covering_index(self, tmp_path):
+        """get_previous_tags' grouping query should not need a table lookup."""
+        db_path = tmp_path / "test.db"
+        db.init_db(db_path)
+
+        conn = sqlite3.connect(db_path)
+        plan = conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT image, tag, MAX(timestamp) AS last_used FROM deployments
+            WHERE success = 1 AND action IN ('deploy', 'redeploy', 'set-current')
+            GROUP BY image, tag ORDER BY last_used DESC LIMIT 10
+            """
+        ).fetchall()
+        conn.close()
+
+        assert any("USING COVERING INDEX idx_deployments_rollback" in row[-1] for row in plan)
 
 
 class TestGetConnection:
@@ -127,6 +184,58 @@ class TestGetConnection:
         assert row["tag"] == "v1"
         assert row["id"] == 1
 
+    def test_get_connection_reuses_cached_connection(self, tmp_path):
+        """Repeated get_connection calls share one connection until closed."""
+        db_path = tmp_path / "test.db"
+
+        with db.get_connection(db_path) as first:
+            pass
+        with db.get_connection(db_path) as second:
+            pass
+        assert first is second
+
+        db.close_connections()
+        with db.get_connection(db_path) as third:
+            pass
+        assert third is not first
+
+    def test_close_connections_closes_even_if_optimize_fails(self, mocker):
+        """A failing PRAGMA optimize must not leave the connection open."""
+        conn = mocker.MagicMock()
+        conn.execute.side_effect = sqlite3.OperationalError("database is locked")
+        mocker.patch.dict(db._conn_cache, {("x.db", 1): conn})
+
+        db.close_connections()
+
+        conn.close.assert_called_once_with()
+        assert db._conn_cache == {}
+
+    def test_get_connection_autocommits_single_statements(self, tmp_path):
+        """Connections run in autocommit mode: no implicit BEGIN before a write."""
+        db_path = tmp_path / "test.db"
+
+        with db.get_connection(db_path) as conn:
+            conn.execute(
+                "INSERT INTO deployments (image, tag, action) VALUES ('img', 'v1', 'deploy')"
+            )
+            assert not conn.in_transaction
+
+        assert len(db.get_deployments(db_path)) == 1
+
+    def test_get_connection_rolls_back_uncommitted_work(self, tmp_path):
+        """Writes left uncommitted at block exit are discarded, not leaked."""
+        db_path = tmp_path / "test.db"
+
+        with db.get_connection(db_path) as conn:
+            conn.execute("BEGIN")
+            conn.execute(
+                "INSERT INTO deployments (image, tag, action) VALUES ('img', 'v1', 'deploy')"
+            )
+            assert conn.in_transaction
+
+        assert not conn.in_transaction
+        assert db.get_deployments(db_path) == []
+
 
 class TestRecordDeployment:
     """Test deployment recording."""
@@ -250,6 +359,75 @@ class TestRecordDeployment:
         assert len(deployments[0].timestamp) > 0
 
 
+class TestRecordDeploymentsBulk:
+    """Test bulk deployment recording."""
+
+    def test_records_all_rows(self, tmp_path):
+        """record_deployments_bulk should insert every row and return the count."""
+        db_path = tmp_path / "test.db"
+
+        count = db.record_deployments_bulk(
+            db_path,
+            [
+                (7043, "img", "v1", "deploy", True, None),
+                (7044, "img", "v1", "deploy", False, "boom"),
+            ],
+        )
+
+        assert count == 2
+        deployments = db.get_deployments(db_path)
+        assert {(d.port, d.success, d.notes) for d in deployments} == {
+            (7043, True, None),
+            (7044, False, "boom"),
+        }
+
+    def test_rows_share_one_client_side_timestamp(self, tmp_path, mocker):
+        """The batch binds a single timestamp in datetime('now') format."""
+        db_path = tmp_path / "test.db"
+        mocker.patch("rots.db._utc_timestamp", return_value="2026-01-02 03:04:05")
+
+        db.record_deployments_bulk(
+            db_path,
+            [(7043, "img", "v1", "deploy", True, None), (7044, "img", "v1", "deploy", True, None)],
+        )
+
+        assert {d.timestamp for d in db.get_deployments(db_path)} == {"2026-01-02 03:04:05"}
+
+    def test_utc_timestamp_matches_sqlite_format(self):
+        """_utc_timestamp should produce the same shape as datetime('now')."""
+        conn = sqlite3.connect(":memory:")
+        sqlite_now = conn.execute("SELECT datetime('now')").fetchone()[0]
+        conn.close()
+
+        fmt = "%Y-%m-%d %H:%M:%S"
+        ours = datetime.strptime(db._utc_timestamp(), fmt)
+        assert abs((ours - datetime.strptime(sqlite_now, fmt)).total_seconds()) < 60
+
+    def test_empty_rows_is_noop(self, tmp_path):
+        """An empty batch records nothing and does not create the database."""
+        db_path = tmp_path / "test.db"
+
+        assert db.record_deployments_bulk(db_path, []) == 0
+        assert not db_path.exists()
+
+    def test_remote_sends_one_transaction(self, mocker, tmp_path):
+        """Remote bulk insert is a single sqlite3 call wrapped in BEGIN/COMMIT."""
+        mock_ex = _make_ssh_executor(mocker)
+        mock_ex.run.return_value = _make_remote_result()
+
+        count = db.record_deployments_bulk(
+            tmp_path / "test.db",
+            [(7043, "img", "v1", "deploy", True, None), (7044, "img", "v1", "deploy", True, None)],
+            executor=mock_ex,
+        )
+
+        assert count == 2
+        mock_ex.run.assert_called_once()
+        script = mock_ex.run.call_args[0][0][-1]
+        assert script.startswith("BEGIN IMMEDIATE;")
+        assert script.count("INSERT INTO deployments") == 2
+
+
 class TestGetDeployments:
     """Test deployment history retrieval."""
 
@@ -423,9 +601,68 @@ class TestGetDeployments:
         assert d.id == 1
 
 
+class TestIterDeployments:
+    """Test the streaming deployment reader."""
+
+    def test_yields_newest_first_lazily(self, tmp_path):
+        """iter_deployments returns an iterator matching get_deployments."""
+        db_path = tmp_path / "test.db"
+        for tag in ("v1", "v2", "v3"):
+            db.record_deployment(db_path, "img", tag, "deploy")
+
+        it = db.iter_deployments(db_path)
+
+        assert not isinstance(it, list)
+        assert [d.tag for d in it] == [d.tag for d in db.get_deployments(db_path)]
+
+    def test_stopping_early_leaves_connection_usable(self, tmp_path):
+        """Abandoning the iterator part-way does not block later queries."""
+        db_path = tmp_path / "test.db"
+        db.record_deployment(db_path, "img", "v1", "deploy", port=7043)
+        db.record_deployment(db_path, "img", "v2", "deploy", port=7043)
+
+        first = next(db.iter_deployments(db_path, port=7043))
+
+        assert first.port == 7043
+        db.record_deployment(db_path, "img", "v3", "deploy")
+        assert len(db.get_deployments(db_path)) == 3
+
+
 class TestImageAliases:
     """Test image alias management."""
 
+    def test_get_alias_memoized_until_write(self, tmp_path):
+        """get_alias serves repeats from memory; alias writes and invalidation refresh it."""
+        db_path = tmp_path / "test.db"
+        db.set_alias(db_path, "CURRENT", "img", "v1")
+        assert db.get_alias(db_path, "current").tag == "v1"
+
+        # Out-of-band change is not seen until the memo is invalidated
+        with db.get_connection(db_path) as conn:
+            conn.execute("UPDATE image_aliases SET tag = 'v9' WHERE alias = 'CURRENT'")
+            conn.commit()
+        assert db.get_alias(db_path, "CURRENT").tag == "v1"
+        db.invalidate_alias_cache()
+        assert db.get_alias(db_path, "CURRENT").tag == "v9"
+
+        db.set_current(db_path, "img", "v2")
+        assert db.get_alias(db_path, "CURRENT").tag == "v2"
+        assert db.get_alias(db_path, "ROLLBACK").tag == "v9"
+
+    def test_memoized_alias_cannot_be_mutated(self, tmp_path):
+        """Mutating a returned alias must not leak into later lookups."""
+        import dataclasses
+
+        db_path = tmp_path / "test.db"
+        db.set_alias(db_path, "CURRENT", "img", "v1")
+        alias = db.get_alias(db_path, "CURRENT")
+        assert alias is not None
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            alias.tag = "v9"  # type: ignore[misc]
+        assert db.get_alias(db_path, "CURRENT") == alias
+        assert alias.tag == "v1"
+
     def test_set_alias_creates_alias(self, tmp_path):
         """set_alias should create a new alias."""
         db_path = tmp_path / "test.db"
@@ -890,6 +1127,17 @@ class TestServiceInstances:
         assert svc.config_file == "/new/config.conf"
         assert svc.port == 6380
 
+    def test_record_service_instance_upsert_returns_existing_id(self, tmp_path):
+        """The UPDATE branch of the upsert returns the existing row's id."""
+        db_path = tmp_path / "test.db"
+
+        first = db.record_service_instance(db_path, "valkey", "6379", "/a.conf", "/a")
+        for tag in ("v1", "v2", "v3"):
+            db.record_deployment(db_path, "img", tag, "deploy")
+        again = db.record_service_instance(db_path, "valkey", "6379", "/b.conf", "/b")
+
+        assert again == first
+
     def test_get_service_instance_not_found(self, tmp_path):
         """get_service_instance should return None for unknown package/instance."""
         db_path = tmp_path / "test.db"
@@ -1011,6 +1259,23 @@ class TestServiceActions:
         assert actions[0].success is False
         assert actions[0].notes == "failed to bind"
 
+    def test_record_service_actions_bulk(self, tmp_path):
+        """record_service_actions_bulk should insert every row in one call."""
+        db_path = tmp_path / "test.db"
+
+        count = db.record_service_actions_bulk(
+            db_path,
+            [
+                ("valkey", "6379", "start", True, None),
+                ("valkey", "6380", "start", False, "failed to bind"),
+            ],
+        )
+
+        assert count == 2
+        actions = db.get_service_actions(db_path)
+        assert {(a.instance, a.success) for a in actions} == {("6379", True), ("6380", False)}
+        assert len({a.timestamp for a in actions}) == 1
+
     def test_get_service_actions_all(self, tmp_path):
         """get_service_actions with no filter should return all actions."""
         db_path = tmp_path / "test.db"
@@ -1131,35 +1396,23 @@ class TestRollbackRemote:
     """Test db.rollback() with a remote executor."""
 
     def test_rollback_remote_queries_via_executor(self, mocker, tmp_path):
-        """rollback() with remote executor should use _remote_query for the timeline query."""
+        """rollback() with remote executor reads timeline and CURRENT in one query."""
         mock_ex = _make_ssh_executor(mocker)
         db_path = tmp_path / "test.db"
 
-        # The timeline query returns two distinct deployments
-        timeline_rows = json.dumps(
-            [
-                {"image": "img", "tag": "v2", "last_id": 2},
-                {"image": "img", "tag": "v1", "last_id": 1},
-            ]
-        )
-        # get_current_image -> get_alias -> _remote_query
-        current_alias = json.dumps(
+        # One combined query: two timeline rows plus the CURRENT alias row
+        combined_rows = json.dumps(
             [
-                {"alias": "CURRENT", "image": "img", "tag": "v2", "set_at": "2026-01-01"},
+                {"source": "timeline", "image": "img", "tag": "v2", "last_id": 2},
+                {"source": "timeline", "image": "img", "tag": "v1", "last_id": 1},
+                {"source": "alias", "image": "img", "tag": "v2", "last_id": None},
             ]
         )
 
-        # Track calls: first call is the timeline query, subsequent are from
-        # get_current_image, set_alias (x2), record_deployment
-        call_count = {"n": 0}
-        query_results = [timeline_rows, current_alias]
-
         def mock_run(cmd, **kwargs):
-            call_count["n"] += 1
             # SELECT queries use -json flag
             if "-json" in cmd:
-                idx = min(call_count["n"] - 1, len(query_results) - 1)
-                return _make_remote_result(stdout=query_results[idx])
+                return _make_remote_result(stdout=combined_rows)
             # Write queries (INSERT/UPDATE)
             return _make_remote_result()
 
@@ -1168,8 +1421,8 @@ class TestRollbackRemote:
         result = db.rollback(db_path, executor=mock_ex)
 
         assert result == ("img", "v1")
-        # Verify executor.run was called (timeline query + alias reads + alias writes + record)
-        assert mock_ex.run.call_count >= 3
+        # One read, one write
+        assert mock_ex.run.call_count == 2
 
     def test_rollback_remote_returns_none_when_insufficient_history(self, mocker, tmp_path):
         """rollback() with remote executor returns None when < 2 distinct deployments."""
@@ -1178,13 +1431,37 @@ class TestRollbackRemote:
 
         # Only one deployment in timeline
         mock_ex.run.return_value = _make_remote_result(
-            stdout=json.dumps([{"image": "img", "tag": "v1", "last_id": 1}])
+            stdout=json.dumps([{"source": "timeline", "image": "img", "tag": "v1", "last_id": 1}])
         )
 
         result = db.rollback(db_path, executor=mock_ex)
 
         assert result is None
 
+    def test_rollback_remote_writes_in_one_call(self, mocker, tmp_path):
+        """rollback() sends its alias moves and timeline entry as one write."""
+        mock_ex = _make_ssh_executor(mocker)
+        db_path = tmp_path / "test.db"
+        rows = [
+            {"source": "timeline", "image": "img", "tag": "v2", "last_id": 2},
+            {"source": "timeline", "image": "img", "tag": "v1", "last_id": 1},
+            {"source": "alias", "image": "img", "tag": "v2", "last_id": None},
+        ]
+
+        def mock_run(cmd, **kwargs):
+            if "-json" in cmd:
+                return _make_remote_result(stdout=json.dumps(rows))
+            return _make_remote_result()
+
+        mock_ex.run.side_effect = mock_run
+
+        assert db.rollback(db_path, executor=mock_ex) == ("img", "v1")
+
+        writes = [c.args[0] for c in mock_ex.run.call_args_list if "-json" not in c.args[0]]
+        assert len(writes) == 1
+        assert "'ROLLBACK', 'img', 'v2'" in writes[0][-1]
+        assert "Rolled back from v2" in writes[0][-1]
+
     def test_rollback_local_still_works(self, tmp_path):
         """rollback() without executor should still work via local sqlite3."""
         db_path = tmp_path / "test.db"
@@ -1566,6 +1843,30 @@ class TestSetCurrentRemote:
 
         assert previous == "v1.0.0"
 
+    def test_set_current_remote_writes_in_one_transaction(self, mocker, tmp_path):
+        """All alias and timeline writes go out as one BEGIN...COMMIT sqlite3 call."""
+        mock_ex = _make_ssh_executor(mocker)
+        db_path = tmp_path / "test.db"
+        current = [{"alias": "CURRENT", "image": "img", "tag": "v1", "set_at": "2026-01-01"}]
+
+        def mock_run(cmd, **kwargs):
+            if "-json" in cmd:
+                return _make_remote_result(stdout=json.dumps(current))
+            return _make_remote_result()
+
+        mock_ex.run.side_effect = mock_run
+
+        db.set_current(db_path, "img", "v2", executor=mock_ex)
+
+        writes = [c.args[0] for c in mock_ex.run.call_args_list if "-json" not in c.args[0]]
+        assert len(writes) == 1
+        script = writes[0][-1]
+        assert script.startswith("BEGIN IMMEDIATE;")
+        assert script.rstrip().endswith("COMMIT;")
+        assert "'ROLLBACK', 'img', 'v1'" in script
+        assert "'CURRENT', 'img', 'v2'" in script
+        assert "'set-current'" in script
+
 
 class TestGetCurrentImageRemote:
     """Test db.get_current_image() with a remote executor."""
@@ -1658,6 +1959,7 @@ class TestInitDbRemote:
         assert "sqlite3" in call_args
         # Should contain the schema SQL
         assert "CREATE TABLE" in call_args[-1]
+        assert call_args[-1].startswith("PRAGMA journal_mode=WAL;")
 
 
 class TestGetConnectionGuard:
@@ -2089,7 +2391,9 @@ class TestCrossExecutorDbOperations:
 
         if kind == "remote":
             executor.run.return_value = _make_remote_result(
-                stdout=json.dumps([{"image": "img", "tag": "v1", "last_id": 1}])
+                stdout=json.dumps(
+                    [{"source": "timeline", "image": "img", "tag": "v1", "last_id": 1}]
+                )
             )
 
         result = db.rollback(db_path, executor=executor)
@@ -15,6 +15,15 @@ class TestEnvVarToSecretName:
         assert env_var_to_secret_name("SECRET") == "ots_secret"
         assert env_var_to_secret_name("DB_PASSWORD") == "ots_db_password"
 
+    def test_repeat_calls_are_cached(self):
+        """Repeated conversions of the same name should hit the cache."""
+        from rots.environment_file import env_var_to_secret_name
+
+        env_var_to_secret_name.cache_clear()
+        env_var_to_secret_name("SMTP_PASSWORD")
+        assert env_var_to_secret_name("SMTP_PASSWORD") == "ots_smtp_password"
+        assert env_var_to_secret_name.cache_info().hits == 1
+
 
 class TestSecretNameToEnvVar:
     """Test conversion from podman secret names back to env var names."""
@@ -57,6 +66,13 @@ class TestParseSecretVariableNames:
         result = parse_secret_variable_names('"VAR1:VAR2:VAR3"')
         assert result == ["VAR1", "VAR2", "VAR3"]
 
+    def test_only_matching_outer_quotes_are_stripped(self):
+        """Single quotes strip like double quotes; mismatched quotes stay."""
+        from rots.environment_file import parse_secret_variable_names
+
+        assert parse_secret_variable_names("'VAR1 VAR2'") == ["VAR1", "VAR2"]
+        assert parse_secret_variable_names("\"VAR1,VAR2'") == ['"VAR1', "VAR2'"]
+
     def test_single_value(self):
         """Should handle single value."""
         from rots.environment_file import parse_secret_variable_names
@@ -119,6 +135,32 @@ class TestEnvFile:
         assert parsed.get("KEY1") == "quoted value"
         assert parsed.get("KEY2") == "single quoted"
 
+    def test_parse_key_and_quote_edge_cases(self, tmp_path):
+        """Keys must be ASCII identifiers; values keep later '=' and unmatched quotes."""
+        from rots.environment_file import EnvFile
+
+        env_file = tmp_path / "test.env"
+        env_file.write_text(
+            'K=ab=cd\nQ=\'a"\nL="\n_=1\n1KEY=x\nK\u00c9Y=x\nexport FOO=bar\n=value\nNOEQUALS\n'
+        )
+
+        parsed = EnvFile.parse(env_file)
+
+        assert dict(parsed.iter_variables()) == {"K": "ab=cd", "Q": "'a\"", "L": '"', "_": "1"}
+        comments = [e.comment for e in parsed.entries if e.is_comment_line]
+        assert comments == ["1KEY=x", "K\u00c9Y=x", "export FOO=bar", "=value", "NOEQUALS"]
+
+    def test_parse_repeated_key_keeps_last_value(self, tmp_path):
+        """A key assigned twice should resolve to its last assignment."""
+        from rots.environment_file import EnvFile
+
+        env_file = tmp_path / "test.env"
+        env_file.write_text("KEY=first\n# note\nKEY=second\n")
+
+        parsed = EnvFile.parse(env_file)
+
+        assert parsed.get("KEY") == "second"
+
     def test_parse_empty_values(self, tmp_path):
         """Should handle empty values."""
         from rots.environment_file import EnvFile
@@ -151,6 +193,25 @@ class TestEnvFile:
 
         assert parsed.secret_variable_names == ["VAR1", "VAR2"]
 
+    def test_secret_variable_names_tracks_changes(self, tmp_path, mocker):
+        """The cached parse should be reused until SECRET_VARIABLE_NAMES changes."""
+        from rots import environment_file
+        from rots.environment_file import EnvFile
+
+        env_file = tmp_path / "test.env"
+        env_file.write_text("SECRET_VARIABLE_NAMES=VAR1,VAR2\n")
+        parsed = EnvFile.parse(env_file)
+        spy = mocker.spy(environment_file, "parse_secret_variable_names")
+
+        parsed.secret_variable_names.append("MUTATED")
+        assert parsed.secret_variable_names == ["VAR1", "VAR2"]
+        assert spy.call_count == 1
+
+        parsed.set("SECRET_VARIABLE_NAMES", "VAR3")
+        assert parsed.secret_variable_names == ["VAR3"]
+        parsed.remove("SECRET_VARIABLE_NAMES")
+        assert parsed.secret_variable_names == []
+
     def test_set_and_remove(self, tmp_path):
         """Should allow setting and removing variables."""
         from rots.environment_file import EnvFile
@@ -165,6 +226,91 @@ class TestEnvFile:
         assert not parsed.has("KEY1")
         assert parsed.get("KEY2") == "value2"
 
+    def test_set_rename_remove_keep_entries_in_step(self, tmp_path):
+        """Updates through the key index should be reflected in entries order."""
+        from rots.environment_file import EnvFile
+
+        env_file = tmp_path / "test.env"
+        env_file.write_text("A=1\n# c\nB=2\nC=3\n")
+
+        parsed = EnvFile.parse(env_file)
+        parsed.set("A", "10")
+        parsed.set("D", "4")
+        assert parsed.rename("B", "_B", "ots_b")
+        parsed.set("_B", "ots_b2")
+        parsed.remove("C")
+
+        assert [(e.key, e.value) for e in parsed.entries] == [
+            ("A", "10"),
+            ("", ""),
+            ("_B", "ots_b2"),
+            ("D", "4"),
+        ]
+        assert not parsed.rename("B", "X")
+
+    def test_rename_with_duplicate_key_keeps_remaining_entry_indexed(self, tmp_path):
+        """After renaming the first of two same-key lines, set() updates the second."""
+        from rots.environment_file import EnvFile
+
+        env_file = tmp_path / "test.env"
+        env_file.write_text("A=1\nB=2\nA=3\n")
+
+        parsed = EnvFile.parse(env_file)
+        parsed.set("B", "20")  # build the index before renaming
+        assert parsed.rename("A", "_A", "ots_a")
+        parsed.set("A", "30")
+
+        assert [(e.key, e.value) for e in parsed.entries] == [
+            ("_A", "ots_a"),
+            ("B", "20"),
+            ("A", "30"),
+        ]
+
+    def test_rename_updates_index_in_place(self, tmp_path):
+        """Renaming many keys should not rebuild the key index each time."""
+        from rots.environment_file import EnvFile
+
+        env_file = tmp_path / "test.env"
+        env_file.write_text("".join(f"K{i}={i}\n" for i in range(50)))
+
+        parsed = EnvFile.parse(env_file)
+        index = parsed._entries_by_key()
+
+        for i in range(50):
+            assert parsed.rename(f"K{i}", f"_K{i}")
+            assert parsed._entry_index is index
+        parsed.set("_K7", "seven")
+
+        assert parsed._entry_index is index
+        assert parsed.entries[7].value == "seven"
+        assert [e.key for e in parsed.entries] == [f"_K{i}" for i in range(50)]
+
+    def test_rename_onto_existing_key_keeps_first_entry_indexed(self, tmp_path):
+        """Renaming a later line onto an earlier key leaves set() on the earlier one."""
+        from rots.environment_file import EnvFile
+
+        env_file = tmp_path / "test.env"
+        env_file.write_text("A=1\nB=2\n")
+
+        parsed = EnvFile.parse(env_file)
+        assert parsed.rename("B", "A")
+        parsed.set("A", "10")
+
+        assert [(e.key, e.value) for e in parsed.entries] == [("A", "10"), ("A", "2")]
+
+    def test_set_on_directly_constructed_file_updates_existing_entry(self, tmp_path):
+        """EnvFile built from entries (not parse) should still update in place."""
+        from rots.environment_file import EnvEntry, EnvFile
+
+        env = EnvFile(
+            path=tmp_path / "test.env",
+            entries=[EnvEntry(key="HOST", value="a", raw_line="HOST=a")],
+            _variables={"HOST": "a"},
+        )
+        env.set("HOST", "b")
+
+        assert [(e.key, e.value) for e in env.entries] == [("HOST", "b")]
+
     def test_write_roundtrip(self, tmp_path):
         """Should preserve content through parse/write cycle."""
         from rots.environment_file import EnvFile
@@ -261,6 +407,8 @@ class TestIsProcessedSecretEntry:
         from rots.environment_file import is_processed_secret_entry
 
         assert not is_processed_secret_entry("_STRIPE_API_KEY", "wrong_value")
+        assert not is_processed_secret_entry("_STRIPE_API_KEY", "ots_stripe_api")
+        assert not is_processed_secret_entry("_STRIPE_API_KEY", "ots_stripe_api_kex")
 
 
 class TestExtractSecrets:
@@ -609,23 +757,64 @@ class TestEnsurePodmanSecretRemote:
         mocker.patch("rots.systemd.require_podman")
         mock_ex.run.side_effect = [
             _make_remote_result(returncode=0),  # secret exists
-            _make_remote_result(returncode=0),  # secret rm
-            _make_remote_result(returncode=0),  # secret create
+            _make_remote_result(returncode=0),  # secret create --replace
         ]
 
         result = ensure_podman_secret("ots_key", "new_val", executor=mock_ex)
 
         assert result == "replaced"
-        assert mock_ex.run.call_count == 3
+        assert mock_ex.run.call_count == 2
         # Verify timeout kwargs on each call
         exists_call = mock_ex.run.call_args_list[0]
         assert exists_call[1]["timeout"] == 15, "secret exists should have timeout=15"
-        rm_call = mock_ex.run.call_args_list[1]
-        assert rm_call[0][0] == ["podman", "secret", "rm", "ots_key"]
-        assert rm_call[1]["timeout"] == 15, "secret rm should have timeout=15"
-        create_call = mock_ex.run.call_args_list[2]
+        create_call = mock_ex.run.call_args_list[1]
+        assert create_call[0][0] == ["podman", "secret", "create", "--replace", "ots_key", "-"]
+        assert create_call[1]["input"] == "new_val"
         assert create_call[1]["timeout"] == 30, "secret create should have timeout=30"
 
+    def test_existing_set_skips_exists_check(self, mocker):
+        """With a pre-fetched name set, no `podman secret exists` is run."""
+        from rots.environment_file import ensure_podman_secret
+
+        mock_ex = _make_ssh_executor(mocker)
+        mocker.patch("rots.systemd.require_podman")
+        mock_ex.run.return_value = _make_remote_result(returncode=0)
+        existing = {"ots_key"}
+
+        assert ensure_podman_secret("ots_key", "v", executor=mock_ex, existing=existing) == (
+            "replaced"
+        )
+        assert ensure_podman_secret("ots_new", "v", executor=mock_ex, existing=existing) == (
+            "created"
+        )
+
+        commands = [c[0][0][:3] for c in mock_ex.run.call_args_list]
+        assert ["podman", "secret", "exists"] not in commands
+        assert existing == {"ots_key", "ots_new"}
+
+
+class TestExistingSecretNames:
+    """Test existing_secret_names()."""
+
+    def test_returns_listed_names(self, mocker):
+        from rots.environment_file import existing_secret_names
+
+        mock_ex = _make_ssh_executor(mocker)
+        mock_ex.run.return_value = _make_remote_result(stdout="ots_a\nots_b\n\n")
+
+        assert existing_secret_names(executor=mock_ex) == {"ots_a", "ots_b"}
+        mock_ex.run.assert_called_once_with(
+            ["podman", "secret", "ls", "--format", "{{.Name}}"], timeout=15
+        )
+
+    def test_returns_none_when_listing_fails(self, mocker):
+        from rots.environment_file import existing_secret_names
+
+        mock_ex = _make_ssh_executor(mocker)
+        mock_ex.run.return_value = _make_remote_result(returncode=125)
+
+        assert existing_secret_names(executor=mock_ex) is None
+
 
 class TestGetSecretsFromEnvFileRemote:
     """Test get_secrets_from_env_file() with remote executor."""
@@ -657,6 +846,10 @@ class TestProcessEnvFileRemote:
             "rots.environment_file.ensure_podman_secret",
             return_value="created",
         )
+        mock_list = mocker.patch(
+            "rots.environment_file.existing_secret_names",
+            return_value={"ots_other"},
+        )
         mock_write = mocker.patch.object(EnvFile, "write")
 
         env_file = EnvFile.parse(  # local parse for test setup
@@ -681,5 +874,8 @@ class TestProcessEnvFileRemote:
 
         process_env_file(env_file, executor=mock_ex)
 
-        mock_ensure.assert_called_once_with("ots_api_key", "secret_value", executor=mock_ex)
+        mock_list.assert_called_once_with(executor=mock_ex)
+        mock_ensure.assert_called_once_with(
+            "ots_api_key", "secret_value", executor=mock_ex, existing={"ots_other"}
+        )
         mock_write.assert_called_once_with(executor=mock_ex)
@@ -34,6 +34,18 @@ class TestPodmanWrapper:
         system_prune = p.system_prune
         assert system_prune._subcommand == ["system-prune"]
 
+    def test_subcommand_nodes_are_reused(self):
+        """Repeated attribute access should return the same child node."""
+        p = Podman()
+        assert p.secret is p.secret
+        assert p.secret.exists is p.secret.exists
+
+    def test_private_names_are_not_subcommands(self):
+        """Underscore-prefixed names should raise AttributeError."""
+        p = Podman()
+        with pytest.raises(AttributeError):
+            _ = p._children
+
     def test_module_level_instance(self):
         """Module should export a ready-to-use podman instance."""
         assert isinstance(podman, Podman)
@@ -1,6 +1,7 @@
 # tests/test_quadlet.py
 """Tests for quadlet module - Podman quadlet file generation."""
 
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -338,6 +339,24 @@ class TestContainerTemplate:
 
         mock_reload.assert_called_once()
 
+    def test_write_web_template_skips_unchanged(self, mocker, tmp_path):
+        """Rewriting an identical template should skip the write and daemon-reload."""
+        mock_reload = mocker.patch("rots.quadlet.systemd.daemon_reload")
+        from rots import quadlet
+        from rots.config import Config
+
+        cfg = Config(
+            web_template_path=tmp_path / "onetime-web@.container",
+            var_dir=tmp_path / "var",
+        )
+
+        quadlet.write_web_template(cfg, force=True)
+        mtime = cfg.web_template_path.stat().st_mtime_ns
+        quadlet.write_web_template(cfg, force=True)
+
+        mock_reload.assert_called_once()
+        assert cfg.web_template_path.stat().st_mtime_ns == mtime
+
     def test_write_web_template_no_config_shows_defaults_comment(self, mocker, tmp_path):
         """Container quadlet should show defaults comment when no config files exist."""
         mocker.patch("rots.quadlet.systemd.daemon_reload")
@@ -992,6 +1011,36 @@ class TestGetSecretsSection:
         # secret_exists should have been called for each secret
         assert mock_secret_exists.call_count == 2
 
+    def test_env_file_parsed_once_until_it_changes(self, mocker, tmp_path):
+        """Repeated calls reuse the parse; an edit to the env file invalidates it."""
+        import os
+
+        from rots import quadlet
+
+        mocker.patch("rots.quadlet.secret_exists", return_value=True)
+        spy = mocker.spy(quadlet, "get_secrets_from_env_file")
+
+        env_file = tmp_path / "onetimesecret.env"
+        env_file.write_text("SECRET_VARIABLE_NAMES=API_KEY\n_API_KEY=ots_api_key\n")
+
+        first = quadlet.get_secrets_section(env_file_path=env_file)
+        assert quadlet.get_secrets_section(env_file_path=env_file) == first
+        assert spy.call_count == 1
+
+        env_file.write_text(
+            "SECRET_VARIABLE_NAMES=API_KEY,DB_PASSWORD\n"
+            "_API_KEY=ots_api_key\n"
+            "_DB_PASSWORD=ots_db_password\n"
+        )
+        st = env_file.stat()
+        os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        result = quadlet.get_secrets_section(env_file_path=env_file)
+        assert spy.call_count == 2
+        assert "Secret=ots_db_password,type=env,target=DB_PASSWORD" in result
+        # One entry per file: the superseded stat is replaced, not accumulated
+        assert list(quadlet._env_secrets_cache) == [str(env_file)]
+
     def test_all_secrets_exist(self, mocker, tmp_path):
         """Should include all Secret= lines when all podman secrets exist."""
         mocker.patch(
@@ -1226,6 +1275,120 @@ class TestWriteTemplatesForce:
         assert exc_info.value.code == 3
 
 
+class TestWriteAllTemplates:
+    """Test write_all_templates batching."""
+
+    def _cfg(self, tmp_path, **kwargs):
+        from rots.config import Config
+
+        return Config(
+            web_template_path=tmp_path / "onetime-web@.container",
+            worker_template_path=tmp_path / "onetime-worker@.container",
+            scheduler_template_path=tmp_path / "onetime-scheduler@.container",
+            var_dir=tmp_path / "var",
+            **kwargs,
+        )
+
+    def test_writes_all_with_one_secrets_pass_and_one_reload(self, mocker, tmp_path):
+        from rots import quadlet
+
+        mocker.patch("rots.systemd._dbus_is_available", return_value=True)
+        mock_reload = mocker.patch("rots._dbus.reload_manager")
+        spy = mocker.spy(quadlet, "get_secrets_section")
+        cfg = self._cfg(tmp_path)
+
+        quadlet.write_all_templates(cfg, tmp_path / "nonexistent.env", force=True)
+
+        assert cfg.web_template_path.exists()
+        assert cfg.worker_template_path.exists()
+        assert cfg.scheduler_template_path.exists()
+        assert spy.call_count == 1
+        mock_reload.assert_called_once()
+
+    def test_unchanged_rewrite_skips_reload(self, mocker, tmp_path):
+        from rots import quadlet
+
+        mocker.patch("rots.systemd._dbus_is_available", return_value=True)
+        mock_reload = mocker.patch("rots._dbus.reload_manager")
+        mock_props = mocker.patch(
+            "rots._dbus.get_unit_properties", return_value={"NeedDaemonReload": "False"}
+        )
+        cfg = self._cfg(tmp_path)
+        quadlet.write_all_templates(cfg, tmp_path / "nonexistent.env", force=True)
+        mock_reload.reset_mock()
+        mock_props.assert_not_called()
+
+        quadlet.write_all_templates(cfg, tmp_path / "nonexistent.env", force=True)
+
+        mock_reload.assert_not_called()
+        assert sorted(c.args[0] for c in mock_props.call_args_list) == [
+            "onetime-scheduler@.service",
+            "onetime-web@.service",
+            "onetime-worker@.service",
+        ]
+
+    def test_unchanged_rewrite_reloads_when_systemd_is_stale(self, mocker, tmp_path):
+        """A file written before a failed daemon-reload still gets reloaded."""
+        from rots import quadlet
+
+        mocker.patch("rots.systemd._use_dbus", return_value=False)
+        mock_reload = mocker.patch("rots.quadlet.systemd.daemon_reload")
+        mocker.patch("rots.systemd.require_systemctl")
+        cfg = self._cfg(tmp_path)
+        quadlet.write_all_templates(cfg, tmp_path / "nonexistent.env", force=True)
+        mock_reload.reset_mock()
+
+        show = mocker.MagicMock(
+            stdout="Id=onetime-web@.service\nNeedDaemonReload=yes\n\n"
+            "Id=onetime-worker@.service\nNeedDaemonReload=no\n"
+        )
+        mock_ex = mocker.patch("rots.systemd._get_executor").return_value
+        mock_ex.run.return_value = show
+
+        quadlet.write_all_templates(
+            cfg, tmp_path / "nonexistent.env", unit_types=("web", "worker"), force=True
+        )
+
+        cmd = mock_ex.run.call_args[0][0]
+        assert cmd[:3] == ["systemctl", "show", "--property=Id,NeedDaemonReload"]
+        mock_reload.assert_called_once()
+
+    def test_image_unit_name_follows_quadlet(self):
+        from rots import quadlet
+
+        assert quadlet._unit_name(Path("/etc/containers/systemd/onetime.image")) == (
+            "onetime-image.service"
+        )
+        assert quadlet._unit_name(Path("/x/onetime-web@.container")) == "onetime-web@.service"
+
+    def test_writes_only_requested_types(self, mocker, tmp_path):
+        from rots import quadlet
+
+        mocker.patch("rots.quadlet.systemd.daemon_reload")
+        cfg = self._cfg(tmp_path)
+
+        quadlet.write_all_templates(
+            cfg, tmp_path / "nonexistent.env", unit_types=("worker",), force=True
+        )
+
+        assert cfg.worker_template_path.exists()
+        assert not cfg.web_template_path.exists()
+        assert not cfg.scheduler_template_path.exists()
+
+    def test_web_template_matches_single_writer(self, mocker, tmp_path):
+        from rots import quadlet
+
+        mocker.patch("rots.quadlet.systemd.daemon_reload")
+        cfg = self._cfg(tmp_path)
+        env = tmp_path / "nonexistent.env"
+
+        quadlet.write_all_templates(cfg, env, force=True)
+
+        assert cfg.web_template_path.read_text() == quadlet.render_web_template(
+            cfg, env, force=True
+        )
+
+
 class TestGetResourceLimitsSection:
     """Tests for get_resource_limits_section()."""
 
@@ -1400,9 +1563,9 @@ def _make_remote_result(stdout="", returncode=0):
 
 
 class TestWriteTemplateRemote:
-    """Test _write_template() with remote executor."""
+    """Test write_all_templates() with remote executor."""
 
-    def test_writes_via_executor_mkdir_tee_and_daemon_reload(self, mocker, tmp_path):
+    def test_writes_via_single_remote_command_and_daemon_reload(self, mocker, tmp_path):
         from rots import quadlet
 
         mock_ex = _make_ssh_executor(mocker)
@@ -1418,6 +1581,8 @@ class TestWriteTemplateRemote:
             "rots.quadlet.get_config_volumes_section",
             return_value="# no config",
         )
+        # The companion .image unit goes through the same writer; covered elsewhere
+        mocker.patch("rots.quadlet.write_image_template")
         mock_reload = mocker.patch("rots.quadlet.systemd.daemon_reload")
 
         cfg = MagicMock()
@@ -1426,19 +1591,20 @@ class TestWriteTemplateRemote:
         cfg.memory_max = None
         cfg.cpu_quota = None
         cfg.registry = "ghcr.io"
-        cfg.web_template_path = tmp_path / "onetime-web@.container"
-
-        path = tmp_path / "onetime-web@.container"
-        quadlet._write_template("Image={image}\n", path, cfg, None, force=True, executor=mock_ex)
-
-        # Should call mkdir -p and tee
-        calls = [c[0][0] for c in mock_ex.run.call_args_list]
-        assert ["mkdir", "-p", str(tmp_path)] in calls
-        tee_call = [c for c in mock_ex.run.call_args_list if c[0][0][0] == "tee"]
-        assert len(tee_call) == 1
-        assert tee_call[0][0][0] == ["tee", str(path)]
+        cfg.worker_template_path = tmp_path / "onetime-worker@.container"
+
+        path = cfg.worker_template_path
+        quadlet.write_all_templates(cfg, unit_types=("worker",), force=True, executor=mock_ex)
+
+        # mkdir -p and the write share a single remote command
+        write_calls = [c for c in mock_ex.run.call_args_list if c[0][0][0] == "sh"]
+        assert len(write_calls) == 1
+        argv = write_calls[0][0][0]
+        assert argv[:2] == ["sh", "-c"]
+        assert argv[3:] == ["sh", str(tmp_path), str(path)]
+        assert not any(c[0][0][0] in ("mkdir", "tee") for c in mock_ex.run.call_args_list)
         # With registry set, image resolves to onetime.image (companion .image unit)
-        assert "Image=onetime.image" in tee_call[0][1]["input"]
+        assert "Image=onetime.image" in write_calls[0][1]["input"]
 
         # Should NOT write to local filesystem
         assert not path.exists()
@@ -1446,6 +1612,20 @@ class TestWriteTemplateRemote:
         # Should call daemon_reload with executor
         mock_reload.assert_called_once_with(executor=mock_ex)
 
+    def test_remote_write_script_creates_parent_and_writes(self, tmp_path):
+        import subprocess
+
+        from rots.quadlet import _REMOTE_WRITE_SCRIPT
+
+        path = tmp_path / "nested" / "onetime-web@.container"
+        subprocess.run(
+            ["sh", "-c", _REMOTE_WRITE_SCRIPT, "sh", str(path.parent), str(path)],
+            input="Image=x\n",
+            text=True,
+            check=True,
+        )
+        assert path.read_text() == "Image=x\n"
+
 
 class TestGetSecretsSectionRemote:
     """Test get_secrets_section() with remote executor."""
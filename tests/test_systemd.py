@@ -244,6 +244,20 @@ class TestDiscoverWorkerInstancesDBus:
 
         assert systemd.discover_worker_instances() == ["1", "2", "3"]
 
+    def test_ignores_units_of_other_types(self, mocker, dbus_on):
+        from rots import systemd
+
+        mocker.patch(
+            "rots._dbus.list_units_by_pattern",
+            return_value=[
+                UnitInfo("onetime-worker@1.service", "loaded", "active", "running"),
+                UnitInfo("onetime-web@7043.service", "loaded", "active", "running"),
+                UnitInfo("onetime@7044.service", "loaded", "active", "running"),
+            ],
+        )
+
+        assert systemd.discover_worker_instances() == ["1"]
+
     def test_string_ids(self, mocker, dbus_on):
         from rots import systemd
 
@@ -362,6 +376,69 @@ class TestDiscoverSchedulerInstancesDBus:
         assert systemd.discover_scheduler_instances(running_only=True) == ["main"]
 
 
+class TestDiscoverAllInstancesDBus:
+    """Test discover_all_instances via D-Bus."""
+
+    def test_one_call_dispatches_by_type(self, mocker, dbus_on):
+        from rots import systemd
+
+        mock_dbus = mocker.patch(
+            "rots._dbus.list_units_by_pattern",
+            return_value=[
+                UnitInfo("onetime-web@7044.service", "loaded", "active", "running"),
+                UnitInfo("onetime-worker@billing.service", "loaded", "active", "running"),
+                UnitInfo("onetime-web@7043.service", "loaded", "active", "running"),
+                UnitInfo("onetime-scheduler@main.service", "loaded", "failed", "failed"),
+            ],
+        )
+
+        assert systemd.discover_all_instances() == {
+            "web": ["7043", "7044"],
+            "worker": ["billing"],
+            "scheduler": ["main"],
+        }
+        mock_dbus.assert_called_once_with(
+            "onetime-web@*", "onetime-worker@*", "onetime-scheduler@*"
+        )
+        assert systemd.discover_all_instances(running_only=True)["scheduler"] == []
+
+
+class TestShowPropertiesDBus:
+    """Test show_properties via D-Bus."""
+
+    def test_queries_each_unit_without_subprocess(self, mocker, dbus_on):
+        from rots import systemd
+
+        mock_props = mocker.patch(
+            "rots._dbus.get_unit_properties",
+            side_effect=lambda unit, props: {p: unit for p in props},
+        )
+        mock_run = mocker.patch("subprocess.run")
+
+        props = systemd.show_properties(["a", "b"], ["ActiveState"])
+
+        assert props == {"a": {"ActiveState": "a"}, "b": {"ActiveState": "b"}}
+        assert mock_props.call_count == 2
+        mock_run.assert_not_called()
+
+    def test_unit_error_yields_empty_values(self, mocker, dbus_on):
+        from rots import _dbus, systemd
+
+        def fake(unit, props):
+            if unit == "missing":
+                raise _dbus.DBusError("no such unit")
+            return {p: "active" for p in props}
+
+        mocker.patch("rots._dbus.get_unit_properties", side_effect=fake)
+
+        props = systemd.show_properties(["missing", "ok"], ["ActiveState", "MainPID"])
+
+        assert props == {
+            "missing": {"ActiveState": "", "MainPID": ""},
+            "ok": {"ActiveState": "active", "MainPID": "active"},
+        }
+
+
 class TestIsActiveDBus:
     """Test is_active via D-Bus."""
 
@@ -456,6 +533,17 @@ class TestStopDBus:
             systemd.stop("onetime-web@7043")
 
 
+class TestReloadDBus:
+    """Test reload via D-Bus."""
+
+    def test_calls_dbus_reload(self, mocker, dbus_on):
+        from rots import systemd
+
+        mock_reload = mocker.patch("rots._dbus.reload_unit")
+        systemd.reload("caddy")
+        mock_reload.assert_called_once_with("caddy")
+
+
 class TestRestartDBus:
     """Test restart via D-Bus."""
 
@@ -549,6 +637,41 @@ class TestDaemonReloadDBus:
             systemd.daemon_reload()
 
 
+class TestDeferredReload:
+    """Test deferred_reload coalescing."""
+
+    def test_coalesces_reloads_into_one(self, mocker, dbus_on):
+        from rots import systemd
+
+        mock_reload = mocker.patch("rots._dbus.reload_manager")
+        with systemd.deferred_reload():
+            systemd.daemon_reload()
+            systemd.daemon_reload()
+            with systemd.deferred_reload():
+                systemd.daemon_reload()
+            mock_reload.assert_not_called()
+        mock_reload.assert_called_once()
+
+    def test_no_reload_when_none_requested(self, mocker, dbus_on):
+        from rots import systemd
+
+        mock_reload = mocker.patch("rots._dbus.reload_manager")
+        with systemd.deferred_reload():
+            pass
+        mock_reload.assert_not_called()
+
+    def test_reloads_even_when_block_raises(self, mocker, dbus_on):
+        from rots import systemd
+
+        mock_reload = mocker.patch("rots._dbus.reload_manager")
+        with pytest.raises(SystemExit), systemd.deferred_reload():
+            systemd.daemon_reload()
+            raise SystemExit(3)
+        mock_reload.assert_called_once()
+        systemd.daemon_reload()
+        assert mock_reload.call_count == 2
+
+
 class TestResetFailedDBus:
     """Test reset_failed via D-Bus."""
 
@@ -728,6 +851,39 @@ class TestDiscoverSchedulerInstancesCLI:
         )
 
 
+class TestDiscoverAllInstancesCLI:
+    """Test discover_all_instances CLI fallback."""
+
+    def test_single_systemctl_call(self, mocker, dbus_off):
+        from rots import systemd
+
+        mock_result = mocker.Mock()
+        mock_result.stdout = (
+            "onetime-web@7043.service loaded active running OTS Web 7043\n"
+            "onetime-worker@1.service loaded active running OTS Worker 1\n"
+            "onetime-scheduler@main.service loaded active running OTS Scheduler main\n"
+            "onetime-web@abc.service loaded active running not a port\n"
+        )
+        mock_run = mocker.patch("subprocess.run", return_value=mock_result)
+
+        assert systemd.discover_all_instances() == {
+            "web": ["7043"],
+            "worker": ["1"],
+            "scheduler": ["main"],
+        }
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            "systemctl",
+            "list-units",
+            "onetime-web@*",
+            "onetime-worker@*",
+            "onetime-scheduler@*",
+            "--plain",
+            "--no-legend",
+            "--all",
+        ]
+
+
 class TestIsActiveCLI:
     """Test is_active CLI fallback."""
 
@@ -772,6 +928,84 @@ class TestIsActiveCLI:
         )
 
 
+class TestShowPropertiesCLI:
+    """Test show_properties CLI fallback."""
+
+    def test_single_call_for_many_units(self, mocker, dbus_off):
+        from rots import systemd
+
+        mock_run = mocker.patch(
+            "subprocess.run",
+            return_value=subprocess.CompletedProcess(
+                [],
+                0,
+                stdout=(
+                    "Id=onetime-web@7043.service\nActiveState=active\nSubState=running\n\n"
+                    "Id=onetime-web@7044.service\nActiveState=failed\nSubState=failed\n"
+                ),
+                stderr="",
+            ),
+        )
+
+        props = systemd.show_properties(
+            ["onetime-web@7043", "onetime-web@7044"], ["ActiveState", "SubState"]
+        )
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            "systemctl",
+            "show",
+            "--property=Id,ActiveState,SubState",
+            "onetime-web@7043",
+            "onetime-web@7044",
+        ]
+        assert props == {
+            "onetime-web@7043": {"ActiveState": "active", "SubState": "running"},
+            "onetime-web@7044": {"ActiveState": "failed", "SubState": "failed"},
+        }
+
+    def test_blocks_matched_by_id_not_position(self, mocker, dbus_off):
+        """A missing or reordered block must not shift state onto another unit."""
+        from rots import systemd
+
+        mocker.patch(
+            "subprocess.run",
+            return_value=subprocess.CompletedProcess(
+                [],
+                0,
+                stdout="Id=onetime-web@7044.service\nActiveState=failed\n",
+                stderr="",
+            ),
+        )
+
+        props = systemd.show_properties(["onetime-web@7043", "onetime-web@7044"], ["ActiveState"])
+
+        assert props == {
+            "onetime-web@7043": {"ActiveState": ""},
+            "onetime-web@7044": {"ActiveState": "failed"},
+        }
+
+    def test_missing_properties_default_to_empty(self, mocker, dbus_off):
+        from rots import systemd
+
+        mocker.patch(
+            "subprocess.run",
+            return_value=subprocess.CompletedProcess([], 1, stdout="", stderr="boom"),
+        )
+
+        props = systemd.show_properties(["onetime-web@7043"], ["ActiveState"])
+
+        assert props == {"onetime-web@7043": {"ActiveState": ""}}
+
+    def test_no_units_skips_subprocess(self, mocker, dbus_off):
+        from rots import systemd
+
+        mock_run = mocker.patch("subprocess.run")
+
+        assert systemd.show_properties([], ["ActiveState"]) == {}
+        mock_run.assert_not_called()
+
+
 class TestStartCLI:
     """Test start CLI fallback."""
 
@@ -836,6 +1070,22 @@ class TestStopCLI:
             systemd.stop("onetime-web@7043")
 
 
+class TestReloadCLI:
+    """Test reload CLI fallback."""
+
+    def test_calls_systemctl_reload(self, mocker, dbus_off):
+        from rots import systemd
+
+        mock_run = mocker.patch(
+            "subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0, stdout="", stderr=""),
+        )
+
+        systemd.reload("caddy")
+
+        assert mock_run.call_args[0][0] == ["sudo", "--", "systemctl", "reload", "caddy"]
+
+
 class TestRestartCLI:
     """Test restart CLI fallback."""
 
@@ -1402,3 +1652,15 @@ class TestBackendOverride:
         mocker.patch("rots.systemd._is_local", return_value=False)
         remote_exec = mocker.Mock()
         assert systemd._use_dbus(remote_exec) is False
+
+    def test_public_uses_dbus_honours_cli_override(self, mocker):
+        """uses_dbus() exposes the same decision, including --backend=cli."""
+        from rots import context, systemd
+
+        mocker.patch("rots.systemd._dbus_is_available", return_value=True)
+        assert systemd.uses_dbus() is True
+        token = context.backend_var.set("cli")
+        try:
+            assert systemd.uses_dbus() is False
+        finally:
+            context.backend_var.reset(token)